@@ -17,6 +17,8 @@ from src.notifications.domain.notification import Notification
 from src.summarization.domain.summary import Summary
 from src.transcription.domain.transcription import Transcription
 from src.video_management.domain.video import Video
+from src.video_management.domain.video_upload import VideoUpload
+from src.video_management.domain.video_blob import VideoBlob
 
 # ---------------------------------------------------
 
@@ -1,6 +1,8 @@
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 # OpenTelemetry Imports
@@ -15,10 +17,13 @@ from src.summarization.bootstrap import bootstrap_summarization_module
 from src.notifications.bootstrap import bootstrap_notification_module
 from src.analytics.bootstrap import bootstrap_analytics_module
 from src.metrics.bootstrap import bootstrap_metrics_module
+from src.search.bootstrap import bootstrap_search_module
 
 # Shared Factories and DB
 from src.shared.events.event_bus import get_event_bus
-from src.storage.infrastructure.dependencies import get_storage_service_factory
+from src.storage.infrastructure.dependencies import (
+    close_storage_services, get_storage_service_factory, warm_up_storage_services,
+)
 from src.transcription.infrastructure.dependencies import get_speech_recognition_service_factory
 from src.summarization.infrastructure.dependencies import get_summarizer_service_factory
 from src.shared.infrastructure.database import Base, engine, AsyncSessionLocal
@@ -28,6 +33,7 @@ from src.auth.api.routers import router as auth_router
 from src.metrics.api.routers import router as metrics_router
 from src.notifications.api.routers import router as notification_router
 from src.providers.api.routers import router as providers_router
+from src.search.api.routers import router as search_router
 from src.summarization.api.routers import router as summary_router
 from src.transcription.api.routers import router as transcription_router
 from src.video_management.api.routers import router as video_router
@@ -49,6 +55,8 @@ async def lifespan(app: FastAPI):
         # Create shared components first
         event_bus = get_event_bus()
         storage_factory = get_storage_service_factory()
+        # Storage clients are shared per process; build them (and check the bucket) before serving requests
+        warm_up_storage_services({"local", os.getenv("STORAGE_PROVIDER", "local")})
         speech_factory = get_speech_recognition_service_factory()
         summarizer_factory = get_summarizer_service_factory()
 
@@ -56,10 +64,11 @@ async def lifespan(app: FastAPI):
         metrics_components = bootstrap_metrics_module()
         auth_components = bootstrap_auth_module(session)
         analytics_components = bootstrap_analytics_module(session)
-        transcription_components = bootstrap_transcription_module(session)
+        transcription_components = bootstrap_transcription_module(session, storage_factory)
         notification_components = bootstrap_notification_module(session, user_repository=auth_components["user_repository"])
         video_components = bootstrap_video_module(session, storage_factory, event_bus, metrics_components["metrics_service"])
         summarization_components = bootstrap_summarization_module(session, event_bus)
+        search_components = bootstrap_search_module(session)
 
         # Create a unified container dictionary for the application state
         app.state.container = {
@@ -74,6 +83,7 @@ async def lifespan(app: FastAPI):
             **notification_components,
             **video_components,
             **summarization_components,
+            **search_components,
         }
 
         # 4. Start Background Services
@@ -85,6 +95,7 @@ async def lifespan(app: FastAPI):
         # 5. Clean up resources
         print("🛑 Shutting down resources...")
         await app.state.container["event_bus"].stop_listener()
+        await close_storage_services()
         await engine.dispose()
 
 
@@ -98,6 +109,8 @@ app = FastAPI(
 )
 
 FastAPIInstrumentor.instrument_app(app)
+# Compresses responses for clients that accept gzip, streamed ones included (SSE and video are excluded)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 
 # --- Dependency Injection Helper ---
 def get_service(service_name: str):
@@ -111,5 +124,6 @@ app.include_router(auth_router)
 app.include_router(video_router)
 app.include_router(transcription_router)
 app.include_router(summary_router)
+app.include_router(search_router)
 app.include_router(notification_router)
 app.include_router(metrics_router)
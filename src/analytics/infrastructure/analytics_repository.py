@@ -4,7 +4,7 @@ from sqlalchemy import select, func, text
 
 from src.video_management.domain.video import Video, VideoStatus
 from src.transcription.domain.transcription import Transcription, TranscriptionStatus
-from src.summarization.domain.summary import Summary, SummaryStatus
+from src.summarization.domain.summary import Summary, SummaryLength, SummaryStatus
 
 
 class AnalyticsRepository:
@@ -33,7 +33,9 @@ class AnalyticsRepository:
             .where(
                 Video.status == VideoStatus.COMPLETED,
                 Transcription.status == TranscriptionStatus.COMPLETED,
-                Summary.status == SummaryStatus.COMPLETED
+                Summary.status == SummaryStatus.COMPLETED,
+                # Further lengths only run the reduce stage; count the variant that runs the map pass
+                Summary.length == SummaryLength.DETAILED
             )
         )
 
@@ -14,6 +14,26 @@ class MetricsService:
     def increment_summarization(self, status: str):
         self.provider.increment_counter("SUMMARIZATIONS_TOTAL", {"status": status})
 
+    def increment_summarization_answer(self, provider: str, fallback_reason: str):
+        """Counts which provider of the fallback chain answered, and why earlier ones were skipped."""
+        labels = {"provider": provider, "fallback_reason": fallback_reason}
+        self.provider.increment_counter("SUMMARIZATION_ANSWERS_TOTAL", labels)
+
+    def increment_transcription_hedge(self, outcome: str):
+        """Counts hedging decisions: not_needed, budget_exhausted, primary_won or backup_won."""
+        self.provider.increment_counter("TRANSCRIPTION_HEDGES_TOTAL", {"outcome": outcome})
+
+    def increment_storage_cache_lookup(self, provider: str, result: str):
+        """Counts downloads through the disk cache: hit, miss, or coalesced into one in flight."""
+        self.provider.increment_counter("STORAGE_CACHE_LOOKUPS_TOTAL", {"provider": provider, "result": result})
+
+    def increment_storage_cache_evictions(self, provider: str, entries: int, size: int):
+        self.provider.increment_counter("STORAGE_CACHE_EVICTIONS_TOTAL", {"provider": provider}, entries)
+        self.provider.increment_counter("STORAGE_CACHE_BYTES_TOTAL", {"provider": provider, "direction": "evicted"}, size)
+
+    def increment_storage_cache_fetched_bytes(self, provider: str, size: int):
+        self.provider.increment_counter("STORAGE_CACHE_BYTES_TOTAL", {"provider": provider, "direction": "fetched"}, size)
+
     def observe_transcription_duration(self, video_id: str, duration: float, provider: str):
         labels = {"video_id": video_id, "provider": provider}
         self.provider.observe_histogram("TRANSCRIPTION_DURATION", duration, labels)
@@ -2,11 +2,11 @@
 from typing import Dict, Any
 
 from src.metrics.application.metrics_service import MetricsService
-from src.metrics.infrastructure.prometheus_provider import PrometheusMetricsProvider
+from src.metrics.infrastructure.prometheus_provider import get_prometheus_metrics_provider
 
 def bootstrap_metrics_module() -> Dict[str, Any]:
     """Constructs and returns the services for the metrics module."""
-    metrics_provider = PrometheusMetricsProvider()
+    metrics_provider = get_prometheus_metrics_provider()
     metrics_service = MetricsService(provider=metrics_provider)
 
     return {
@@ -8,7 +8,7 @@ class MetricType(Enum):
 
 class MetricsProvider(ABC):
     @abstractmethod
-    def increment_counter(self, name: str, labels: dict = None):
+    def increment_counter(self, name: str, labels: dict = None, amount: float = 1):
         pass
 
     @abstractmethod
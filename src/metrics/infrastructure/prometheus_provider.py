@@ -1,4 +1,6 @@
 # src/metrics/infrastructure/prometheus_provider.py
+from typing import Optional
+
 from prometheus_client import Counter, Histogram
 from src.metrics.domain.metrics import MetricsProvider
 
@@ -27,11 +29,38 @@ class PrometheusMetricsProvider(MetricsProvider):
             'Total transcriptions processed',
             ['status']
         )
+        self.TRANSCRIPTION_HEDGES_TOTAL = Counter(
+            'transcription_hedges_total',
+            'Hedged transcription decisions (hedge rate and backup win rate)',
+            ['outcome']
+        )
         self.SUMMARIZATIONS_TOTAL = Counter(
             'summarizations_total',
             'Total summaries generated',
             ['status']
         )
+        self.SUMMARIZATION_ANSWERS_TOTAL = Counter(
+            'summarization_answers_total',
+            'Summaries by the provider of the fallback chain that answered',
+            ['provider', 'fallback_reason']
+        )
+
+        # --- Storage Cache Metrics ---
+        self.STORAGE_CACHE_LOOKUPS_TOTAL = Counter(
+            'storage_cache_lookups_total',
+            'Downloads through the disk cache by result (hit, miss, coalesced)',
+            ['provider', 'result']
+        )
+        self.STORAGE_CACHE_EVICTIONS_TOTAL = Counter(
+            'storage_cache_evictions_total',
+            'Entries evicted from the disk cache',
+            ['provider']
+        )
+        self.STORAGE_CACHE_BYTES_TOTAL = Counter(
+            'storage_cache_bytes_total',
+            'Bytes fetched into and evicted from the disk cache',
+            ['provider', 'direction']
+        )
 
         # --- Service Duration Metrics with Provider Label ---
         self.UPLOAD_DURATION = Histogram(
@@ -50,13 +79,13 @@ class PrometheusMetricsProvider(MetricsProvider):
             ['video_id', 'provider']  # Added provider label
         )
 
-    def increment_counter(self, name: str, labels: dict = None):
+    def increment_counter(self, name: str, labels: dict = None, amount: float = 1):
         metric = getattr(self, name, None)
         if metric and isinstance(metric, Counter):
             if labels:
-                metric.labels(**labels).inc()
+                metric.labels(**labels).inc(amount)
             else:
-                metric.inc()
+                metric.inc(amount)
 
     def observe_histogram(self, name: str, value: float, labels: dict = None):
         metric = getattr(self, name, None)
@@ -65,3 +94,14 @@ class PrometheusMetricsProvider(MetricsProvider):
                 metric.labels(**labels).observe(value)
             else:
                 metric.observe(value)
+
+
+_provider: Optional[PrometheusMetricsProvider] = None
+
+
+def get_prometheus_metrics_provider() -> PrometheusMetricsProvider:
+    """The provider of this process: its metrics live in the default registry, which takes each name once."""
+    global _provider
+    if _provider is None:
+        _provider = PrometheusMetricsProvider()
+    return _provider
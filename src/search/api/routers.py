@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.auth.api.dependencies import get_current_user
+from src.auth.domain.user import User
+from src.search.application.queries.search_queries import SearchQueries
+from src.shared.dependencies import get_search_queries
+from .schemas import SearchResponse
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=SearchResponse, summary="Search transcripts and summaries")
+async def search(
+    q: str = Query(..., min_length=1, max_length=256, description="Words, \"quoted phrases\", OR and -excluded words"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    queries: SearchQueries = Depends(get_search_queries),
+    current_user: User = Depends(get_current_user),
+):
+    """Ranked full-text matches with snippets, within the current user's videos."""
+    return await queries.search(current_user.id, q, limit=limit, offset=offset)
@@ -0,0 +1,21 @@
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchHitResponse(BaseModel):
+    kind: Literal["transcription", "summary"]
+    id: UUID
+    video_id: UUID
+    transcription_id: UUID
+    rank: float
+    # Matching fragments, with the matched words wrapped in <mark></mark>; none for offloaded transcripts
+    snippet: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchHitResponse]
+    limit: int
+    offset: int
+    has_more: bool
@@ -0,0 +1,20 @@
+# src/search/application/queries/search_queries.py
+from typing import Union
+from uuid import UUID
+
+from src.search.infrastructure.search_repository import SearchRepository
+
+
+class SearchQueries:
+    """Handles full-text search over transcripts and summaries."""
+    def __init__(self, search_repository: SearchRepository):
+        self.search_repository = search_repository
+
+    async def search(self, user_id: Union[str, UUID], text: str, limit: int = 20, offset: int = 0) -> dict:
+        """One page of ranked hits; one extra row is fetched to tell whether another page exists."""
+        text = text.strip()
+        if not text:
+            return {"items": [], "limit": limit, "offset": offset, "has_more": False}
+
+        hits = await self.search_repository.search(user_id, text, limit=limit + 1, offset=offset)
+        return {"items": hits[:limit], "limit": limit, "offset": offset, "has_more": len(hits) > limit}
@@ -0,0 +1,16 @@
+# src/search/bootstrap.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any
+
+from src.search.application.queries.search_queries import SearchQueries
+from src.search.infrastructure.search_repository import SearchRepository
+
+def bootstrap_search_module(db_session: AsyncSession) -> Dict[str, Any]:
+    """Constructs and returns the query services for the search module."""
+    search_repository = SearchRepository(db=db_session)
+    search_queries = SearchQueries(search_repository=search_repository)
+
+    return {
+        "search_repository": search_repository,
+        "search_queries": search_queries,
+    }
@@ -0,0 +1,77 @@
+# src/search/infrastructure/search_repository.py
+from typing import List, Union
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.infrastructure.full_text_search import SEARCH_CONFIG
+from src.summarization.domain.summary import Summary
+from src.transcription.domain.transcription import Transcription
+from src.video_management.domain.video import Video
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+
+class SearchRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(self, user_id: Union[str, UUID], text: str, limit: int, offset: int) -> List[dict]:
+        """
+        Ranked transcript and summary matches within the user's videos. Matching uses the
+        GIN indexes; snippets (ts_headline re-parses the document) are built for the
+        requested page only.
+        """
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+        transcript_hits = (
+            select(
+                literal("transcription").label("kind"),
+                Transcription.id.label("id"),
+                Transcription.video_id.label("video_id"),
+                Transcription.id.label("transcription_id"),
+                func.ts_rank_cd(Transcription.search_vector, query).label("rank"),
+            )
+            .join(Video, Video.id == Transcription.video_id)
+            .where(Video.user_id == str(user_id), Transcription.search_vector.op("@@")(query))
+        )
+        summary_hits = (
+            select(
+                literal("summary").label("kind"),
+                Summary.id.label("id"),
+                Transcription.video_id.label("video_id"),
+                Summary.transcription_id.label("transcription_id"),
+                func.ts_rank_cd(Summary.search_vector, query).label("rank"),
+            )
+            .join(Transcription, Transcription.id == Summary.transcription_id)
+            .join(Video, Video.id == Transcription.video_id)
+            .where(Video.user_id == str(user_id), Summary.search_vector.op("@@")(query))
+        )
+        hits = union_all(transcript_hits, summary_hits).subquery()
+        page = (
+            select(hits)
+            .order_by(hits.c.rank.desc(), hits.c.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        document = func.coalesce(Transcription.text, Summary.text)
+        stmt = (
+            select(
+                page.c.kind,
+                page.c.id,
+                page.c.video_id,
+                page.c.transcription_id,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, document, query, HEADLINE_OPTIONS).label("snippet"),
+            )
+            .select_from(page)
+            .outerjoin(Transcription, and_(page.c.kind == "transcription", Transcription.id == page.c.id))
+            .outerjoin(Summary, and_(page.c.kind == "summary", Summary.id == page.c.id))
+            .order_by(page.c.rank.desc(), page.c.id)
+        )
+
+        result = await self.db.execute(stmt)
+        return [dict(row._mapping) for row in result]
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -8,6 +10,49 @@ class StorageSettings(BaseSettings):
     endpoint_url: str = Field(..., alias="ENDPOINT_URL")
     access_key: str = Field(..., alias="ACCESS_KEY")
     secret_key: str = Field(..., alias="SECRET_KEY")
+    # Endpoint presigned URLs point to, when clients reach storage by another address than the API
+    public_endpoint_url: Optional[str] = Field(None, alias="S3_PUBLIC_ENDPOINT_URL")
+    # Streamed uploads: smaller files are sent with one PutObject, larger ones in parts of this size (S3 minimum: 5 MB)
+    multipart_part_size_mb: int = Field(8, alias="S3_MULTIPART_PART_SIZE_MB")
+    # Objects larger than one download part are fetched as this many concurrent byte ranges
+    download_part_size_mb: int = Field(8, alias="S3_DOWNLOAD_PART_SIZE_MB")
+    download_concurrency: int = Field(8, alias="S3_DOWNLOAD_CONCURRENCY")
+    # Connections the shared boto3 client keeps open; match it to the executor threads calling S3
+    max_pool_connections: int = Field(32, alias="S3_MAX_POOL_CONNECTIONS")
+    # s3-async provider: keep-alive pool per event loop, the S3 requests a process keeps in flight, and
+    # the bodies streamed to clients at their own pace (these hold a connection each; the pool covers both)
+    async_max_pool_connections: int = Field(64, alias="S3_ASYNC_MAX_POOL_CONNECTIONS")
+    async_max_concurrency: int = Field(32, alias="S3_ASYNC_MAX_CONCURRENCY")
+    async_max_streams: int = Field(32, alias="S3_ASYNC_MAX_STREAMS")
+    async_keepalive_seconds: float = Field(30.0, alias="S3_ASYNC_KEEPALIVE_SECONDS")
+
+    @property
+    def multipart_part_size_bytes(self) -> int:
+        return max(self.multipart_part_size_mb, 5) * 1024 * 1024
+
+    @property
+    def download_part_size_bytes(self) -> int:
+        return max(self.download_part_size_mb, 1) * 1024 * 1024
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+
+
+class StorageCacheSettings(BaseSettings):
+    """Read-through disk cache in front of remote providers; off unless a directory is set (e.g. on workers)."""
+    directory: Optional[str] = Field(None, alias="STORAGE_CACHE_DIR")
+    max_size_mb: int = Field(10240, alias="STORAGE_CACHE_MAX_SIZE_MB")
+    # Comma-separated providers whose downloads are cached
+    providers: str = Field("s3,s3-async", alias="STORAGE_CACHE_PROVIDERS")
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self.max_size_mb * 1024 * 1024
+
+    @property
+    def provider_names(self) -> List[str]:
+        return [name.strip() for name in self.providers.split(",") if name.strip()]
 
     class Config:
         env_file = ".env"
@@ -47,3 +47,9 @@ get_transcription_queries = get_service("transcription_queries") # For Queries
 
 # Analytics
 get_analytics_queries = get_service("analytics_queries") # For Queries
+
+# Search
+get_search_queries = get_service("search_queries") # For Queries
+
+# Events
+get_event_bus_service = get_service("event_bus")
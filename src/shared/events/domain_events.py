@@ -51,6 +51,7 @@ class SummarizationRequested(DomainEvent):
     """Event triggered when a user requests a new summary."""
     transcription_id: str
     provider: str
+    length: str = "detailed"
 
 
 @dataclass(frozen=True)
@@ -60,3 +61,7 @@ class SummarizationProgress(DomainEvent):
     progress: int
     stage: str
     estimated_total_seconds: Optional[float] = None
+    completed_chunks: Optional[int] = None
+    total_chunks: Optional[int] = None
+    eta_seconds: Optional[float] = None
+    length: Optional[str] = None
@@ -1,5 +1,5 @@
 from celery import Celery
-from typing import Dict, Callable, Any, Optional, Coroutine, Union, Type
+from typing import Dict, Callable, Any, Optional, Coroutine, Union, Type, AsyncIterator
 import json
 import asyncio
 import redis.asyncio as aioredis
@@ -60,6 +60,22 @@ class EventBus:
         except TypeError as e:
             raise ValueError(f"Error serializing event payload: {e}")
 
+    async def stream(self, event_type: Type[DomainEvent], timeout: float) -> AsyncIterator[Optional[Dict]]:
+        """
+        Yields payloads of `event_type` as they are published, on a dedicated Redis
+        subscription. Yields None whenever `timeout` seconds pass without a message,
+        so callers can send keep-alives or give up.
+        """
+        pubsub = redis_client.pubsub()
+        await pubsub.subscribe(event_type.__name__)
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+                yield json.loads(message["data"]) if message else None
+        finally:
+            await pubsub.unsubscribe(event_type.__name__)
+            await pubsub.aclose()
+
     async def _listen(self):
         """Main loop to listen for Redis events and dispatch handlers."""
         while True:
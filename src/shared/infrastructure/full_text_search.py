@@ -0,0 +1,31 @@
+# src/shared/infrastructure/full_text_search.py
+from typing import Optional
+
+from sqlalchemy import Column, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+
+# Transcripts come in any language, so words are indexed as-is (no stemming or stop words)
+SEARCH_CONFIG = "simple"
+
+
+def search_vector_column(source_column: Optional[str] = None):
+    """
+    A tsvector column, deferred since it is only ever read inside queries. With a source
+    column it is generated by Postgres and kept in sync on every insert and update;
+    without one the model assigns it with `to_search_vector`.
+    """
+    if source_column is None:
+        return deferred(Column(TSVECTOR, nullable=True))
+    expression = f"to_tsvector('{SEARCH_CONFIG}', coalesce({source_column}, ''))"
+    return deferred(Column(TSVECTOR, Computed(expression, persisted=True)))
+
+
+def to_search_vector(text: Optional[str]):
+    """SQL expression computing the search vector of a text when the row is written."""
+    return func.to_tsvector(SEARCH_CONFIG, text or "")
+
+
+def search_vector_index(table_name: str) -> Index:
+    """GIN index backing `search_vector @@ tsquery` lookups."""
+    return Index(f"ix_{table_name}_search_vector", "search_vector", postgresql_using="gin")
@@ -1,5 +1,7 @@
 # src/shared/resilience/circuit_breaker.py
-from typing import Dict
+import asyncio
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
 from pybreaker import CircuitBreaker
 import logging
 
@@ -22,3 +24,33 @@ def get_circuit_breaker(service_key: str) -> CircuitBreaker:
         logger.info(f"Circuit breaker created for service: {service_key}")
     
     return _breakers[service_key]
+
+
+@contextmanager
+def calling(breaker: CircuitBreaker) -> Iterator[None]:
+    """
+    `breaker.calling()` for awaited calls, except that a cancelled call (a hedge loser, an
+    abandoned wait) is reported neither as a failure nor as a success: it says nothing about
+    the service's health. pybreaker has no such outcome, excluded exceptions count as successes.
+    """
+    outcome: List[BaseException] = []
+
+    def report():
+        if outcome:
+            raise outcome[0]
+        return
+        yield  # Makes this a generator, which pybreaker only runs once it is iterated
+
+    # Raises CircuitBreakerError while the breaker is open; the outcome is reported by iterating
+    reporter = breaker.call(report)
+    try:
+        yield
+    except asyncio.CancelledError:
+        reporter.close()  # Never started, so nothing is reported
+        raise
+    except BaseException as e:
+        outcome.append(e)
+        next(reporter)  # Re-raises the error, or CircuitBreakerError when it trips the breaker
+        raise
+    else:
+        next(reporter, None)
@@ -0,0 +1,85 @@
+# src/shared/resilience/hedging.py
+import logging
+import math
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """
+    Rolling latency samples per payload size class (powers of two), so the expected
+    latency of a request is estimated from requests of similar size.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[int, Deque[float]] = {}
+
+    @staticmethod
+    def size_class(size: int) -> int:
+        return int(math.log2(size)) if size > 0 else 0
+
+    def observe(self, size: int, seconds: float):
+        bucket = self._samples.setdefault(self.size_class(size), deque(maxlen=self.window))
+        bucket.append(seconds)
+
+    def percentile(self, size: int, q: float) -> Optional[float]:
+        """The q-th percentile latency for payloads of this size, or None until enough samples exist."""
+        samples = self._samples.get(self.size_class(size))
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class HedgeBudget:
+    """
+    Caps hedging overhead: every request deposits `ratio` tokens and every hedge spends
+    one, so at most `ratio` of the requests (plus a small `burst`) start a backup call.
+    """
+
+    def __init__(self, ratio: float, burst: float = 5.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+
+    def record_request(self):
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+# Global registries so every handler of the same provider shares its history per process
+_trackers: Dict[str, LatencyTracker] = {}
+_budgets: Dict[str, HedgeBudget] = {}
+
+
+def get_latency_tracker(service_key: str, window: int = 200, min_samples: int = 20) -> LatencyTracker:
+    """
+    Factory function to get a latency tracker for a specific service.
+    Creates a new one if it doesn't exist.
+    """
+    if service_key not in _trackers:
+        _trackers[service_key] = LatencyTracker(window, min_samples)
+        logger.info(f"Latency tracker created for service: {service_key}")
+
+    return _trackers[service_key]
+
+
+def get_hedge_budget(service_key: str, ratio: float) -> HedgeBudget:
+    """
+    Factory function to get a hedge budget for a specific service.
+    Creates a new one if it doesn't exist.
+    """
+    if service_key not in _budgets:
+        _budgets[service_key] = HedgeBudget(ratio)
+        logger.info(f"Hedge budget created for service: {service_key}")
+
+    return _budgets[service_key]
@@ -0,0 +1,74 @@
+# src/shared/resilience/rate_limiter.py
+import asyncio
+import logging
+import time
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for asyncio code. Callers reserve tokens up front (the balance may go
+    negative) and sleep off the deficit, so no lock is held across awaits and waiting
+    callers are served in arrival order.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        """Deducts `amount` tokens and returns how many seconds to wait before spending them."""
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.refill_per_second
+
+    def adjust(self, delta: float):
+        """Charges (positive) or refunds (negative) tokens after the real cost is known."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - delta)
+
+    async def acquire(self, amount: float = 1):
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Enforces a requests-per-minute and a tokens-per-minute budget together."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = AsyncTokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.tokens = AsyncTokenBucket(tokens_per_minute, tokens_per_minute / 60)
+
+    async def acquire(self, tokens: float):
+        """Waits until one request carrying `tokens` tokens fits in both budgets."""
+        delay = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# A global registry so every client of the same account shares one budget per process
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(service_key: str, requests_per_minute: float, tokens_per_minute: float) -> RateLimiter:
+    """
+    Factory function to get a rate limiter for a specific service.
+    Creates a new one if it doesn't exist.
+    """
+    if service_key not in _limiters:
+        _limiters[service_key] = RateLimiter(requests_per_minute, tokens_per_minute)
+        logger.info(f"Rate limiter created for service: {service_key}")
+
+    return _limiters[service_key]
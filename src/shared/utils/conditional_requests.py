@@ -0,0 +1,114 @@
+# src/shared/utils/conditional_requests.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+
+from fastapi import Request
+
+
+def make_etag(*parts: object, weak: bool = False) -> str:
+    """An entity tag derived from whatever identifies a version of the representation."""
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    """Formats a (naive UTC or aware) datetime for Last-Modified and similar headers."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match style list of entity tags (RFC 9110, 8.8.3.2)."""
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(_opaque(candidate) == _opaque(etag) for candidate in candidates)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Whether a GET can be answered with 304; If-None-Match takes precedence over If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = parse_http_date(request.headers.get("if-modified-since"))
+    if if_modified_since is None or last_modified is None:
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have a one-second resolution
+    return last_modified.replace(microsecond=0) <= if_modified_since
+
+
+class RangeNotSatisfiable(Exception):
+    """The Range header does not overlap the representation (answered with 416)."""
+
+    def __init__(self, size: int):
+        super().__init__(f"Range not satisfiable for {size} bytes")
+        self.size = size
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    The inclusive (start, end) of a single-range `bytes=` header. Returns None when the
+    header is absent, malformed or asks for several ranges, so the whole file is served.
+    """
+    if not header:
+        return None
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, sep, last = ranges.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix == 0:
+                raise RangeNotSatisfiable(size)
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(size)
+    if start < 0 or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def if_range_matches(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Whether a Range request may be honoured given its If-Range precondition (RFC 9110, 13.1.5)."""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        # Strong comparison: weak tags never match
+        return not etag.startswith("W/") and if_range == etag
+    validator = parse_http_date(if_range)
+    if validator is None or last_modified is None:
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) == validator
@@ -0,0 +1,60 @@
+# src/storage/application/ranged_download.py
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from src.storage.application.storage_service import StorageException
+
+# Fetches the inclusive byte range (start, end) of an object
+RangeFetcher = Callable[[int, int], Awaitable[bytes]]
+
+
+def plan_ranges(size: int, part_size: int, offset: int = 0) -> List[Tuple[int, int]]:
+    """Splits bytes offset..size into inclusive (start, end) ranges of at most `part_size` bytes."""
+    return [(start, min(start + part_size, size) - 1) for start in range(offset, size, part_size)]
+
+
+def object_size(content_range: Optional[str], received: int) -> int:
+    """Total object size from a `bytes 0-99/1234` Content-Range, or what was received if the range was ignored."""
+    if not content_range or "/" not in content_range:
+        return received
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else received
+
+
+async def download_ranges(
+    fetch: RangeFetcher, size: int, part_size: int, concurrency: int, prefix: bytes = b""
+) -> bytearray:
+    """
+    Downloads an object of known size as concurrent byte ranges written straight into one
+    preallocated buffer, so the parts are never joined (and the file never held twice).
+    `prefix` is the already fetched start of the object.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    view[:len(prefix)] = prefix
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_part(start: int, end: int):
+        async with semaphore:
+            data = await fetch(start, end)
+        if len(data) != end - start + 1:
+            raise StorageException(f"Ranged download of bytes {start}-{end} returned {len(data)} bytes")
+        view[start:end + 1] = data
+
+    tasks = [asyncio.ensure_future(fetch_part(start, end)) for start, end in plan_ranges(size, part_size, len(prefix))]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # One failed part fails the download: stop the others instead of letting them finish
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return buffer
+
+
+def verify_sha256(data: bytes, expected: Optional[str], file_path: str):
+    """Raises if `data` does not hash to the SHA-256 recorded when the file was stored."""
+    if expected and hashlib.sha256(data).hexdigest() != expected:
+        raise StorageException(f"Checksum mismatch for {file_path}")
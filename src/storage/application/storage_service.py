@@ -1,8 +1,20 @@
 # src/storage/application/storage_service.py
-from abc import ABC, abstractmethod, property_method
-from typing import Optional, Union, Tuple
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, List, Optional, Union, Tuple
 from pathlib import Path
 
+from src.storage.domain.direct_upload import ChunkedUpload, DirectUpload
+from src.storage.domain.file_metadata import FileMetadata, StoredFile
+
+# Size of the chunks ranged reads are streamed in
+RANGE_CHUNK_BYTES = 256 * 1024
+# Chunk size of resumable uploads on providers without a part size of their own
+RESUMABLE_CHUNK_BYTES = 8 * 1024 * 1024
+# Files per page of a listing, the most one S3 ListObjectsV2 request returns
+LIST_PAGE_SIZE = 1000
+# Most keys one S3 DeleteObjects request takes
+DELETE_BATCH_MAX_KEYS = 1000
+
 
 class StorageService(ABC):
     """
@@ -20,16 +32,106 @@ class StorageService(ABC):
         """Stores a file in the storage system."""
         pass
 
+    async def upload_stream(self, file_path: Union[str, Path], chunks: AsyncIterable[bytes]) -> int:
+        """
+        Stores a file from an async stream of chunks and returns its size. Providers that
+        can write incrementally override this; the default buffers the whole file.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.upload(file_path, data)
+        return len(data)
+
+    async def create_direct_upload(
+        self, file_path: Union[str, Path], size: int, expires_in: int
+    ) -> Optional[DirectUpload]:
+        """
+        Presigned requests with which a client uploads `size` bytes straight to storage.
+        Returns None for providers that cannot take uploads without the API in between.
+        """
+        return None
+
+    async def complete_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str, size: int):
+        """Assembles the parts of a direct multipart upload once the client has sent all `size` bytes."""
+        raise StorageException(f"{self.provider_name} does not support direct multipart uploads")
+
+    async def abort_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str):
+        """Discards the parts of an abandoned direct multipart upload."""
+        raise StorageException(f"{self.provider_name} does not support direct multipart uploads")
+
+    async def start_chunked_upload(self, file_path: Union[str, Path], size: int) -> ChunkedUpload:
+        """Prepares to receive `size` bytes as chunks sent (and possibly resent) one request at a time."""
+        raise StorageException(f"{self.provider_name} does not support chunked uploads")
+
+    async def upload_chunk(self, file_path: Union[str, Path], upload: ChunkedUpload, offset: int, data: bytes):
+        """Stores the chunk starting at `offset`, replacing whatever an earlier attempt left there."""
+        raise StorageException(f"{self.provider_name} does not support chunked uploads")
+
+    async def complete_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload, size: int):
+        """Assembles the chunks into the file once all `size` bytes have been received."""
+        raise StorageException(f"{self.provider_name} does not support chunked uploads")
+
+    async def abort_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload):
+        """Discards the chunks of an abandoned upload."""
+        raise StorageException(f"{self.provider_name} does not support chunked uploads")
+
     @abstractmethod
     async def download(self, file_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
         """Retrieves a file from the storage system."""
         pass
 
+    @abstractmethod
+    async def stat(self, file_path: Union[str, Path]) -> Optional[FileMetadata]:
+        """Returns the size and version of a file, or None if it does not exist."""
+        pass
+
+    async def iter_range(
+        self, file_path: Union[str, Path], start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams the bytes start..end (inclusive) of a file. Providers that support ranged
+        reads override this; the default downloads the whole file.
+        """
+        downloaded = await self.download(file_path)
+        if downloaded is None:
+            raise StorageException(f"File {file_path} not found")
+        content = downloaded[0][start:end + 1]
+        for offset in range(0, len(content), chunk_size):
+            yield content[offset:offset + chunk_size]
+
+    def local_path(self, file_path: Union[str, Path]) -> Optional[Path]:
+        """The file's path on this machine, for providers that can serve it straight from disk."""
+        return None
+
+    async def move(self, source: Union[str, Path], destination: Union[str, Path]):
+        """
+        Moves a file to another path, replacing any file there. Providers that can move
+        without the bytes passing through this process override this.
+        """
+        downloaded = await self.download(source)
+        if downloaded is None:
+            raise StorageException(f"File {source} not found")
+        await self.upload(destination, downloaded[0])
+        await self.delete(source)
+
+    async def list_files(self, prefix: str, page_size: int = LIST_PAGE_SIZE) -> AsyncIterator[List[StoredFile]]:
+        """Pages of at most `page_size` files whose path starts with `prefix`."""
+        raise StorageException(f"{self.provider_name} does not support listing files")
+        yield []  # Unreachable, makes this an async generator like the overrides
+
     @abstractmethod
     async def delete(self, file_path: Union[str, Path]) -> bool:
         """Deletes a file from the storage system."""
         pass
 
+    async def delete_many(self, file_paths: List[str]) -> int:
+        """
+        Deletes files and returns how many are gone afterwards, counting ones that did not
+        exist. Providers with batch deletes override this; the default deletes one at a time.
+        """
+        for file_path in file_paths:
+            await self.delete(file_path)
+        return len(file_paths)
+
     @abstractmethod
     async def exists(self, file_path: Union[str, Path]) -> bool:
         """Checks if a file exists in the storage system."""
@@ -0,0 +1,47 @@
+# src/storage/application/upload_stream.py
+import hashlib
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from src.storage.application.storage_service import StorageException
+
+
+class UploadTooLargeError(StorageException):
+    """Raised while streaming an upload as soon as it passes its size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds the maximum size of {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class IncompleteUploadError(StorageException):
+    """Raised when a direct upload is completed before the client has sent all of its bytes."""
+
+
+class MeteredStream:
+    """
+    Counts and hashes the chunks of an upload as they flow to storage, and stops the
+    stream once it passes `max_bytes`, so neither check needs the whole file in memory.
+    """
+
+    def __init__(self, chunks: AsyncIterable[bytes], max_bytes: Optional[int] = None):
+        self._chunks = chunks
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            self.size += len(chunk)
+            if self.max_bytes is not None and self.size > self.max_bytes:
+                raise UploadTooLargeError(self.max_bytes)
+            self._digest.update(chunk)
+            yield chunk
+
+
+async def iter_chunks(data: bytes) -> AsyncIterator[bytes]:
+    """Adapts an in-memory payload to the streaming upload path."""
+    yield data
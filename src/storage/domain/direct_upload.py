@@ -0,0 +1,42 @@
+# src/storage/domain/direct_upload.py
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# S3 allows at most this many parts per multipart upload
+MAX_MULTIPART_PARTS = 10_000
+
+
+@dataclass(frozen=True)
+class PresignedRequest:
+    """A request the client sends straight to storage, authorized by its signed URL."""
+    method: str
+    url: str
+    # Set for the parts of a multipart upload
+    part_number: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class DirectUpload:
+    """The presigned requests that upload one file: a single PUT, or one PUT per part."""
+    requests: List[PresignedRequest] = field(default_factory=list)
+    multipart_upload_id: Optional[str] = None
+    part_size: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ChunkedUpload:
+    """
+    An upload the client sends through the API in fixed-size chunks. Every chunk but the
+    last is `chunk_size` bytes, so a chunk's offset alone identifies it and resending it is safe.
+    """
+    chunk_size: int
+    # S3: the multipart upload each chunk becomes a part of
+    multipart_upload_id: Optional[str] = None
+
+    def part_number(self, offset: int) -> int:
+        return offset // self.chunk_size + 1
+
+
+def direct_upload_part_size(size: int, part_size: int) -> int:
+    """The part size to use for `size` bytes, grown if needed to stay within the part limit."""
+    return max(part_size, -(-size // MAX_MULTIPART_PARTS))
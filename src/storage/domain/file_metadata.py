@@ -0,0 +1,22 @@
+# src/storage/domain/file_metadata.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    """What a storage provider knows about a stored file without reading it."""
+    size: int
+    last_modified: datetime
+    # Strong entity tag from the provider, if it has one (S3 does, the local disk does not)
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """One entry of a storage listing."""
+    path: str
+    size: int
+    last_modified: datetime
@@ -0,0 +1,61 @@
+# src/storage/infrastructure/_s3_presigning.py
+from typing import Dict, List
+
+import boto3
+from botocore.config import Config
+
+from src.shared.config.storage_settings import StorageSettings
+from src.storage.application.upload_stream import IncompleteUploadError
+from src.storage.domain.direct_upload import DirectUpload, PresignedRequest
+
+
+def create_presigning_client(settings: StorageSettings):
+    """
+    A client that only signs URLs (it never sends a request). The signature covers the host,
+    so it is built for the endpoint clients can reach, which may differ from the API's.
+    """
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.access_key,
+        aws_secret_access_key=settings.secret_key,
+        endpoint_url=settings.public_endpoint_url or settings.endpoint_url,
+        config=Config(signature_version="s3v4"),
+    )
+
+
+def presign_put(client, bucket: str, key: str, expires_in: int) -> DirectUpload:
+    url = client.generate_presigned_url(
+        "put_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires_in
+    )
+    return DirectUpload(requests=[PresignedRequest(method="PUT", url=url)])
+
+
+def presign_parts(
+    client, bucket: str, key: str, upload_id: str, size: int, part_size: int, expires_in: int
+) -> DirectUpload:
+    part_count = -(-size // part_size)
+    requests = [
+        PresignedRequest(
+            method="PUT",
+            url=client.generate_presigned_url(
+                "upload_part",
+                Params={"Bucket": bucket, "Key": key, "UploadId": upload_id, "PartNumber": part_number},
+                ExpiresIn=expires_in,
+            ),
+            part_number=part_number,
+        )
+        for part_number in range(1, part_count + 1)
+    ]
+    return DirectUpload(requests=requests, multipart_upload_id=upload_id, part_size=part_size)
+
+
+def check_parts_received(key: str, parts: List[Dict], size: int):
+    """Raises unless the listed parts of a multipart upload add up to the declared size."""
+    received = sum(part["Size"] for part in parts)
+    if received != size:
+        raise IncompleteUploadError(f"Upload of {key} is incomplete: {received} of {size} bytes received")
+
+
+def completed_parts(parts: List[Dict]) -> Dict:
+    """The MultipartUpload argument of CompleteMultipartUpload for the listed parts."""
+    return {"Parts": [{"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for part in parts]}
@@ -0,0 +1,419 @@
+# src/storage/infrastructure/async_s3_storage_service.py
+import asyncio
+import logging
+import weakref
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
+
+from src.shared.config.storage_settings import StorageSettings
+from src.storage.application.ranged_download import download_ranges, object_size
+from src.storage.application.storage_service import (
+    DELETE_BATCH_MAX_KEYS, LIST_PAGE_SIZE, RANGE_CHUNK_BYTES, StorageService, StorageException,
+)
+from src.storage.domain.direct_upload import ChunkedUpload, DirectUpload, direct_upload_part_size
+from src.storage.domain.file_metadata import FileMetadata, StoredFile
+from src.storage.infrastructure._s3_presigning import (
+    check_parts_received, completed_parts, create_presigning_client, presign_parts, presign_put,
+)
+from src.storage.infrastructure.dependencies import register_storage
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound", "NoSuchBucket"}
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in NOT_FOUND_CODES
+
+
+@dataclass
+class _LoopClient:
+    client: object
+    exit_stack: AsyncExitStack
+    # Bounds the S3 requests in flight on this loop, below the size of the connection pool
+    semaphore: asyncio.Semaphore
+    # Bounds the ranged bodies being streamed out, which drain at the reader's pace
+    stream_semaphore: asyncio.Semaphore
+
+
+@register_storage("s3-async")
+class AsyncS3StorageService(StorageService):
+    """
+    S3 over aiobotocore: requests run on the event loop with a keep-alive connection pool
+    instead of occupying threads of the default executor, and bodies stream natively.
+    One client per event loop, as Celery tasks run each job in a fresh loop via asyncio.run.
+    """
+
+    def __init__(self):
+        self.settings = StorageSettings()
+        self._session = get_session()
+        self._config = AioConfig(
+            max_pool_connections=self.settings.async_max_pool_connections,
+            connector_args={"keepalive_timeout": self.settings.async_keepalive_seconds},
+            retries={"max_attempts": 3, "mode": "standard"},
+        )
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]" = weakref.WeakKeyDictionary()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        self._bucket_verified = False
+        # Signing URLs needs no I/O, so a plain botocore client does it
+        self.presigning_client = create_presigning_client(self.settings)
+
+    @property
+    def provider_name(self) -> str:
+        return "s3-async"
+
+    async def _loop_client(self) -> _LoopClient:
+        loop = asyncio.get_running_loop()
+        loop_client = self._clients.get(loop)
+        if loop_client is not None:
+            return loop_client
+
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            loop_client = self._clients.get(loop)
+            if loop_client is None:
+                exit_stack = AsyncExitStack()
+                client = await exit_stack.enter_async_context(self._session.create_client(
+                    "s3",
+                    aws_access_key_id=self.settings.access_key,
+                    aws_secret_access_key=self.settings.secret_key,
+                    endpoint_url=self.settings.endpoint_url,
+                    config=self._config,
+                ))
+                try:
+                    if not self._bucket_verified:
+                        await self._ensure_bucket(client)
+                except Exception as e:
+                    await exit_stack.aclose()
+                    raise StorageException("Error connecting to S3", e)
+                loop_client = _LoopClient(
+                    client,
+                    exit_stack,
+                    asyncio.Semaphore(self.settings.async_max_concurrency),
+                    asyncio.Semaphore(self.settings.async_max_streams),
+                )
+                self._clients[loop] = loop_client
+        return loop_client
+
+    async def _ensure_bucket(self, client):
+        """Verifies the bucket once per process, creating it if needed."""
+        try:
+            await client.head_bucket(Bucket=self.settings.bucket_name)
+        except ClientError:
+            await client.create_bucket(Bucket=self.settings.bucket_name)
+        self._bucket_verified = True
+        logger.info(f"Async S3 storage ready (bucket: {self.settings.bucket_name})")
+
+    async def close(self):
+        """Closes the client of the running loop and its connection pool."""
+        loop_client = self._clients.pop(asyncio.get_running_loop(), None)
+        if loop_client is not None:
+            await loop_client.exit_stack.aclose()
+
+    async def upload(self, file_path: Union[str, Path], file: bytes) -> bool:
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                await loop_client.client.put_object(Bucket=self.settings.bucket_name, Key=str(file_path), Body=file)
+            return True
+        except Exception as e:
+            raise StorageException("Error uploading to S3", e)
+
+    async def upload_stream(self, file_path: Union[str, Path], chunks: AsyncIterable[bytes]) -> int:
+        """
+        Buffers at most one part: files smaller than a part are sent with one PutObject,
+        larger ones as a multipart upload that is aborted if the stream fails.
+        """
+        loop_client = await self._loop_client()
+        client, semaphore = loop_client.client, loop_client.semaphore
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = self.settings.multipart_part_size_bytes
+        buffer = bytearray()
+        parts: List[Dict] = []
+        upload_id = None
+        size = 0
+
+        async def upload_part(body: bytes):
+            part_number = len(parts) + 1
+            async with semaphore:
+                response = await client.upload_part(
+                    Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+                )
+            parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        async with semaphore:
+                            upload_id = (await client.create_multipart_upload(Bucket=bucket, Key=key))["UploadId"]
+                    body = bytes(buffer[:part_size])
+                    del buffer[:part_size]
+                    await upload_part(body)
+
+            if upload_id is None:
+                async with semaphore:
+                    await client.put_object(Bucket=bucket, Key=key, Body=bytes(buffer))
+                return size
+
+            if buffer:
+                await upload_part(bytes(buffer))
+            async with semaphore:
+                await client.complete_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+                )
+            return size
+        except BaseException as e:
+            if upload_id is not None:
+                try:
+                    await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+                except Exception as abort_error:
+                    logger.warning(f"Failed to abort multipart upload of {key}: {abort_error}")
+            if isinstance(e, (StorageException, asyncio.CancelledError)):
+                raise
+            raise StorageException("Error uploading to S3", e)
+
+    async def create_direct_upload(
+        self, file_path: Union[str, Path], size: int, expires_in: int
+    ) -> Optional[DirectUpload]:
+        """One presigned PUT for files up to one part, otherwise a multipart upload with a URL per part."""
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = direct_upload_part_size(size, self.settings.multipart_part_size_bytes)
+        if size <= part_size:
+            return presign_put(self.presigning_client, bucket, key, expires_in)
+
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                upload_id = (await loop_client.client.create_multipart_upload(Bucket=bucket, Key=key))["UploadId"]
+        except Exception as e:
+            raise StorageException("Error creating direct upload in S3", e)
+        return presign_parts(self.presigning_client, bucket, key, upload_id, size, part_size, expires_in)
+
+    async def complete_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str, size: int):
+        """
+        Completes the upload with the parts S3 received, so the client need not report their ETags.
+        Nothing is completed until they add up to `size`, so an early call can simply be retried.
+        """
+        loop_client = await self._loop_client()
+        bucket, key = self.settings.bucket_name, str(file_path)
+        try:
+            parts = []
+            async with loop_client.semaphore:
+                async for page in loop_client.client.get_paginator("list_parts").paginate(
+                    Bucket=bucket, Key=key, UploadId=multipart_upload_id
+                ):
+                    parts.extend(page.get("Parts", []))
+                check_parts_received(key, parts, size)
+                await loop_client.client.complete_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=multipart_upload_id, MultipartUpload=completed_parts(parts)
+                )
+        except StorageException:
+            raise
+        except Exception as e:
+            raise StorageException("Error completing direct upload in S3", e)
+
+    async def abort_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str):
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                await loop_client.client.abort_multipart_upload(
+                    Bucket=self.settings.bucket_name, Key=str(file_path), UploadId=multipart_upload_id
+                )
+        except Exception as e:
+            raise StorageException("Error aborting direct upload in S3", e)
+
+    async def start_chunked_upload(self, file_path: Union[str, Path], size: int) -> ChunkedUpload:
+        """Each chunk becomes one part of a multipart upload, so chunks are sized like parts."""
+        loop_client = await self._loop_client()
+        chunk_size = direct_upload_part_size(size, self.settings.multipart_part_size_bytes)
+        try:
+            async with loop_client.semaphore:
+                response = await loop_client.client.create_multipart_upload(
+                    Bucket=self.settings.bucket_name, Key=str(file_path)
+                )
+        except Exception as e:
+            raise StorageException("Error starting chunked upload in S3", e)
+        return ChunkedUpload(chunk_size=chunk_size, multipart_upload_id=response["UploadId"])
+
+    async def upload_chunk(self, file_path: Union[str, Path], upload: ChunkedUpload, offset: int, data: bytes):
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                await loop_client.client.upload_part(
+                    Bucket=self.settings.bucket_name, Key=str(file_path), UploadId=upload.multipart_upload_id,
+                    PartNumber=upload.part_number(offset), Body=data,
+                )
+        except Exception as e:
+            raise StorageException("Error uploading chunk to S3", e)
+
+    async def complete_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload, size: int):
+        await self.complete_direct_upload(file_path, upload.multipart_upload_id, size)
+
+    async def abort_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload):
+        await self.abort_direct_upload(file_path, upload.multipart_upload_id)
+
+    async def download(self, file_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
+        """
+        The first part doubles as a probe of the object's size: objects up to one part come back
+        in that request, larger ones are fetched as concurrent byte ranges pinned to its ETag.
+        """
+        loop_client = await self._loop_client()
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = self.settings.download_part_size_bytes
+
+        async def _get(**kwargs) -> Tuple[Dict, bytes]:
+            async with loop_client.semaphore:
+                response = await loop_client.client.get_object(Bucket=bucket, Key=key, **kwargs)
+                async with response["Body"] as body:
+                    return response, await body.read()
+
+        async def _fetch(start: int, end: int) -> bytes:
+            _, data = await _get(Range=f"bytes={start}-{end}", IfMatch=first["ETag"])
+            return data
+
+        try:
+            try:
+                first, data = await _get(Range=f"bytes=0-{part_size - 1}")
+            except ClientError as e:
+                if _is_not_found(e):
+                    return None
+                if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                    raise
+                # Empty objects have no satisfiable range
+                first, data = await _get()
+
+            size = object_size(first.get("ContentRange"), len(data))
+            if size > len(data):
+                data = await download_ranges(
+                    _fetch, size, part_size, self.settings.download_concurrency, prefix=data
+                )
+            return data, key.split("/")[-1]
+        except StorageException:
+            raise
+        except Exception as e:
+            raise StorageException("Error downloading from S3", e)
+
+    async def stat(self, file_path: Union[str, Path]) -> Optional[FileMetadata]:
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                response = await loop_client.client.head_object(Bucket=self.settings.bucket_name, Key=str(file_path))
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise StorageException("Error reading object metadata from S3", e)
+        except Exception as e:
+            raise StorageException("Error reading object metadata from S3", e)
+        return FileMetadata(
+            size=response["ContentLength"],
+            last_modified=response["LastModified"],
+            etag=response.get("ETag"),
+            content_type=response.get("ContentType"),
+        )
+
+    async def iter_range(
+        self, file_path: Union[str, Path], start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams a ranged GetObject body. The request takes a slot of the concurrency limit until
+        the headers arrive; draining the body (at playback speed for video streams) only holds a
+        slot of the separate stream limit, so slow readers cannot starve uploads and other calls.
+        """
+        loop_client = await self._loop_client()
+        async with loop_client.stream_semaphore:
+            async with loop_client.semaphore:
+                try:
+                    response = await loop_client.client.get_object(
+                        Bucket=self.settings.bucket_name, Key=str(file_path), Range=f"bytes={start}-{end}"
+                    )
+                except Exception as e:
+                    raise StorageException("Error downloading from S3", e)
+            async with response["Body"] as body:
+                try:
+                    while chunk := await body.read(chunk_size):
+                        yield chunk
+                except Exception as e:
+                    raise StorageException("Error downloading from S3", e)
+
+    async def move(self, source: Union[str, Path], destination: Union[str, Path]):
+        """A server-side copy and a delete. CopyObject takes objects of up to 5 GB, far above the upload limit."""
+        loop_client = await self._loop_client()
+        bucket = self.settings.bucket_name
+        try:
+            async with loop_client.semaphore:
+                await loop_client.client.copy_object(
+                    Bucket=bucket, Key=str(destination), CopySource={"Bucket": bucket, "Key": str(source)}
+                )
+                await loop_client.client.delete_object(Bucket=bucket, Key=str(source))
+        except Exception as e:
+            raise StorageException("Error moving object in S3", e)
+
+    async def list_files(self, prefix: str, page_size: int = LIST_PAGE_SIZE) -> AsyncIterator[List[StoredFile]]:
+        """One ListObjectsV2 request per page; the concurrency limit is held per request, not while the caller works."""
+        loop_client = await self._loop_client()
+        pages = loop_client.client.get_paginator("list_objects_v2").paginate(
+            Bucket=self.settings.bucket_name, Prefix=prefix, PaginationConfig={"PageSize": page_size}
+        ).__aiter__()
+        while True:
+            try:
+                async with loop_client.semaphore:
+                    response = await pages.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                raise StorageException("Error listing objects in S3", e)
+            page = [
+                StoredFile(path=entry["Key"], size=entry["Size"], last_modified=entry["LastModified"])
+                for entry in response.get("Contents", [])
+            ]
+            if page:
+                yield page
+
+    async def delete(self, file_path: Union[str, Path]) -> bool:
+        loop_client = await self._loop_client()
+        try:
+            async with loop_client.semaphore:
+                await loop_client.client.delete_object(Bucket=self.settings.bucket_name, Key=str(file_path))
+            return True
+        except ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise StorageException("Error deleting from S3", e)
+        except Exception as e:
+            raise StorageException("Error deleting from S3", e)
+
+    async def delete_many(self, file_paths: List[str]) -> int:
+        """
+        One DeleteObjects request per thousand keys. S3 reports keys that did not exist as
+        deleted; keys it failed to delete are logged and left out of the count.
+        """
+        loop_client = await self._loop_client()
+        deleted = 0
+        for start in range(0, len(file_paths), DELETE_BATCH_MAX_KEYS):
+            keys = file_paths[start:start + DELETE_BATCH_MAX_KEYS]
+            try:
+                async with loop_client.semaphore:
+                    response = await loop_client.client.delete_objects(
+                        Bucket=self.settings.bucket_name,
+                        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                    )
+            except Exception as e:
+                raise StorageException("Error deleting from S3", e)
+            errors = response.get("Errors", [])
+            if errors:
+                logger.warning(f"Failed to delete {len(errors)} objects from S3, e.g. {errors[0].get('Key')}: "
+                               f"{errors[0].get('Message')}")
+            deleted += len(keys) - len(errors)
+        return deleted
+
+    async def exists(self, file_path: Union[str, Path]) -> bool:
+        return await self.stat(file_path) is not None
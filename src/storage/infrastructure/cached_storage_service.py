@@ -0,0 +1,280 @@
+# src/storage/infrastructure/cached_storage_service.py
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from src.metrics.application.metrics_service import MetricsService
+from src.storage.application.storage_service import LIST_PAGE_SIZE, RANGE_CHUNK_BYTES, StorageService
+from src.storage.domain.direct_upload import ChunkedUpload, DirectUpload
+from src.storage.domain.file_metadata import FileMetadata, StoredFile
+
+logger = logging.getLogger(__name__)
+
+# Entries being written have this prefix until they are renamed into place
+TEMP_PREFIX = ".tmp-"
+# Leftovers of writers that crashed are removed once this old
+STALE_TEMP_SECONDS = 3600
+# Eviction frees space down to this fraction of the budget, so a full cache is not rescanned on every insert
+EVICTION_TARGET = 0.9
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # Downloads that waited for the same key's download in flight instead of fetching it again
+    coalesced: int = 0
+    bytes_fetched: int = 0
+    bytes_evicted: int = 0
+
+
+class CachedStorageService(StorageService):
+    """
+    Read-through cache of downloads on local disk, in front of any storage service.
+
+    Entries are written under a temporary name, synced and renamed into place, so a reader
+    never sees a partial file. Recency is the entry's mtime, bumped on every hit, which lets
+    the worker processes of a host share one directory: whichever fills it past the byte
+    budget evicts the least recently used entries. Concurrent downloads of one key within a
+    process share a single fetch. Stored objects are never rewritten with other content (their
+    keys hold the video id or the content hash), so writes only invalidate this process's entry.
+    Lookups, evictions and bytes moved are counted in `stats` and, given a metrics service, exported.
+    """
+
+    def __init__(
+        self,
+        inner: StorageService,
+        directory: Union[str, Path],
+        max_bytes: int,
+        metrics_service: Optional[MetricsService] = None,
+    ):
+        self.inner = inner
+        self.directory = Path(directory) / inner.provider_name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.metrics_service = metrics_service
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+        self._eviction_lock = threading.Lock()
+        # Size of the directory as last measured, plus what this process has added since
+        self._estimated_bytes = 0
+        self._evict()
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    def _entry_path(self, file_path: Union[str, Path]) -> Path:
+        return self.directory / hashlib.sha256(str(file_path).encode("utf-8")).hexdigest()
+
+    async def download(self, file_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
+        key = str(file_path)
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._inflight.get((loop, key))
+            if future is None:
+                break
+            try:
+                result = await asyncio.shield(future)
+                self.stats.coalesced += 1
+                if self.metrics_service:
+                    self.metrics_service.increment_storage_cache_lookup(self.provider_name, "coalesced")
+                return result
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Only the download this call was waiting for was cancelled: fetch the file here instead
+
+        future = loop.create_future()
+        self._inflight[(loop, key)] = future
+        try:
+            result = await self._read_through(key)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved, whether or not another download was waiting for it
+            raise
+        finally:
+            del self._inflight[(loop, key)]
+
+    async def _read_through(self, key: str) -> Optional[Tuple[bytes, str]]:
+        path = self._entry_path(key)
+        data = await asyncio.to_thread(self._read_entry, path)
+        if data is not None:
+            self.stats.hits += 1
+            if self.metrics_service:
+                self.metrics_service.increment_storage_cache_lookup(self.provider_name, "hit")
+            return data, PurePosixPath(key).name
+
+        self.stats.misses += 1
+        if self.metrics_service:
+            self.metrics_service.increment_storage_cache_lookup(self.provider_name, "miss")
+        downloaded = await self.inner.download(key)
+        if downloaded is None:
+            return None
+        self.stats.bytes_fetched += len(downloaded[0])
+        if self.metrics_service:
+            self.metrics_service.increment_storage_cache_fetched_bytes(self.provider_name, len(downloaded[0]))
+        if len(downloaded[0]) <= self.max_bytes * EVICTION_TARGET:
+            try:
+                await asyncio.to_thread(self._store_entry, path, downloaded[0])
+            except OSError as e:
+                logger.warning(f"Could not cache {key}: {e}")
+        return downloaded
+
+    @staticmethod
+    def _read_entry(path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # Evicted by another process while it was read
+        return data
+
+    def _store_entry(self, path: Path, data: bytes):
+        temp_path = path.with_name(f"{TEMP_PREFIX}{uuid.uuid4().hex}")
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        with self._eviction_lock:
+            self._estimated_bytes += len(data)
+            over_budget = self._estimated_bytes > self.max_bytes
+        if over_budget:
+            self._evict()
+
+    def _evict(self):
+        """Deletes the least recently used entries until the directory is back under its target size."""
+        with self._eviction_lock:
+            entries = []
+            stale_before = time.time() - STALE_TEMP_SECONDS
+            for entry in os.scandir(self.directory):
+                try:
+                    stat = entry.stat()
+                    if entry.name.startswith(TEMP_PREFIX):
+                        if stat.st_mtime < stale_before:
+                            os.unlink(entry.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            evicted, freed = 0, 0
+            if total > self.max_bytes:
+                target = self.max_bytes * EVICTION_TARGET
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass  # Evicted by another process
+                    total -= size
+                    evicted += 1
+                    freed += size
+            self._estimated_bytes = total
+            self.stats.evictions += evicted
+            self.stats.bytes_evicted += freed
+        if evicted:
+            if self.metrics_service:
+                self.metrics_service.increment_storage_cache_evictions(self.provider_name, evicted, freed)
+            logger.info(f"Evicted {evicted} entries ({freed} bytes) from the {self.provider_name} cache: {self.stats}")
+
+    async def _invalidate(self, file_path: Union[str, Path]):
+        await asyncio.to_thread(self._entry_path(file_path).unlink, missing_ok=True)
+
+    async def upload(self, file_path: Union[str, Path], file: bytes) -> bool:
+        result = await self.inner.upload(file_path, file)
+        await self._invalidate(file_path)
+        return result
+
+    async def upload_stream(self, file_path: Union[str, Path], chunks: AsyncIterable[bytes]) -> int:
+        size = await self.inner.upload_stream(file_path, chunks)
+        await self._invalidate(file_path)
+        return size
+
+    async def create_direct_upload(
+        self, file_path: Union[str, Path], size: int, expires_in: int
+    ) -> Optional[DirectUpload]:
+        return await self.inner.create_direct_upload(file_path, size, expires_in)
+
+    async def complete_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str, size: int):
+        await self.inner.complete_direct_upload(file_path, multipart_upload_id, size)
+        await self._invalidate(file_path)
+
+    async def abort_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str):
+        await self.inner.abort_direct_upload(file_path, multipart_upload_id)
+
+    async def start_chunked_upload(self, file_path: Union[str, Path], size: int) -> ChunkedUpload:
+        return await self.inner.start_chunked_upload(file_path, size)
+
+    async def upload_chunk(self, file_path: Union[str, Path], upload: ChunkedUpload, offset: int, data: bytes):
+        await self.inner.upload_chunk(file_path, upload, offset, data)
+
+    async def complete_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload, size: int):
+        await self.inner.complete_chunked_upload(file_path, upload, size)
+        await self._invalidate(file_path)
+
+    async def abort_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload):
+        await self.inner.abort_chunked_upload(file_path, upload)
+
+    async def stat(self, file_path: Union[str, Path]) -> Optional[FileMetadata]:
+        return await self.inner.stat(file_path)
+
+    async def iter_range(
+        self, file_path: Union[str, Path], start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self.inner.iter_range(file_path, start, end, chunk_size):
+            yield chunk
+
+    def local_path(self, file_path: Union[str, Path]) -> Optional[Path]:
+        return self.inner.local_path(file_path)
+
+    async def move(self, source: Union[str, Path], destination: Union[str, Path]):
+        await self.inner.move(source, destination)
+        await self._invalidate(source)
+        await self._invalidate(destination)
+
+    async def list_files(self, prefix: str, page_size: int = LIST_PAGE_SIZE) -> AsyncIterator[List[StoredFile]]:
+        async for page in self.inner.list_files(prefix, page_size):
+            yield page
+
+    async def delete(self, file_path: Union[str, Path]) -> bool:
+        deleted = await self.inner.delete(file_path)
+        await self._invalidate(file_path)
+        return deleted
+
+    async def delete_many(self, file_paths: List[str]) -> int:
+        deleted = await self.inner.delete_many(file_paths)
+        for file_path in file_paths:
+            await self._invalidate(file_path)
+        return deleted
+
+    async def exists(self, file_path: Union[str, Path]) -> bool:
+        return await self.inner.exists(file_path)
+
+    async def close(self):
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            await close()
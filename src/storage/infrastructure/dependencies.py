@@ -1,16 +1,28 @@
 # src/storage/infrastructure/dependencies.py
 
-from typing import Dict, Type, List, Callable
+from typing import Awaitable, Dict, Iterable, Type, TypeVar, List, Callable
 
+from src.metrics.application.metrics_service import MetricsService
+from src.metrics.infrastructure.prometheus_provider import get_prometheus_metrics_provider
+from src.shared.config.storage_settings import StorageCacheSettings
 from src.storage.application.storage_service import StorageService
+from src.storage.infrastructure.cached_storage_service import CachedStorageService
 import importlib
+import logging
 import pkgutil
 import pathlib
+import threading
+
+logger = logging.getLogger(__name__)
 
 # Service registry
 _storage_registry: Dict[str, Type[StorageService]] = {}
 _plugins_loaded = False  # Ensures plugins are loaded only once
 
+# One instance per provider and process: building one creates a client and may verify the bucket
+_storage_instances: Dict[str, StorageService] = {}
+_instances_lock = threading.Lock()
+
 # Type alias for the factory that creates a storage service instance
 StorageServiceFactory = Callable[[str], StorageService]
 
@@ -30,11 +42,67 @@ def get_available_storage_providers() -> List[str]:
 
 
 def create_storage_service(provider: str) -> StorageService:
-    """Factory function to create a storage service instance by name."""
+    """Factory function returning the process-wide storage service instance for a provider."""
+    instance = _storage_instances.get(provider)
+    if instance is not None:
+        return instance
+
     _load_storage_plugins()
     if provider not in _storage_registry:
         raise ValueError(f"Storage provider '{provider}' is not registered")
-    return _storage_registry[provider]()
+    with _instances_lock:
+        if provider not in _storage_instances:
+            _storage_instances[provider] = _build_storage_service(provider)
+        return _storage_instances[provider]
+
+
+def _build_storage_service(provider: str) -> StorageService:
+    """Instantiates a provider, behind the disk cache when one is configured for it."""
+    instance = _storage_registry[provider]()
+    cache_settings = StorageCacheSettings()
+    if cache_settings.directory and provider in cache_settings.provider_names:
+        instance = CachedStorageService(
+            instance,
+            cache_settings.directory,
+            cache_settings.max_size_bytes,
+            metrics_service=MetricsService(provider=get_prometheus_metrics_provider()),
+        )
+        logger.info(f"Caching {provider} downloads in {instance.directory} (up to {cache_settings.max_size_mb} MB)")
+    return instance
+
+
+def warm_up_storage_services(providers: Iterable[str]):
+    """Builds the given providers up front, so client setup and bucket checks are not paid by a request."""
+    for provider in providers:
+        create_storage_service(provider)
+
+
+async def close_storage_services():
+    """
+    Releases the connection pools that providers (e.g. s3-async) hold on the running loop:
+    on shutdown, and at the end of each job that runs in a loop of its own.
+    """
+    for instance in list(_storage_instances.values()):
+        close = getattr(instance, "close", None)
+        if close is not None:
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Failed to close storage service {instance.provider_name}: {e}")
+
+
+T = TypeVar("T")
+
+
+async def run_closing_storage_services(job: Awaitable[T]) -> T:
+    """
+    Runs a job passed to asyncio.run, then closes the storage clients it opened: they are
+    bound to its loop, which is discarded afterwards (as Celery tasks do for every job).
+    """
+    try:
+        return await job
+    finally:
+        await close_storage_services()
 
 
 def get_storage_service_factory() -> StorageServiceFactory:
@@ -55,6 +123,10 @@ def _load_storage_plugins():
         if module_name.startswith("_"):
             continue
         full_module_name = f"{package_name}.{module_name}"
-        importlib.import_module(full_module_name)
+        try:
+            importlib.import_module(full_module_name)
+        except ImportError as e:
+            # Providers with missing optional dependencies (e.g. aiobotocore) are skipped
+            logger.warning(f"Skipping storage plugin {full_module_name}: {e}")
 
     _plugins_loaded = True
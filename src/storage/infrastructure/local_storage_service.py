@@ -1,9 +1,17 @@
 # src/storage/infrastructure/local_storage_service.py
-from src.storage.application.storage_service import StorageService, StorageException
+from src.storage.application.storage_service import (
+    LIST_PAGE_SIZE, RANGE_CHUNK_BYTES, RESUMABLE_CHUNK_BYTES, StorageService, StorageException,
+)
+from src.storage.application.upload_stream import IncompleteUploadError
+from src.storage.domain.direct_upload import ChunkedUpload, direct_upload_part_size
+from src.storage.domain.file_metadata import FileMetadata, StoredFile
 from src.storage.infrastructure.dependencies import register_storage
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union, Optional, Tuple
+from typing import AsyncIterable, AsyncIterator, Iterator, List, Union, Optional, Tuple
 import asyncio
+import itertools
+import os
 
 
 @register_storage("local")
@@ -29,6 +37,83 @@ class LocalStorageService(StorageService):
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(file)
 
+    async def upload_stream(self, file_path: Union[str, Path], chunks: AsyncIterable[bytes]) -> int:
+        """Writes the chunks as they arrive to a temporary file that replaces the target once complete."""
+        path = self.root / file_path
+        partial_path = self._partial_path(path)
+        size = 0
+        try:
+            await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+            handle = await asyncio.to_thread(open, partial_path, "wb")
+            try:
+                async for chunk in chunks:
+                    await asyncio.to_thread(handle.write, chunk)
+                    size += len(chunk)
+            finally:
+                await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(os.replace, partial_path, path)
+            return size
+        except BaseException as e:
+            await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+            if isinstance(e, (StorageException, asyncio.CancelledError)):
+                raise
+            raise StorageException("Error saving file locally", e)
+
+    @staticmethod
+    def _partial_path(path: Path) -> Path:
+        """Where a file is written until it is complete."""
+        return path.with_name(f"{path.name}.part")
+
+    async def start_chunked_upload(self, file_path: Union[str, Path], size: int) -> ChunkedUpload:
+        partial_path = self._partial_path(self.root / file_path)
+        try:
+            await asyncio.to_thread(partial_path.parent.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(partial_path.write_bytes, b"")
+        except Exception as e:
+            raise StorageException("Error starting chunked upload locally", e)
+        return ChunkedUpload(chunk_size=direct_upload_part_size(size, RESUMABLE_CHUNK_BYTES))
+
+    async def upload_chunk(self, file_path: Union[str, Path], upload: ChunkedUpload, offset: int, data: bytes):
+        """Writes the chunk at its offset in the temporary file, dropping anything an interrupted write left past it."""
+        partial_path = self._partial_path(self.root / file_path)
+        try:
+            await asyncio.to_thread(self._sync_write_at, partial_path, offset, data)
+        except StorageException:
+            raise
+        except Exception as e:
+            raise StorageException("Error saving chunk locally", e)
+
+    def _sync_write_at(self, path: Path, offset: int, data: bytes):
+        """Synchronous implementation of the chunk write."""
+        with open(path, "r+b") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size < offset:
+                raise StorageException(f"Cannot write at offset {offset} of {path.name}, it has {size} bytes")
+            handle.truncate(offset)
+            handle.seek(offset)
+            handle.write(data)
+
+    async def complete_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload, size: int):
+        path = self.root / file_path
+        partial_path = self._partial_path(path)
+        try:
+            received = (await asyncio.to_thread(partial_path.stat)).st_size
+        except FileNotFoundError:
+            raise StorageException(f"Chunked upload of {file_path} not found")
+        if received != size:
+            raise IncompleteUploadError(f"Upload of {file_path} is incomplete: {received} of {size} bytes received")
+        try:
+            await asyncio.to_thread(os.replace, partial_path, path)
+        except Exception as e:
+            raise StorageException("Error completing chunked upload locally", e)
+
+    async def abort_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload):
+        partial_path = self._partial_path(self.root / file_path)
+        try:
+            await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+        except Exception as e:
+            raise StorageException("Error aborting chunked upload locally", e)
+
     async def download(self, file_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
         path = self.root / file_path
         try:
@@ -43,6 +128,81 @@ class LocalStorageService(StorageService):
         """Synchronous implementation of the download."""
         return path.read_bytes()
 
+    async def stat(self, file_path: Union[str, Path]) -> Optional[FileMetadata]:
+        path = self.root / file_path
+        try:
+            stat_result = await asyncio.to_thread(path.stat)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            raise StorageException("Error reading file metadata locally", e)
+        return FileMetadata(
+            size=stat_result.st_size,
+            last_modified=datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc),
+        )
+
+    async def iter_range(
+        self, file_path: Union[str, Path], start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ) -> AsyncIterator[bytes]:
+        path = self.root / file_path
+        try:
+            handle = await asyncio.to_thread(open, path, "rb")
+        except Exception as e:
+            raise StorageException("Error reading file locally", e)
+        try:
+            await asyncio.to_thread(handle.seek, start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await asyncio.to_thread(handle.read, min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(handle.close)
+
+    def local_path(self, file_path: Union[str, Path]) -> Optional[Path]:
+        return self.root / file_path
+
+    async def move(self, source: Union[str, Path], destination: Union[str, Path]):
+        destination_path = self.root / destination
+        try:
+            await asyncio.to_thread(destination_path.parent.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(os.replace, self.root / source, destination_path)
+        except Exception as e:
+            raise StorageException("Error moving file locally", e)
+
+    async def list_files(self, prefix: str, page_size: int = LIST_PAGE_SIZE) -> AsyncIterator[List[StoredFile]]:
+        """Walks the directory the prefix points into, one page per executor call."""
+        files = self._sync_walk(prefix)
+        while True:
+            try:
+                page = await asyncio.to_thread(lambda: list(itertools.islice(files, page_size)))
+            except Exception as e:
+                raise StorageException("Error listing files locally", e)
+            if not page:
+                return
+            yield page
+
+    def _sync_walk(self, prefix: str) -> Iterator[StoredFile]:
+        """Synchronous implementation of the listing, including partial files of unfinished uploads."""
+        for directory, dirnames, filenames in os.walk(self.root / prefix.rpartition("/")[0]):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = Path(directory, name)
+                key = path.relative_to(self.root).as_posix()
+                if not key.startswith(prefix):
+                    continue
+                try:
+                    stat_result = path.stat()
+                except FileNotFoundError:
+                    continue  # Deleted since the directory was read
+                yield StoredFile(
+                    path=key,
+                    size=stat_result.st_size,
+                    last_modified=datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc),
+                )
+
     async def delete(self, file_path: Union[str, Path]) -> bool:
         path = self.root / file_path
         try:
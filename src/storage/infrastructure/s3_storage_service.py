@@ -1,18 +1,35 @@
 # src/storage/infrastructure/s3_storage_service.py
 import asyncio
+import logging
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from src.storage.application.storage_service import StorageService, StorageException
+from src.storage.application.ranged_download import download_ranges, object_size
+from src.storage.application.storage_service import (
+    DELETE_BATCH_MAX_KEYS, LIST_PAGE_SIZE, RANGE_CHUNK_BYTES, StorageService, StorageException,
+)
+from src.storage.domain.direct_upload import ChunkedUpload, DirectUpload, direct_upload_part_size
+from src.storage.domain.file_metadata import FileMetadata, StoredFile
+from src.storage.infrastructure._s3_presigning import (
+    check_parts_received, completed_parts, create_presigning_client, presign_parts, presign_put,
+)
 from src.storage.infrastructure.dependencies import register_storage
 from src.shared.config.storage_settings import StorageSettings
 
 from pathlib import Path
-from typing import Union, Optional, Tuple
+from typing import AsyncIterable, AsyncIterator, Dict, List, Union, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 @register_storage("s3")
 class S3StorageService(StorageService):
+    """
+    Built once per process by the storage factory, so the client (and its connection pool)
+    is shared and the bucket is verified only at startup.
+    """
+
     def __init__(self):
         self.settings = StorageSettings()
         self.client = boto3.client(
@@ -20,11 +37,14 @@ class S3StorageService(StorageService):
             aws_access_key_id=self.settings.access_key,
             aws_secret_access_key=self.settings.secret_key,
             endpoint_url=self.settings.endpoint_url,
+            config=Config(max_pool_connections=self.settings.max_pool_connections),
         )
         try:
             self.client.head_bucket(Bucket=self.settings.bucket_name)
         except ClientError:
             self.client.create_bucket(Bucket=self.settings.bucket_name)
+        self.presigning_client = create_presigning_client(self.settings)
+        logger.info(f"S3 storage ready (bucket: {self.settings.bucket_name})")
 
     @property
     def provider_name(self) -> str:
@@ -46,25 +66,263 @@ class S3StorageService(StorageService):
         except Exception as e:
             raise StorageException("Error uploading to S3", e)
 
+    async def upload_stream(self, file_path: Union[str, Path], chunks: AsyncIterable[bytes]) -> int:
+        """
+        Buffers at most one part: files smaller than a part are sent with one PutObject,
+        larger ones as a multipart upload that is aborted if the stream fails.
+        """
+        loop = asyncio.get_event_loop()
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = self.settings.multipart_part_size_bytes
+        buffer = bytearray()
+        parts: List[Dict] = []
+        upload_id = None
+        size = 0
+
+        def _upload_part(part_number: int, body: bytes) -> Dict:
+            response = self.client.upload_part(
+                Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        response = await loop.run_in_executor(
+                            None, lambda: self.client.create_multipart_upload(Bucket=bucket, Key=key)
+                        )
+                        upload_id = response["UploadId"]
+                    body = bytes(buffer[:part_size])
+                    del buffer[:part_size]
+                    parts.append(await loop.run_in_executor(None, _upload_part, len(parts) + 1, body))
+
+            if upload_id is None:
+                body = bytes(buffer)
+                await loop.run_in_executor(None, lambda: self.client.put_object(Bucket=bucket, Key=key, Body=body))
+                return size
+
+            if buffer:
+                parts.append(await loop.run_in_executor(None, _upload_part, len(parts) + 1, bytes(buffer)))
+            await loop.run_in_executor(None, lambda: self.client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            ))
+            return size
+        except BaseException as e:
+            if upload_id is not None:
+                try:
+                    await loop.run_in_executor(None, lambda: self.client.abort_multipart_upload(
+                        Bucket=bucket, Key=key, UploadId=upload_id
+                    ))
+                except Exception as abort_error:
+                    logger.warning(f"Failed to abort multipart upload of {key}: {abort_error}")
+            if isinstance(e, (StorageException, asyncio.CancelledError)):
+                raise
+            raise StorageException("Error uploading to S3", e)
+
+    async def create_direct_upload(
+        self, file_path: Union[str, Path], size: int, expires_in: int
+    ) -> Optional[DirectUpload]:
+        """One presigned PUT for files up to one part, otherwise a multipart upload with a URL per part."""
+        loop = asyncio.get_event_loop()
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = direct_upload_part_size(size, self.settings.multipart_part_size_bytes)
+
+        def _create() -> DirectUpload:
+            if size <= part_size:
+                return presign_put(self.presigning_client, bucket, key, expires_in)
+            upload_id = self.client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+            return presign_parts(self.presigning_client, bucket, key, upload_id, size, part_size, expires_in)
+
+        try:
+            return await loop.run_in_executor(None, _create)
+        except Exception as e:
+            raise StorageException("Error creating direct upload in S3", e)
+
+    async def complete_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str, size: int):
+        """
+        Completes the upload with the parts S3 received, so the client need not report their ETags.
+        Nothing is completed until they add up to `size`, so an early call can simply be retried.
+        """
+        loop = asyncio.get_event_loop()
+        bucket, key = self.settings.bucket_name, str(file_path)
+
+        def _complete():
+            parts = []
+            for page in self.client.get_paginator("list_parts").paginate(
+                Bucket=bucket, Key=key, UploadId=multipart_upload_id
+            ):
+                parts.extend(page.get("Parts", []))
+            check_parts_received(key, parts, size)
+            self.client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=multipart_upload_id, MultipartUpload=completed_parts(parts)
+            )
+
+        try:
+            await loop.run_in_executor(None, _complete)
+        except StorageException:
+            raise
+        except Exception as e:
+            raise StorageException("Error completing direct upload in S3", e)
+
+    async def abort_direct_upload(self, file_path: Union[str, Path], multipart_upload_id: str):
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, lambda: self.client.abort_multipart_upload(
+                Bucket=self.settings.bucket_name, Key=str(file_path), UploadId=multipart_upload_id
+            ))
+        except Exception as e:
+            raise StorageException("Error aborting direct upload in S3", e)
+
+    async def start_chunked_upload(self, file_path: Union[str, Path], size: int) -> ChunkedUpload:
+        """Each chunk becomes one part of a multipart upload, so chunks are sized like parts."""
+        loop = asyncio.get_event_loop()
+        chunk_size = direct_upload_part_size(size, self.settings.multipart_part_size_bytes)
+        try:
+            response = await loop.run_in_executor(None, lambda: self.client.create_multipart_upload(
+                Bucket=self.settings.bucket_name, Key=str(file_path)
+            ))
+        except Exception as e:
+            raise StorageException("Error starting chunked upload in S3", e)
+        return ChunkedUpload(chunk_size=chunk_size, multipart_upload_id=response["UploadId"])
+
+    async def upload_chunk(self, file_path: Union[str, Path], upload: ChunkedUpload, offset: int, data: bytes):
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, lambda: self.client.upload_part(
+                Bucket=self.settings.bucket_name, Key=str(file_path), UploadId=upload.multipart_upload_id,
+                PartNumber=upload.part_number(offset), Body=data,
+            ))
+        except Exception as e:
+            raise StorageException("Error uploading chunk to S3", e)
+
+    async def complete_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload, size: int):
+        await self.complete_direct_upload(file_path, upload.multipart_upload_id, size)
+
+    async def abort_chunked_upload(self, file_path: Union[str, Path], upload: ChunkedUpload):
+        await self.abort_direct_upload(file_path, upload.multipart_upload_id)
+
     async def download(self, file_path: Union[str, Path]) -> Optional[Tuple[bytes, str]]:
+        """
+        The first part doubles as a probe of the object's size: objects up to one part come back
+        in that request, larger ones are fetched as concurrent byte ranges pinned to its ETag, so an
+        overwrite during the download fails it instead of mixing versions.
+        """
         loop = asyncio.get_event_loop()
+        bucket, key = self.settings.bucket_name, str(file_path)
+        part_size = self.settings.download_part_size_bytes
+
+        def _get(**kwargs) -> Tuple[Dict, bytes]:
+            response = self.client.get_object(Bucket=bucket, Key=key, **kwargs)
+            return response, response["Body"].read()
 
-        def _download():
+        async def _fetch(start: int, end: int) -> bytes:
+            _, data = await loop.run_in_executor(
+                None, lambda: _get(Range=f"bytes={start}-{end}", IfMatch=first["ETag"])
+            )
+            return data
+
+        try:
             try:
-                response = self.client.get_object(
-                    Bucket=self.settings.bucket_name,
-                    Key=str(file_path)
+                first, data = await loop.run_in_executor(None, lambda: _get(Range=f"bytes=0-{part_size - 1}"))
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code in ("NoSuchKey", "404"):
+                    return None
+                if code != "InvalidRange":
+                    raise
+                # Empty objects have no satisfiable range
+                first, data = await loop.run_in_executor(None, _get)
+
+            size = object_size(first.get("ContentRange"), len(data))
+            if size > len(data):
+                data = await download_ranges(
+                    _fetch, size, part_size, self.settings.download_concurrency, prefix=data
                 )
-                content = response["Body"].read()
-                filename = str(file_path).split('/')[-1]
-                return content, filename
-            except self.client.exceptions.NoSuchKey:
-                return None
+            return data, key.split("/")[-1]
+        except StorageException:
+            raise
+        except Exception as e:
+            raise StorageException("Error downloading from S3", e)
+
+    async def stat(self, file_path: Union[str, Path]) -> Optional[FileMetadata]:
+        loop = asyncio.get_event_loop()
+
+        def _stat():
+            try:
+                response = self.client.head_object(Bucket=self.settings.bucket_name, Key=str(file_path))
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                    return None
+                raise
+            return FileMetadata(
+                size=response["ContentLength"],
+                last_modified=response["LastModified"],
+                etag=response.get("ETag"),
+                content_type=response.get("ContentType"),
+            )
 
         try:
-            return await loop.run_in_executor(None, _download)
+            return await loop.run_in_executor(None, _stat)
+        except Exception as e:
+            raise StorageException("Error reading object metadata from S3", e)
+
+    async def iter_range(
+        self, file_path: Union[str, Path], start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ) -> AsyncIterator[bytes]:
+        """Streams a ranged GetObject body, one chunk per executor call."""
+        loop = asyncio.get_event_loop()
+        try:
+            response = await loop.run_in_executor(None, lambda: self.client.get_object(
+                Bucket=self.settings.bucket_name, Key=str(file_path), Range=f"bytes={start}-{end}"
+            ))
+        except Exception as e:
+            raise StorageException("Error downloading from S3", e)
+
+        body = response["Body"]
+        try:
+            while chunk := await loop.run_in_executor(None, body.read, chunk_size):
+                yield chunk
         except Exception as e:
             raise StorageException("Error downloading from S3", e)
+        finally:
+            body.close()
+
+    async def move(self, source: Union[str, Path], destination: Union[str, Path]):
+        """A server-side copy (multipart for large objects, by the transfer manager) and a delete."""
+        loop = asyncio.get_event_loop()
+        bucket = self.settings.bucket_name
+
+        def _move():
+            self.client.copy({"Bucket": bucket, "Key": str(source)}, bucket, str(destination))
+            self.client.delete_object(Bucket=bucket, Key=str(source))
+
+        try:
+            await loop.run_in_executor(None, _move)
+        except Exception as e:
+            raise StorageException("Error moving object in S3", e)
+
+    async def list_files(self, prefix: str, page_size: int = LIST_PAGE_SIZE) -> AsyncIterator[List[StoredFile]]:
+        """One ListObjectsV2 request per page, each run in the executor."""
+        loop = asyncio.get_event_loop()
+        pages = iter(self.client.get_paginator("list_objects_v2").paginate(
+            Bucket=self.settings.bucket_name, Prefix=prefix, PaginationConfig={"PageSize": page_size}
+        ))
+        while True:
+            try:
+                response = await loop.run_in_executor(None, next, pages, None)
+            except Exception as e:
+                raise StorageException("Error listing objects in S3", e)
+            if response is None:
+                return
+            page = [
+                StoredFile(path=entry["Key"], size=entry["Size"], last_modified=entry["LastModified"])
+                for entry in response.get("Contents", [])
+            ]
+            if page:
+                yield page
 
     async def delete(self, file_path: Union[str, Path]) -> bool:
         loop = asyncio.get_event_loop()
@@ -84,6 +342,29 @@ class S3StorageService(StorageService):
         except Exception as e:
             raise StorageException("Error deleting from S3", e)
 
+    async def delete_many(self, file_paths: List[str]) -> int:
+        """
+        One DeleteObjects request per thousand keys. S3 reports keys that did not exist as
+        deleted; keys it failed to delete are logged and left out of the count.
+        """
+        loop = asyncio.get_event_loop()
+        deleted = 0
+        for start in range(0, len(file_paths), DELETE_BATCH_MAX_KEYS):
+            keys = file_paths[start:start + DELETE_BATCH_MAX_KEYS]
+            try:
+                response = await loop.run_in_executor(None, lambda: self.client.delete_objects(
+                    Bucket=self.settings.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                ))
+            except Exception as e:
+                raise StorageException("Error deleting from S3", e)
+            errors = response.get("Errors", [])
+            if errors:
+                logger.warning(f"Failed to delete {len(errors)} objects from S3, e.g. {errors[0].get('Key')}: "
+                               f"{errors[0].get('Message')}")
+            deleted += len(keys) - len(errors)
+        return deleted
+
     async def exists(self, file_path: Union[str, Path]) -> bool:
         loop = asyncio.get_event_loop()
 
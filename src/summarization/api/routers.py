@@ -1,3 +1,5 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.auth.api.dependencies import get_current_user
@@ -6,7 +8,8 @@ from src.auth.domain.user import User
 from src.shared.dependencies import get_summarization_service, get_summary_queries
 from src.summarization.application.summarization_service import SummarizationService
 from src.summarization.application.queries.summary_queries import SummaryQueries
-from .schemas import SummaryResponse, SummaryRequest
+from src.summarization.domain.summary import SummaryLength
+from .schemas import SummaryChapterResponse, SummaryResponse, SummaryRequest
 
 router = APIRouter(prefix="/summaries", tags=["Summaries"])
 
@@ -20,11 +23,44 @@ async def request_summary(
     """Requests an asynchronous summarization for a given transcription."""
     await service.request_summary(
         transcription_id=str(summary_request.transcription_id),
-        provider=summary_request.provider
+        provider=summary_request.provider,
+        length=summary_request.length
     )
     return {"message": "Summarization request accepted"}
 
 
+@router.get(
+    "/transcriptions/{transcription_id}",
+    response_model=List[SummaryResponse],
+    summary="List the summary variants of a transcription"
+)
+async def list_summaries_by_transcription(
+    transcription_id: str,
+    queries: SummaryQueries = Depends(get_summary_queries),
+    _: User = Depends(get_current_user)
+):
+    """Retrieves every summary length produced for a transcription."""
+    return await queries.list_by_transcription_id(transcription_id)
+
+
+@router.get(
+    "/transcriptions/{transcription_id}/{length}",
+    response_model=SummaryResponse,
+    summary="Get a summary variant of a transcription"
+)
+async def get_summary_by_transcription(
+    transcription_id: str,
+    length: SummaryLength,
+    queries: SummaryQueries = Depends(get_summary_queries),
+    _: User = Depends(get_current_user)
+):
+    """Retrieves the summary of the given length for a transcription."""
+    summary = await queries.get_by_transcription_id(transcription_id, length)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Summary not found")
+    return summary
+
+
 @router.get("/{summary_id}", response_model=SummaryResponse, summary="Get a summary by its ID")
 async def get_summary_by_id(
     summary_id: str, 
@@ -35,3 +71,20 @@ async def get_summary_by_id(
     if not summary:
         raise HTTPException(status_code=404, detail="Summary not found")
     return summary
+
+
+@router.get(
+    "/{summary_id}/chapters",
+    response_model=List[SummaryChapterResponse],
+    summary="Get the chapters of a chapter summary"
+)
+async def get_summary_chapters(
+    summary_id: str,
+    queries: SummaryQueries = Depends(get_summary_queries),
+    _: User = Depends(get_current_user)
+):
+    """Retrieves the chapters summarized so far, in transcript order."""
+    summary = await queries.get_status(summary_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Summary not found")
+    return await queries.get_chapters(summary_id)
@@ -4,18 +4,33 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from src.summarization.domain.summary import SummaryLength
+
 
 class SummaryRequest(BaseModel):
     transcription_id: UUID
     provider: Optional[str] = "huggingface"
+    length: SummaryLength = SummaryLength.DETAILED
 
 
 class SummaryResponse(BaseModel):
     id: str
     transcription_id: str
+    length: SummaryLength
     status: str
+    provider: Optional[str] = None
     text: Optional[str] = None
     error_message: Optional[str] = None
 
     class Config:
         orm_mode = True
+
+
+class SummaryChapterResponse(BaseModel):
+    position: int
+    title: str
+    start_offset: int
+    text: str
+
+    class Config:
+        orm_mode = True
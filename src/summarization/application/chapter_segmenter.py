@@ -0,0 +1,117 @@
+# src/summarization/application/chapter_segmenter.py
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import sparse
+
+from src.summarization.infrastructure.chunking import sentence_spans, tfidf_matrix
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A topical section of a transcript."""
+    title: str
+    start_offset: int
+    text: str
+
+
+class ChapterSegmenter:
+    """
+    Splits a transcript into topical sections (TextTiling): sentences are vectorized
+    with TF-IDF, adjacent windows of sentences are compared by cosine similarity and
+    chapters start where the similarity drops the most.
+    """
+
+    def __init__(
+        self,
+        window_sentences: int = 3,
+        min_chapter_sentences: int = 8,
+        max_chapters: int = 12,
+        title_terms: int = 3,
+    ):
+        self.window_sentences = window_sentences
+        self.min_chapter_sentences = min_chapter_sentences
+        self.max_chapters = max_chapters
+        self.title_terms = title_terms
+
+    def segment(self, text: str) -> List[Segment]:
+        spans = sentence_spans(text)
+        if not spans:
+            return []
+
+        sentences = [text[start:end] for start, end in spans]
+        matrix, vocabulary = tfidf_matrix(sentences)
+        boundaries = self._boundaries(matrix) if len(spans) >= 2 * self.min_chapter_sentences else []
+
+        segments = []
+        starts = [0, *boundaries]
+        ends = [*boundaries, len(spans)]
+        for first, last in zip(starts, ends):
+            start_offset, end_offset = spans[first][0], spans[last - 1][1]
+            segments.append(Segment(
+                title=self._title(matrix[first:last], vocabulary),
+                start_offset=start_offset,
+                text=text[start_offset:end_offset],
+            ))
+        return segments
+
+    def similarity_curve(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        """Cosine similarity between the windows before and after each sentence gap."""
+        n = matrix.shape[0]
+        gaps = np.arange(1, n)
+        # Banded 0/1 matrices summing the `window_sentences` rows left and right of each gap
+        offsets = np.arange(self.window_sentences)
+        left_rows = (gaps[:, None] - 1 - offsets).ravel()
+        right_rows = (gaps[:, None] + offsets).ravel()
+        gap_index = np.repeat(np.arange(len(gaps)), self.window_sentences)
+
+        def windows(rows: np.ndarray) -> sparse.csr_matrix:
+            valid = (rows >= 0) & (rows < n)
+            selector = sparse.csr_matrix(
+                (np.ones(valid.sum()), (gap_index[valid], rows[valid])), shape=(len(gaps), n)
+            )
+            return selector @ matrix
+
+        left, right = windows(left_rows), windows(right_rows)
+        dot = np.asarray(left.multiply(right).sum(axis=1)).ravel()
+        norms = np.sqrt(np.asarray(left.multiply(left).sum(axis=1)).ravel()) * np.sqrt(
+            np.asarray(right.multiply(right).sum(axis=1)).ravel()
+        )
+        return np.divide(dot, norms, out=np.zeros_like(dot), where=norms > 0)
+
+    def _boundaries(self, matrix: sparse.csr_matrix) -> List[int]:
+        """Sentence indexes where a new chapter starts."""
+        similarity = self.similarity_curve(matrix)
+
+        # Depth of each gap: how far the similarity drops below the peaks on both sides
+        w = self.window_sentences
+        padded = np.pad(similarity, w, mode="edge")
+        peaks = sliding_window_view(padded, 2 * w + 1).max(axis=1)
+        left_peak = sliding_window_view(padded[:len(similarity) + w], w + 1).max(axis=1)
+        right_peak = sliding_window_view(padded[w:], w + 1).max(axis=1)
+        depth = (left_peak - similarity) + (right_peak - similarity)
+        depth[similarity >= peaks] = 0.0
+
+        cutoff = depth.mean() + depth.std() / 2
+        candidates = [int(gap) for gap in np.argsort(-depth, kind="stable") if depth[gap] > cutoff]
+
+        boundaries: List[int] = []
+        n = matrix.shape[0]
+        for gap in candidates:
+            sentence = gap + 1
+            if len(boundaries) >= self.max_chapters - 1:
+                break
+            if sentence < self.min_chapter_sentences or n - sentence < self.min_chapter_sentences:
+                continue
+            if any(abs(sentence - other) < self.min_chapter_sentences for other in boundaries):
+                continue
+            boundaries.append(sentence)
+        return sorted(boundaries)
+
+    def _title(self, matrix: sparse.csr_matrix, vocabulary: List[str]) -> str:
+        """The chapter's highest-weighted terms."""
+        weights = np.asarray(matrix.sum(axis=0)).ravel()
+        terms = [vocabulary[i] for i in np.argsort(-weights, kind="stable") if len(vocabulary[i]) > 3]
+        return ", ".join(terms[:self.title_terms]).capitalize()
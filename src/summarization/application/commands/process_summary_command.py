@@ -1,7 +1,10 @@
 # src/summarization/application/commands/process_summary_command.py
 from dataclasses import dataclass
 
+from src.summarization.domain.summary import SummaryLength
+
 @dataclass(frozen=True)
 class ProcessSummaryCommand:
     transcription_id: str
     provider: str
+    length: SummaryLength = SummaryLength.DETAILED
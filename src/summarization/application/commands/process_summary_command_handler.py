@@ -1,18 +1,24 @@
 # src/summarization/application/commands/process_summary_command_handler.py
+import asyncio
 import time
+from typing import List, Optional, Sequence, Tuple
+
 import structlog
+from pybreaker import CircuitBreakerError
 
-from src.analytics.application.queries.analytics_queries import AnalyticsQueries
+from src.analytics.application.analytics_queries import AnalyticsQueries
 from src.metrics.application.metrics_service import MetricsService
 from src.shared.events.domain_events import SummarizationProgress
 from src.shared.events.event_bus import EventBus
 from src.summarization.domain.interfaces import ISummaryRepository
-from src.summarization.domain.summary import Summary, SummaryStatus
-from src.summarization.infrastructure.interfaces import ISummarizer
+from src.summarization.domain.summary import ChunkSummary, Summary, SummaryChapter, SummaryLength, content_hash
+from src.summarization.application.chapter_segmenter import ChapterSegmenter, Segment
+from src.summarization.application.progress_reporter import SummarizationProgressReporter
+from src.summarization.infrastructure.interfaces import ISummarizer, ChunkProgress, ProgressCallback
 from src.transcription.application.queries.transcription_queries import TranscriptionQueries
 from .process_summary_command import ProcessSummaryCommand
 # Import the circuit breaker factory
-from src.shared.resilience.circuit_breaker import get_circuit_breaker
+from src.shared.resilience.circuit_breaker import calling, get_circuit_breaker
 
 logger = structlog.get_logger(__name__)
 
@@ -25,7 +31,12 @@ class ProcessSummaryCommandHandler:
         transcription_queries: TranscriptionQueries,
         metrics_service: MetricsService,
         analytics_queries: AnalyticsQueries,
-        event_bus: EventBus
+        event_bus: EventBus,
+        fallback_summarizers: Sequence[ISummarizer] = (),
+        latency_budget_seconds: Optional[float] = None,
+        progress_min_interval_seconds: float = 1.0,
+        chapter_segmenter: Optional[ChapterSegmenter] = None,
+        chapter_max_concurrency: int = 4,
     ):
         self.summarizer = summarizer
         self.summary_repo = summary_repo
@@ -33,25 +44,42 @@ class ProcessSummaryCommandHandler:
         self.metrics_service = metrics_service
         self.analytics_queries = analytics_queries
         self.event_bus = event_bus
+        self.fallback_summarizers = list(fallback_summarizers)
+        self.latency_budget_seconds = latency_budget_seconds
+        self.progress_min_interval_seconds = progress_min_interval_seconds
+        self.chapter_segmenter = chapter_segmenter or ChapterSegmenter()
+        self.chapter_max_concurrency = chapter_max_concurrency
 
     async def handle(self, command: ProcessSummaryCommand) -> Summary:
         start_time = time.time()
-        logger.info("summarization.started", transcription_id=command.transcription_id, provider=command.provider)
+        logger.info(
+            "summarization.started",
+            transcription_id=command.transcription_id,
+            provider=command.provider,
+            length=command.length.value
+        )
+
+        transcription = await self.transcription_queries.get_by_id(command.transcription_id, with_text=True)
+        source_hash = content_hash(transcription.text) if transcription and transcription.text else None
 
-        summary = await self.summary_repo.find_by_transcription_id(command.transcription_id)
-        if summary and summary.status == SummaryStatus.COMPLETED:
+        summary = await self.summary_repo.find_by_transcription_id(command.transcription_id, command.length)
+        if summary and summary.is_up_to_date(source_hash):
             logger.info("summarization.completed", transcription_id=command.transcription_id, from_cache=True)
             return summary
 
         if not summary:
-            summary = Summary.create(transcription_id=command.transcription_id, provider=command.provider)
+            summary = Summary.create(
+                transcription_id=command.transcription_id,
+                provider=command.provider,
+                length=command.length
+            )
         else:
-            summary.provider = command.provider
+            # Transcript edited since the last run: regenerated incrementally from the unchanged chunks
+            summary.mark_as_processing(command.provider)
         
         await self.summary_repo.save(summary)
 
         try:
-            transcription = await self.transcription_queries.get_by_id(command.transcription_id)
             if not transcription or not transcription.text:
                 raise ValueError("Transcription not found or has no text")
 
@@ -61,37 +89,41 @@ class ProcessSummaryCommandHandler:
 
             await self.event_bus.publish(SummarizationProgress(
                 transcription_id=command.transcription_id,
-                progress=25,
+                progress=0,
                 stage="summarization",
-                estimated_total_seconds=estimate["estimated_total_seconds"]
+                estimated_total_seconds=estimate["estimated_total_seconds"],
+                length=command.length.value
             ))
 
-            # Get a circuit breaker for the specific provider
-            breaker_key = f"summarization_{self.summarizer.provider_name}"
-            breaker = get_circuit_breaker(breaker_key)
-
-            # Wrap the external call with the circuit breaker
-            text = await breaker.call_async(self.summarizer.summarize, transcription.text)
-
-            await self.event_bus.publish(SummarizationProgress(
+            reporter = SummarizationProgressReporter(
+                event_bus=self.event_bus,
                 transcription_id=command.transcription_id,
-                progress=75,
-                stage="summarization"
-            ))
+                length=command.length.value,
+                min_interval_seconds=self.progress_min_interval_seconds
+            )
+            text, provider_name = await self._summarize(transcription.text, summary, reporter)
+            summary.provider = provider_name
 
-            summary.mark_as_completed(text)
+            summary.mark_as_completed(text, source_hash=source_hash)
 
             duration = time.time() - start_time
             self.metrics_service.increment_summarization('success')
             self.metrics_service.observe_summarization_duration(
-                transcription_id=command.transcription_id, 
+                video_id=str(transcription.video_id),
                 duration=duration, 
-                provider=self.summarizer.provider_name
+                provider=provider_name
             )
 
             logger.info("summarization.completed", transcription_id=command.transcription_id, duration=duration)
 
-            return await self.summary_repo.save(summary)
+            saved_summary = await self.summary_repo.save(summary)
+            await self.event_bus.publish(SummarizationProgress(
+                transcription_id=command.transcription_id,
+                progress=100,
+                stage="completed",
+                length=command.length.value
+            ))
+            return saved_summary
 
         except Exception as e:
             self.metrics_service.increment_summarization('failure')
@@ -99,4 +131,150 @@ class ProcessSummaryCommandHandler:
             if summary:
                 summary.mark_as_failed(str(e)[:500])
                 await self.summary_repo.save(summary)
+            await self.event_bus.publish(SummarizationProgress(
+                transcription_id=command.transcription_id,
+                progress=0,
+                stage="failed",
+                length=command.length.value
+            ))
             raise
+
+    async def _summarize(
+        self, text: str, summary: Summary, progress_callback: ProgressCallback
+    ) -> Tuple[str, str]:
+        """
+        Tries the provider chain in order. A provider is skipped when its circuit breaker is open
+        and abandoned once the request's latency budget is spent; the last provider always runs
+        to completion, so it should be the cheapest one.
+        """
+        chain = [self.summarizer, *self.fallback_summarizers]
+        deadline = None
+        if self.latency_budget_seconds is not None:
+            deadline = time.monotonic() + self.latency_budget_seconds
+        fallback_reason = "none"
+
+        for index, summarizer in enumerate(chain):
+            is_last = index == len(chain) - 1
+            timeout = None if is_last or deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                # Skipped without being called, so its circuit breaker is left alone
+                fallback_reason = "budget_exceeded"
+            else:
+                # Get a circuit breaker for the specific provider
+                breaker = get_circuit_breaker(f"summarization_{summarizer.provider_name}")
+                try:
+                    # `calling()` is used instead of `call_async`, which depends on tornado coroutines.
+                    # Timeouts count as failures, so a provider that keeps blowing the budget is tripped.
+                    with calling(breaker):
+                        text_summary = await asyncio.wait_for(
+                            self._run(summarizer, text, summary, progress_callback), timeout
+                        )
+                except CircuitBreakerError:
+                    if is_last:
+                        raise
+                    fallback_reason = "breaker_open"
+                except asyncio.TimeoutError:
+                    fallback_reason = "budget_exceeded"
+                else:
+                    self.metrics_service.increment_summarization_answer(summarizer.provider_name, fallback_reason)
+                    return text_summary, summarizer.provider_name
+
+            logger.warning(
+                "summarization.fallback",
+                transcription_id=str(summary.transcription_id),
+                provider=summarizer.provider_name,
+                fallback_provider=chain[index + 1].provider_name,
+                reason=fallback_reason
+            )
+
+    async def _run(
+        self, summarizer: ISummarizer, text: str, summary: Summary, progress_callback: ProgressCallback
+    ) -> str:
+        """Reduces the chunk summaries to the requested length; the map stage only runs for uncached chunks."""
+        if summary.length == SummaryLength.CHAPTERS:
+            return await self._summarize_chapters(summarizer, text, summary, progress_callback)
+        partial_summaries = await self._chunk_summaries(
+            summarizer, text, str(summary.transcription_id), progress_callback
+        )
+        return await summarizer.reduce(partial_summaries, summary.length)
+
+    async def _summarize_chapters(
+        self, summarizer: ISummarizer, text: str, summary: Summary, progress_callback: ProgressCallback
+    ) -> str:
+        """
+        Summarizes each topical section concurrently. Chapters are saved as they finish,
+        so clients can show the first ones while the others are still running.
+        """
+        segments = self.chapter_segmenter.segment(text)
+        logger.info("summarization.chapters", transcription_id=str(summary.transcription_id), chapters=len(segments))
+        await self.summary_repo.delete_chapters(summary.id)
+
+        semaphore = asyncio.Semaphore(self.chapter_max_concurrency)
+        # Chapters share the repository's session, which does not allow concurrent commits
+        save_lock = asyncio.Lock()
+        started_at = time.monotonic()
+        completed = 0
+
+        async def summarize_segment(position: int, segment: Segment) -> SummaryChapter:
+            nonlocal completed
+            async with semaphore:
+                chapter_text = await summarizer.summarize(segment.text, length=SummaryLength.PARAGRAPH)
+            chapter = SummaryChapter(
+                summary_id=summary.id,
+                position=position,
+                title=segment.title,
+                start_offset=segment.start_offset,
+                text=chapter_text
+            )
+            async with save_lock:
+                await self.summary_repo.add_chapter(chapter)
+                completed += 1
+                await progress_callback(ChunkProgress.since(completed, len(segments), started_at))
+            return chapter
+
+        chapters = await asyncio.gather(
+            *(summarize_segment(position, segment) for position, segment in enumerate(segments))
+        )
+        return "\n\n".join(f"{chapter.title}\n{chapter.text}" for chapter in chapters)
+
+    async def _chunk_summaries(
+        self, summarizer: ISummarizer, text: str, transcription_id: str, progress_callback: ProgressCallback
+    ) -> List[str]:
+        """Map stage, re-summarizing only the chunks whose content hash has no cached summary."""
+        chunks = summarizer.split_text_into_chunks(text)
+        hashes = [content_hash(chunk) for chunk in chunks]
+
+        cached = await self.summary_repo.find_chunk_summaries(transcription_id, summarizer.provider_name)
+        cached_by_hash = {chunk_summary.content_hash: chunk_summary.text for chunk_summary in cached}
+        stale = [index for index, chunk_hash in enumerate(hashes) if chunk_hash not in cached_by_hash]
+
+        logger.info(
+            "summarization.map",
+            transcription_id=transcription_id,
+            chunks=len(chunks),
+            cached_chunks=len(chunks) - len(stale)
+        )
+        if stale:
+            fresh = await summarizer.summarize_chunks(
+                [chunks[index] for index in stale], progress_callback=progress_callback
+            )
+            cached_by_hash.update(zip((hashes[index] for index in stale), fresh))
+        partial_summaries = [cached_by_hash[chunk_hash] for chunk_hash in hashes]
+        if not stale and len(cached) == len(chunks):
+            return partial_summaries
+
+        await self.summary_repo.replace_chunk_summaries(
+            transcription_id,
+            summarizer.provider_name,
+            [
+                ChunkSummary(
+                    transcription_id=transcription_id,
+                    provider=summarizer.provider_name,
+                    position=position,
+                    content_hash=chunk_hash,
+                    text=partial_summary
+                )
+                for position, (chunk_hash, partial_summary) in enumerate(zip(hashes, partial_summaries))
+            ]
+        )
+        return partial_summaries
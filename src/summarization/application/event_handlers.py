@@ -17,10 +17,13 @@ async def register_event_handlers(event_bus: EventBus):
         try:
             transcription_id = event_data["transcription_id"]
             provider = event_data.get("provider", "huggingface")  # Default provider
-            logger.info(f"Received SummarizationRequested for {transcription_id} with provider {provider}")
+            length = event_data.get("length", "detailed")
+            logger.info(
+                f"Received SummarizationRequested for {transcription_id} with provider {provider} and length {length}"
+            )
 
             # Dispatch summarization task with the chosen provider
-            process_summary_task.delay(transcription_id=transcription_id, provider=provider)
+            process_summary_task.delay(transcription_id=transcription_id, provider=provider, length=length)
             logger.info(f"Summary task dispatched for transcription {transcription_id}")
 
         except KeyError as e:
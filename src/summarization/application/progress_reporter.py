@@ -0,0 +1,106 @@
+# src/summarization/application/progress_reporter.py
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from src.shared.events.domain_events import SummarizationProgress
+from src.shared.events.event_bus import EventBus
+from src.summarization.domain.summary import SummaryLength, SummaryStatus
+from src.summarization.infrastructure.interfaces import ChunkProgress
+
+TERMINAL_PROGRESS_STAGES = {"completed", "failed"}
+
+
+class SummarizationProgressReporter:
+    """
+    Relays per-chunk progress from a summarizer to the event bus, publishing at most
+    one event per `min_interval_seconds` (the final chunk is always published).
+    """
+    def __init__(
+        self,
+        event_bus: EventBus,
+        transcription_id: str,
+        min_interval_seconds: float = 1.0,
+        length: Optional[str] = None
+    ):
+        self.event_bus = event_bus
+        self.transcription_id = transcription_id
+        self.min_interval_seconds = min_interval_seconds
+        self.length = length
+        self._last_published_at: Optional[float] = None
+
+    async def __call__(self, progress: ChunkProgress):
+        now = time.monotonic()
+        is_final = progress.completed >= progress.total
+        if (
+            not is_final
+            and self._last_published_at is not None
+            and now - self._last_published_at < self.min_interval_seconds
+        ):
+            return
+
+        self._last_published_at = now
+        await self.event_bus.publish(SummarizationProgress(
+            transcription_id=self.transcription_id,
+            # 100 is reserved for the persisted, completed summary
+            progress=min(int(progress.fraction * 100), 99),
+            stage="summarization",
+            completed_chunks=progress.completed,
+            total_chunks=progress.total,
+            eta_seconds=progress.eta_seconds,
+            length=self.length
+        ))
+
+
+def progress_snapshot(
+    transcription_id: str, length: SummaryLength, status: Optional[SummaryStatus]
+) -> Dict:
+    """The progress event matching a summary's persisted status (None when none was requested yet)."""
+    if status == SummaryStatus.COMPLETED:
+        progress, stage = 100, "completed"
+    elif status == SummaryStatus.FAILED:
+        progress, stage = 0, "failed"
+    elif status == SummaryStatus.PROCESSING:
+        progress, stage = 0, "summarization"
+    else:
+        progress, stage = 0, "pending"
+    return SummarizationProgress(
+        transcription_id=transcription_id, progress=progress, stage=stage, length=length.value
+    ).to_dict()
+
+
+async def stream_progress(
+    event_bus: EventBus,
+    transcription_id: str,
+    length: SummaryLength,
+    load_status: Callable[[], Awaitable[Optional[SummaryStatus]]],
+    keepalive_seconds: float,
+    max_seconds: float
+) -> AsyncIterator[Optional[Dict]]:
+    """
+    Yields the current status snapshot, then live progress events of the given summary
+    until it completes or fails, or `max_seconds` pass (clients reconnect for a fresh
+    snapshot). Yields None for each keep-alive.
+    """
+    snapshot = progress_snapshot(transcription_id, length, await load_status())
+    yield snapshot
+    if snapshot["stage"] in TERMINAL_PROGRESS_STAGES:
+        return
+
+    deadline = time.monotonic() + max_seconds
+    # Keep-alives wake the loop at least every `keepalive_seconds`, so the deadline is honoured
+    async for event in event_bus.stream(SummarizationProgress, timeout=keepalive_seconds):
+        if time.monotonic() >= deadline:
+            return
+        if event is None:
+            # The job may have ended before the subscription started, so its final event was missed
+            snapshot = progress_snapshot(transcription_id, length, await load_status())
+            if snapshot["stage"] in TERMINAL_PROGRESS_STAGES:
+                yield snapshot
+                return
+            yield None
+            continue
+        if event.get("transcription_id") != transcription_id or event.get("length") != length.value:
+            continue
+        yield event
+        if event.get("stage") in TERMINAL_PROGRESS_STAGES:
+            return
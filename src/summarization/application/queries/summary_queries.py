@@ -1,9 +1,9 @@
 # src/summarization/application/queries/summary_queries.py
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from src.summarization.domain.interfaces import ISummaryRepository
-from src.summarization.domain.summary import Summary
+from src.summarization.domain.summary import Summary, SummaryChapter, SummaryLength, SummaryStatusView
 
 
 class SummaryQueries:
@@ -12,9 +12,29 @@ class SummaryQueries:
         self.summary_repository = summary_repository
 
     async def get_by_id(self, summary_id: str) -> Optional[Summary]:
-        """Retrieves a summary by its unique ID."""
-        return await self.summary_repository.find_by_id(summary_id)
+        """Retrieves a summary, with its text, by its unique ID."""
+        return await self.summary_repository.find_by_id(summary_id, with_text=True)
 
-    async def get_by_transcription_id(self, transcription_id: str) -> Optional[Summary]:
-        """Retrieves a summary by its associated transcription ID."""
-        return await self.summary_repository.find_by_transcription_id(transcription_id)
+    async def get_by_transcription_id(
+        self, transcription_id: str, length: SummaryLength = SummaryLength.DETAILED
+    ) -> Optional[Summary]:
+        """Retrieves the summary of the given length, with its text, for a transcription."""
+        return await self.summary_repository.find_by_transcription_id(transcription_id, length, with_text=True)
+
+    async def list_by_transcription_id(self, transcription_id: str) -> List[Summary]:
+        """Retrieves every summary variant of a transcription, with their text."""
+        return await self.summary_repository.list_by_transcription_id(transcription_id, with_text=True)
+
+    async def get_status(self, summary_id: str) -> Optional[SummaryStatusView]:
+        """Retrieves the status of a summary without its text."""
+        return await self.summary_repository.find_status_by_id(summary_id)
+
+    async def get_status_by_transcription_id(
+        self, transcription_id: str, length: SummaryLength = SummaryLength.DETAILED
+    ) -> Optional[Summary]:
+        """Retrieves the summary of the given length for a transcription, without its text."""
+        return await self.summary_repository.find_by_transcription_id(transcription_id, length)
+
+    async def get_chapters(self, summary_id: str) -> List[SummaryChapter]:
+        """Retrieves the chapters of a chapter summary, including those already finished while it runs."""
+        return await self.summary_repository.find_chapters(summary_id)
@@ -3,6 +3,7 @@ import structlog
 
 from src.shared.events.domain_events import SummarizationRequested
 from src.shared.events.event_bus import EventBus
+from src.summarization.domain.summary import SummaryLength
 
 logger = structlog.get_logger(__name__)
 
@@ -12,11 +13,14 @@ class SummarizationService:
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
 
-    async def request_summary(self, transcription_id: str, provider: str):
+    async def request_summary(
+        self, transcription_id: str, provider: str, length: SummaryLength = SummaryLength.DETAILED
+    ):
         """Dispatches a SummarizationRequested event to the event bus."""
-        logger.info("summary.requested", transcription_id=transcription_id, provider=provider)
+        logger.info("summary.requested", transcription_id=transcription_id, provider=provider, length=length.value)
         event = SummarizationRequested(
             transcription_id=transcription_id,
-            provider=provider
+            provider=provider,
+            length=length.value
         )
         await self.event_bus.publish(event)
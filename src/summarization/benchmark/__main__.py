@@ -0,0 +1,80 @@
+# src/summarization/benchmark/__main__.py
+"""
+Summarizer benchmark.
+
+    python -m src.summarization.benchmark --providers extractive,huggingface \
+        --batch-sizes 1,4 --beams 1,4 --modes fp32,int8 --output results.json
+
+Pass --baseline with a previous output file to fail (exit code 1) on regressions.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from src.summarization.benchmark.harness import CORPUS_PATH, expand_sweep, find_regressions, run_benchmark
+from src.summarization.infrastructure.dependencies import get_available_summarizer_providers
+
+
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m src.summarization.benchmark", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", type=_csv, help="Comma-separated providers (default: all registered)")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH, help="JSONL corpus of {id, transcript, reference}")
+    parser.add_argument("--batch-sizes", type=_csv, default=["1"], help="Documents summarized concurrently")
+    parser.add_argument("--beams", type=_csv, help="Sweep of HuggingFace beam counts")
+    parser.add_argument("--modes", type=_csv, help="Sweep of HuggingFace execution modes (fp32, int8, bf16)")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Sweep of any settings environment variable (repeatable)")
+    parser.add_argument("--repeats", type=int, default=1, help="Passes over the corpus per configuration")
+    parser.add_argument("--no-isolate", action="store_true", help="Run every configuration in this process")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.1,
+                        help="Tolerated drop in tokens/sec or ROUGE-L against the baseline (fraction)")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = _parse_args(argv)
+
+    env_sweep: Dict[str, List[str]] = {}
+    if args.beams:
+        env_sweep["HF_SUMMARIZER_NUM_BEAMS"] = args.beams
+    if args.modes:
+        env_sweep["HF_SUMMARIZER_EXECUTION_MODE"] = args.modes
+    for sweep in args.env:
+        name, _, values = sweep.partition("=")
+        env_sweep[name] = _csv(values)
+
+    configs = expand_sweep(
+        providers=args.providers or get_available_summarizer_providers(),
+        batch_sizes=[int(size) for size in args.batch_sizes],
+        env_sweep=env_sweep,
+        repeats=args.repeats,
+    )
+    results = run_benchmark(configs, corpus_path=args.corpus, isolate=not args.no_isolate)
+
+    report = json.dumps({"corpus": str(args.corpus), "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(report)
+    else:
+        print(report)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = find_regressions(baseline, results, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
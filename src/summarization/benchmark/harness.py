@@ -0,0 +1,195 @@
+# src/summarization/benchmark/harness.py
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from src.summarization.benchmark.rouge import rouge_scores
+from src.summarization.infrastructure.dependencies import create_summarizer_service
+
+CORPUS_PATH = Path(__file__).with_name("corpus.jsonl")
+
+
+@dataclass(frozen=True)
+class Document:
+    id: str
+    transcript: str
+    reference: str
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    provider: str
+    # Number of documents summarized concurrently. Providers that run one model (huggingface)
+    # queue them for its lock on executor threads, so their latency includes that wait
+    batch_size: int = 1
+    # Settings overrides applied before the summarizer is built, e.g. {"HF_SUMMARIZER_NUM_BEAMS": "1"}
+    env: Dict[str, str] = field(default_factory=dict)
+    repeats: int = 1
+
+    @property
+    def key(self) -> str:
+        """Identifies the configuration when comparing runs."""
+        overrides = ",".join(f"{name}={value}" for name, value in sorted(self.env.items()))
+        return f"{self.provider}|batch={self.batch_size}|{overrides}"
+
+
+@dataclass
+class BenchmarkResult:
+    key: str
+    provider: str
+    batch_size: int
+    env: Dict[str, str]
+    documents: int = 0
+    input_tokens: int = 0
+    total_seconds: float = 0.0
+    tokens_per_second: float = 0.0
+    latency_p50_seconds: float = 0.0
+    latency_p95_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    rouge1: float = 0.0
+    rouge2: float = 0.0
+    rougeL: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> List[Document]:
+    """Reads a JSONL corpus of {id, transcript, reference} documents."""
+    with open(path, encoding="utf-8") as f:
+        return [Document(**json.loads(line)) for line in f if line.strip()]
+
+
+def count_tokens(text: str) -> int:
+    """Whitespace tokens: provider-independent, so throughput is comparable across summarizers."""
+    return len(text.split())
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def environment(overrides: Dict[str, str]) -> Iterator[None]:
+    """Temporarily applies settings overrides to os.environ."""
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+async def run_config(config: BenchmarkConfig, corpus: List[Document]) -> BenchmarkResult:
+    """Summarizes the corpus `config.repeats` times with one summarizer configuration."""
+    result = BenchmarkResult(key=config.key, provider=config.provider, batch_size=config.batch_size, env=config.env)
+    with environment(config.env):
+        summarizer = create_summarizer_service(config.provider)
+
+    # Warm-up, so one-off costs (lazy loading, compilation) are not measured
+    await summarizer.summarize(min(corpus, key=lambda document: len(document.transcript)).transcript)
+
+    semaphore = asyncio.Semaphore(config.batch_size)
+    latencies: List[float] = []
+
+    async def summarize(document: Document) -> str:
+        async with semaphore:
+            started_at = time.perf_counter()
+            summary = await summarizer.summarize(document.transcript)
+            latencies.append(time.perf_counter() - started_at)
+            return summary
+
+    started_at = time.perf_counter()
+    outputs = []
+    for _ in range(config.repeats):
+        outputs = await asyncio.gather(*(summarize(document) for document in corpus))
+    total_seconds = time.perf_counter() - started_at
+
+    scores = [rouge_scores(document.reference, output) for document, output in zip(corpus, outputs)]
+    input_tokens = sum(count_tokens(document.transcript) for document in corpus) * config.repeats
+
+    result.documents = len(corpus) * config.repeats
+    result.input_tokens = input_tokens
+    result.total_seconds = total_seconds
+    result.tokens_per_second = input_tokens / total_seconds if total_seconds else 0.0
+    result.latency_p50_seconds = float(np.percentile(latencies, 50))
+    result.latency_p95_seconds = float(np.percentile(latencies, 95))
+    result.peak_rss_mb = peak_rss_mb()
+    for metric in ("rouge1", "rouge2", "rougeL"):
+        setattr(result, metric, float(np.mean([score[metric] for score in scores])))
+    return result
+
+
+def _run_config_in_process(config: BenchmarkConfig, corpus_path: str) -> dict:
+    try:
+        return asyncio.run(run_config(config, load_corpus(Path(corpus_path)))).to_dict()
+    except Exception as e:
+        return BenchmarkResult(
+            key=config.key, provider=config.provider, batch_size=config.batch_size, env=config.env,
+            error=f"{e.__class__.__name__}: {e}"
+        ).to_dict()
+
+
+def run_benchmark(configs: List[BenchmarkConfig], corpus_path: Path = CORPUS_PATH, isolate: bool = True) -> List[dict]:
+    """
+    Runs every configuration and returns one result dict per configuration. With `isolate`,
+    each configuration runs in a fresh process, so peak RSS and settings are its own.
+    """
+    results = []
+    for config in configs:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                results.append(executor.submit(_run_config_in_process, config, str(corpus_path)).result())
+        else:
+            results.append(_run_config_in_process(config, str(corpus_path)))
+    return results
+
+
+def expand_sweep(
+    providers: List[str],
+    batch_sizes: List[int],
+    env_sweep: Dict[str, List[str]],
+    repeats: int = 1,
+) -> List[BenchmarkConfig]:
+    """The cartesian product of providers, batch sizes and every swept setting."""
+    names = sorted(env_sweep)
+    return [
+        BenchmarkConfig(provider=provider, batch_size=batch_size, env=dict(zip(names, values)), repeats=repeats)
+        for provider, batch_size, values in itertools.product(
+            providers, batch_sizes, itertools.product(*(env_sweep[name] for name in names))
+        )
+    ]
+
+
+def find_regressions(baseline: List[dict], results: List[dict], tolerance: float) -> List[str]:
+    """Configurations whose throughput or ROUGE-L dropped by more than `tolerance` (a fraction)."""
+    previous = {result["key"]: result for result in baseline if not result.get("error")}
+    regressions = []
+    for result in results:
+        before = previous.get(result["key"])
+        if not before or result.get("error"):
+            continue
+        for metric in ("tokens_per_second", "rougeL"):
+            if result[metric] < before[metric] * (1 - tolerance):
+                regressions.append(f"{result['key']}: {metric} {before[metric]:.4f} -> {result[metric]:.4f}")
+    return regressions
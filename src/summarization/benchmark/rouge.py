@@ -0,0 +1,48 @@
+# src/summarization/benchmark/rouge.py
+import re
+from collections import Counter
+from typing import Dict, List
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokens(text: str) -> List[str]:
+    return [token.lower() for token in _TOKEN.findall(text)]
+
+
+def _f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def _ngram_f1(reference: List[str], candidate: List[str], n: int) -> float:
+    reference_ngrams = Counter(zip(*(reference[i:] for i in range(n))))
+    candidate_ngrams = Counter(zip(*(candidate[i:] for i in range(n))))
+    overlap = sum((reference_ngrams & candidate_ngrams).values())
+    return _f1(overlap, sum(candidate_ngrams.values()), sum(reference_ngrams.values()))
+
+
+def _lcs_length(reference: List[str], candidate: List[str]) -> int:
+    previous = [0] * (len(candidate) + 1)
+    for reference_token in reference:
+        current = [0]
+        for j, candidate_token in enumerate(candidate, start=1):
+            if reference_token == candidate_token:
+                current.append(previous[j - 1] + 1)
+            else:
+                current.append(max(previous[j], current[j - 1]))
+        previous = current
+    return previous[-1]
+
+
+def rouge_scores(reference: str, candidate: str) -> Dict[str, float]:
+    """ROUGE-1, ROUGE-2 and ROUGE-L F1 scores of a candidate summary (no stemming)."""
+    reference_tokens, candidate_tokens = _tokens(reference), _tokens(candidate)
+    return {
+        "rouge1": _ngram_f1(reference_tokens, candidate_tokens, 1),
+        "rouge2": _ngram_f1(reference_tokens, candidate_tokens, 2),
+        "rougeL": _f1(_lcs_length(reference_tokens, candidate_tokens), len(candidate_tokens), len(reference_tokens)),
+    }
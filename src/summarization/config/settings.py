@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class LLMSettings(BaseSettings):
@@ -5,6 +7,61 @@ class LLMSettings(BaseSettings):
     openai_api_key: str = ""
     transformers_model: str = "facebook/bart-large-cnn"
 
+    # OpenAI-compatible chat completions endpoint (point it at a stub server in tests)
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_model: str = "gpt-4o-mini"
+    openai_timeout_seconds: float = 60.0
+    # Keep-alive connection pool shared by all requests of a process
+    openai_max_connections: int = 20
+    openai_max_keepalive_connections: int = 10
+    # Account limits enforced client-side with token buckets
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 200_000
+    # Map stage: transcript chunk size and how many chunks are in flight at once
+    openai_chunk_tokens: int = 6_000
+    openai_max_concurrency: int = 8
+    openai_max_output_tokens: int = 512
+    openai_max_retries: int = 5
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+
+
+class SummarizationSettings(BaseSettings):
+    # Minimum interval between SummarizationProgress events published for one job
+    progress_min_interval_seconds: float = 1.0
+    # Providers tried, in order, after the requested one (comma-separated); the last one is never timed out
+    fallback_providers: str = "extractive"
+    # Time after which the handler stops waiting for a provider and moves down the chain (unset: no limit)
+    latency_budget_seconds: Optional[float] = None
+    # Chapter mode: topic segmentation and how many chapters are summarized at once
+    chapter_window_sentences: int = 3
+    chapter_min_sentences: int = 8
+    chapter_max_chapters: int = 12
+    chapter_max_concurrency: int = 4
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+        env_prefix = "SUMMARIZATION_"
+
+
+class HuggingFaceSummarizerSettings(BaseSettings):
+    model_name: str = "google-t5/t5-base"
+    # fp32 | int8 (dynamic quantization of Linear layers) | bf16 (falls back to fp32 without CPU support)
+    execution_mode: str = "fp32"
+    # Compile the model's forward pass with torch.compile; the first (slow) run happens at startup
+    compile: bool = False
+    # Compare the startup sample against an fp32 reference to log the output drift of the mode
+    report_drift: bool = True
+    # Generation is sized to each chunk: chunks under `passthrough_tokens` are kept verbatim,
+    # chunks under `greedy_below_tokens` use greedy decoding instead of beam search
+    num_beams: int = 4
+    passthrough_tokens: int = 24
+    greedy_below_tokens: int = 128
+
     class Config:
         env_file = ".env"
         extra = "ignore"
+        env_prefix = "HF_SUMMARIZER_"
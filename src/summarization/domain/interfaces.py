@@ -1,8 +1,8 @@
 # src/summarization/domain/interfaces.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
-from src.summarization.domain.summary import Summary
+from src.summarization.domain.summary import ChunkSummary, Summary, SummaryChapter, SummaryLength, SummaryStatusView
 
 
 class ISummaryRepository(ABC):
@@ -12,11 +12,50 @@ class ISummaryRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_transcription_id(self, transcription_id: str) -> Optional[Summary]:
-        """Finds a summary by its transcription ID."""
+    async def find_by_transcription_id(
+        self, transcription_id: str, length: SummaryLength = SummaryLength.DETAILED, with_text: bool = False
+    ) -> Optional[Summary]:
+        """Finds the summary of the given length for a transcription; its text is only loaded `with_text`."""
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_id(self, summary_id: str) -> Optional[Summary]:
-        """Finds a summary by its ID."""
+    async def list_by_transcription_id(self, transcription_id: str, with_text: bool = False) -> List[Summary]:
+        """Lists every summary variant of a transcription; their text is only loaded `with_text`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(self, summary_id: str, with_text: bool = False) -> Optional[Summary]:
+        """Finds a summary by its ID; its text is only loaded `with_text`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_status_by_id(self, summary_id: str) -> Optional[SummaryStatusView]:
+        """Finds the status of a summary without loading its text."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_chunk_summaries(self, transcription_id: str, provider: str) -> List[ChunkSummary]:
+        """Finds the cached chunk summaries of a transcription, in chunk order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_chunk_summaries(
+        self, transcription_id: str, provider: str, chunk_summaries: List[ChunkSummary]
+    ) -> List[ChunkSummary]:
+        """Replaces the cached chunk summaries of a transcription for a provider."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_chapter(self, chapter: SummaryChapter) -> SummaryChapter:
+        """Saves one chapter as soon as it is summarized."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_chapters(self, summary_id: str):
+        """Deletes the chapters of a summary before it is regenerated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_chapters(self, summary_id: str) -> List[SummaryChapter]:
+        """Finds the chapters of a summary, in transcript order."""
         raise NotImplementedError
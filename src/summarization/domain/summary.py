@@ -1,14 +1,24 @@
 # src/summarization/domain/summary.py
 
-from sqlalchemy import Column, String, DateTime, Enum as SqlEnum, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Enum as SqlEnum, ForeignKey, Text, Integer, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 
 from src.shared.infrastructure.database import Base
+from src.shared.infrastructure.full_text_search import search_vector_column, search_vector_index
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 import enum
+import hashlib
 import uuid
 
 
+def content_hash(text: str) -> str:
+    """SHA-256 of a text, used to detect which transcript parts changed."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class SummaryStatus(str, enum.Enum):
     PENDING = "PENDING"
     PROCESSING = "PROCESSING"
@@ -16,30 +26,73 @@ class SummaryStatus(str, enum.Enum):
     FAILED = "FAILED"
 
 
+class SummaryLength(str, enum.Enum):
+    """Summary variants that can be produced for the same transcription."""
+    TWEET = "tweet"
+    PARAGRAPH = "paragraph"
+    DETAILED = "detailed"
+    # One paragraph per topical section, see SummaryChapter
+    CHAPTERS = "chapters"
+
+    @property
+    def target_words(self) -> int:
+        """Approximate upper bound on the number of words of this variant."""
+        return _TARGET_WORDS[self]
+
+
+_TARGET_WORDS = {
+    SummaryLength.TWEET: 40,
+    SummaryLength.PARAGRAPH: 120,
+    SummaryLength.DETAILED: 400,
+    SummaryLength.CHAPTERS: 120,  # per chapter
+}
+
+
 class Summary(Base):
     __tablename__ = "summaries"
+    __table_args__ = (
+        UniqueConstraint("transcription_id", "length", name="uq_summaries_transcription_id_length"),
+        search_vector_index("summaries"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    transcription_id = Column(UUID(as_uuid=True), ForeignKey("transcriptions.id"), nullable=False, unique=True)
-    text = Column(Text, nullable=True)
+    transcription_id = Column(UUID(as_uuid=True), ForeignKey("transcriptions.id"), nullable=False, index=True)
+    length = Column(SqlEnum(SummaryLength), default=SummaryLength.DETAILED, nullable=False)
+    # Deferred: loaded only by the repository's with_text queries
+    text = deferred(Column(Text, nullable=True))
     status = Column(SqlEnum(SummaryStatus), default=SummaryStatus.PENDING, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     processed_at = Column(DateTime, nullable=True)
     error_message = Column(String, nullable=True)
     provider = Column(String, nullable=True)  # Added provider field
+    source_hash = Column(String(64), nullable=True)  # Hash of the transcript text that was summarized
+    search_vector = search_vector_column("text")
 
     @staticmethod
-    def create(transcription_id: str, provider: str) -> "Summary":
+    def create(
+        transcription_id: str, provider: str, length: SummaryLength = SummaryLength.DETAILED
+    ) -> "Summary":
         """Factory method to create a new summary in a valid initial state."""
-        summary = Summary(transcription_id=transcription_id, provider=provider)
+        summary = Summary(id=uuid.uuid4(), transcription_id=transcription_id, provider=provider, length=length)
         summary.status = SummaryStatus.PROCESSING
         summary.created_at = datetime.utcnow()
         return summary
 
-    def mark_as_completed(self, content: str):
+    def is_up_to_date(self, source_hash: Optional[str]) -> bool:
+        """Whether the summary is completed and was produced from the given transcript text."""
+        return self.status == SummaryStatus.COMPLETED and self.source_hash == source_hash
+
+    def mark_as_processing(self, provider: str):
+        """Re-opens the summary to be (re)generated, e.g. after the transcript was edited."""
+        self.provider = provider
+        self.status = SummaryStatus.PROCESSING
+        self.error_message = None
+
+    def mark_as_completed(self, content: str, source_hash: Optional[str] = None):
         if self.status == SummaryStatus.COMPLETED:
             return  # Avoid reprocessing
         self.text = content
+        self.source_hash = source_hash
         self.status = SummaryStatus.COMPLETED
         self.processed_at = datetime.utcnow()
         self.error_message = None
@@ -48,3 +101,51 @@ class Summary(Base):
         self.status = SummaryStatus.FAILED
         self.error_message = error
         self.processed_at = datetime.utcnow()
+
+
+@dataclass(frozen=True)
+class SummaryStatusView:
+    """Lightweight projection of a summary for status checks: everything but the text."""
+    id: uuid.UUID
+    transcription_id: uuid.UUID
+    length: SummaryLength
+    status: SummaryStatus
+    provider: Optional[str]
+    processed_at: Optional[datetime]
+    error_message: Optional[str]
+
+
+class ChunkSummary(Base):
+    """
+    Intermediate (map stage) summary of one transcript chunk. Kept per provider so
+    further summary lengths only need the reduce stage, and keyed by the chunk's
+    content hash so only edited chunks are re-summarized.
+    """
+    __tablename__ = "summary_chunks"
+    __table_args__ = (
+        UniqueConstraint("transcription_id", "provider", "position", name="uq_summary_chunks_position"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    transcription_id = Column(UUID(as_uuid=True), ForeignKey("transcriptions.id"), nullable=False, index=True)
+    provider = Column(String, nullable=False)
+    position = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SummaryChapter(Base):
+    """Summary of one topical section of a transcript, stored alongside its CHAPTERS summary."""
+    __tablename__ = "summary_chapters"
+    __table_args__ = (
+        UniqueConstraint("summary_id", "position", name="uq_summary_chapters_position"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    summary_id = Column(UUID(as_uuid=True), ForeignKey("summaries.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    title = Column(String, nullable=False)
+    start_offset = Column(Integer, nullable=False)  # Character offset of the chapter in the transcript
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
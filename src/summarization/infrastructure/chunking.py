@@ -0,0 +1,93 @@
+# src/summarization/infrastructure/chunking.py
+import re
+import zlib
+from collections import Counter
+from typing import List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+_PARAGRAPH_OR_SENTENCE = re.compile(r"(?<=[.!?])\s+|\n{2,}")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Once a chunk is half full, a sentence ends it with probability 1/BOUNDARY_DIVISOR
+BOUNDARY_DIVISOR = 4
+
+
+def split_sentences(text: str) -> List[str]:
+    """Splits text on sentence-final punctuation and blank lines."""
+    return [s.strip() for s in _PARAGRAPH_OR_SENTENCE.split(text.strip()) if s.strip()]
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """(start, end) character offsets of the sentences of `text`, whitespace excluded."""
+    spans = []
+    start = 0
+    for boundary in [*_PARAGRAPH_OR_SENTENCE.finditer(text), None]:
+        end = boundary.start() if boundary else len(text)
+        sentence = text[start:end]
+        if sentence.strip():
+            leading = len(sentence) - len(sentence.lstrip())
+            spans.append((start + leading, start + len(sentence.rstrip())))
+        start = boundary.end() if boundary else len(text)
+    return spans
+
+
+def tfidf_matrix(sentences: List[str], normalize: bool = False) -> Tuple[sparse.csr_matrix, List[str]]:
+    """
+    Sublinear TF-IDF matrix (sentences x terms) and its vocabulary. With `normalize`,
+    rows are scaled to unit L2 norm so that their dot products are cosine similarities.
+    """
+    vocabulary = {}
+    rows, cols, values = [], [], []
+    for row, sentence in enumerate(sentences):
+        counts = Counter(token.lower() for token in _TOKEN.findall(sentence))
+        for term, count in counts.items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(1.0 + np.log(count))
+
+    shape = (len(sentences), max(len(vocabulary), 1))
+    tf = sparse.csr_matrix((values, (rows, cols)), shape=shape, dtype=np.float64)
+    document_frequency = np.bincount(tf.indices, minlength=shape[1])
+    idf = np.log((1.0 + shape[0]) / (1.0 + document_frequency)) + 1.0
+    tfidf = tf @ sparse.diags(idf)
+
+    if normalize:
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        tfidf = sparse.diags(1.0 / norms) @ tfidf
+    return tfidf.tocsr(), list(vocabulary)
+
+
+def is_content_boundary(piece: str) -> bool:
+    """Whether a chunk may end after `piece`, decided by the piece's content alone."""
+    return zlib.crc32(piece.encode("utf-8")) % BOUNDARY_DIVISOR == 0
+
+
+def pack_chunks(pieces: List[str], sizes: List[int], budget: int) -> List[str]:
+    """
+    Packs consecutive pieces into chunks whose sizes add up to at most `budget`.
+
+    Besides overflowing the budget, a chunk ends after any piece that is a content
+    boundary. Boundaries therefore depend on the surrounding text rather than on
+    everything before it, so an edit only changes the chunks around it and the
+    cached summaries of the others stay valid.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_size = 0
+
+    for piece, size in zip(pieces, sizes):
+        if current and current_size + size > budget:
+            chunks.append(" ".join(current))
+            current, current_size = [], 0
+        current.append(piece)
+        current_size += size
+        if current_size >= budget // 2 and is_content_boundary(piece):
+            chunks.append(" ".join(current))
+            current, current_size = [], 0
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -1,10 +1,13 @@
 from typing import Dict, Type, List, Callable
 import importlib
+import logging
 import pkgutil
 import pathlib
 
 from src.summarization.infrastructure.interfaces import ISummarizer
 
+logger = logging.getLogger(__name__)
+
 # Service registry
 _summarizer_registry: Dict[str, Type[ISummarizer]] = {}
 _plugins_loaded = False
@@ -50,9 +53,14 @@ def _load_summarizer_plugins():
     package_name = __name__.rsplit(".", 1)[0]
 
     for _, module_name, _ in pkgutil.iter_modules([str(package_path)]):
-        if module_name.startswith("_") or module_name in ["dependencies", "interfaces"]:
+        if module_name.startswith("_") or module_name in ["dependencies", "interfaces", "chunking", "generation"]:
             continue
         full_module_name = f"{package_name}.{module_name}"
-        importlib.import_module(full_module_name)
+        try:
+            importlib.import_module(full_module_name)
+        except ImportError as e:
+            # Providers with missing optional dependencies (e.g. torch) are skipped
+            # so lightweight providers remain available.
+            logger.warning(f"Skipping summarizer plugin {full_module_name}: {e}")
 
     _plugins_loaded = True
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from src.summarization.domain.summary import SummaryLength
+from src.summarization.infrastructure.chunking import pack_chunks, split_sentences, tfidf_matrix
+from src.summarization.infrastructure.interfaces import ISummarizer, ChunkProgress, ProgressCallback
+from src.summarization.infrastructure.dependencies import register_summarizer
+
+
+@register_summarizer("extractive")
+class ExtractiveSummarizer(ISummarizer):
+    """
+    Pure-CPU extractive summarizer (LexRank over a sparse TF-IDF matrix).
+    Needs no model download and answers in milliseconds, so it is used for
+    previews and as the fallback when model-backed providers are unavailable.
+    """
+
+    def __init__(
+        self,
+        target_ratio: float = 0.2,
+        max_summary_words: int = 250,
+        damping: float = 0.85,
+        max_iterations: int = 100,
+        tolerance: float = 1e-6,
+        chunk_words: int = 500,
+    ):
+        self.target_ratio = target_ratio
+        self.max_summary_words = max_summary_words
+        self.damping = damping
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.chunk_words = chunk_words
+
+    @property
+    def provider_name(self) -> str:
+        return "extractive"
+
+    def split_text_into_chunks(self, text: str) -> List[str]:
+        """Groups consecutive sentences into chunks of at most `chunk_words` words."""
+        sentences = self.split_sentences(text)
+        return pack_chunks(sentences, [len(sentence.split()) for sentence in sentences], self.chunk_words)
+
+    async def summarize_chunks(
+        self, chunks: List[str], progress_callback: Optional[ProgressCallback] = None
+    ) -> List[str]:
+        """Extracts the most central sentences of each chunk."""
+        started_at = time.monotonic()
+        summaries = []
+        for index, chunk in enumerate(chunks, start=1):
+            budget = self._word_budget(len(chunk.split()))
+            summaries.append(await asyncio.to_thread(self._extract, chunk, budget))
+            if progress_callback:
+                await progress_callback(ChunkProgress.since(index, len(chunks), started_at))
+        return summaries
+
+    async def reduce(self, partial_summaries: List[str], length: SummaryLength) -> str:
+        """Extracts the most central sentences of the chunk summaries within the length's word budget."""
+        combined = " ".join(summary for summary in partial_summaries if summary)
+        if not combined:
+            return ""
+        budget = min(self.max_summary_words, length.target_words)
+        return await asyncio.to_thread(self._extract, combined, budget)
+
+    def _extract(self, text: str, budget: int) -> str:
+        """Selects the most central sentences of the text, in their original order."""
+        sentences = self.split_sentences(text)
+        if len(sentences) <= 1:
+            return " ".join(sentences)
+
+        scores = self.rank_sentences(sentences)
+        lengths = [len(sentence.split()) for sentence in sentences]
+
+        selected: List[int] = []
+        used = 0
+        for index in np.argsort(-scores, kind="stable"):
+            if selected and used + lengths[index] > budget:
+                continue
+            selected.append(int(index))
+            used += lengths[index]
+            if used >= budget:
+                break
+
+        return " ".join(sentences[i] for i in sorted(selected))
+
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        """Splits text on sentence-final punctuation and blank lines."""
+        return split_sentences(text)
+
+    def rank_sentences(self, sentences: List[str]) -> np.ndarray:
+        """Returns the LexRank centrality score of each sentence."""
+        matrix, _ = tfidf_matrix(sentences, normalize=True)
+        similarity = (matrix @ matrix.T).tocsr()
+        similarity.setdiag(0)
+        similarity.eliminate_zeros()
+
+        n = similarity.shape[0]
+        row_sums = np.asarray(similarity.sum(axis=1)).ravel()
+        # Sentences sharing no terms with any other get a uniform transition row.
+        dangling = row_sums == 0
+        inverse = np.divide(1.0, row_sums, out=np.zeros_like(row_sums), where=~dangling)
+        transition = sparse.diags(inverse) @ similarity
+
+        scores = np.full(n, 1.0 / n)
+        teleport = (1.0 - self.damping) / n
+        for _ in range(self.max_iterations):
+            dangling_mass = scores[dangling].sum() / n
+            updated = teleport + self.damping * (transition.T @ scores + dangling_mass)
+            if np.abs(updated - scores).sum() < self.tolerance:
+                return updated
+            scores = updated
+        return scores
+
+    def _word_budget(self, total_words: int) -> int:
+        return max(1, min(self.max_summary_words, int(total_words * self.target_ratio)))
@@ -0,0 +1,28 @@
+# src/summarization/infrastructure/generation.py
+from dataclasses import dataclass
+from typing import Optional
+
+from src.summarization.config.settings import HuggingFaceSummarizerSettings
+
+
+@dataclass(frozen=True)
+class GenerationParams:
+    max_length: int
+    min_length: int
+    num_beams: int
+
+
+def generation_params(
+    token_count: int, settings: HuggingFaceSummarizerSettings, max_summary_length: int, min_summary_length: int
+) -> Optional[GenerationParams]:
+    """Generation settings sized to a chunk, or None when the chunk is short enough to keep verbatim."""
+    if token_count < settings.passthrough_tokens:
+        return None
+    # A summary of about a quarter of the input, within the configured bounds
+    max_length = min(max_summary_length, max(min_summary_length, token_count // 4))
+    num_beams = 1 if token_count < settings.greedy_below_tokens else settings.num_beams
+    return GenerationParams(
+        max_length=max_length,
+        min_length=min(min_summary_length, max_length // 2),
+        num_beams=num_beams
+    )
@@ -1,6 +1,38 @@
 # src/summarization/infrastructure/interfaces.py
 
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from src.summarization.domain.summary import SummaryLength
+
+
+@dataclass(frozen=True)
+class ChunkProgress:
+    """Progress of a summarization run, reported after each chunk or batch."""
+    completed: int
+    total: int
+    elapsed_seconds: float
+
+    @classmethod
+    def since(cls, completed: int, total: int, started_at: float) -> "ChunkProgress":
+        """Builds a progress snapshot from a `time.monotonic()` start timestamp."""
+        return cls(completed=completed, total=total, elapsed_seconds=time.monotonic() - started_at)
+
+    @property
+    def fraction(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Remaining time extrapolated from the throughput observed so far."""
+        if self.completed == 0:
+            return None
+        return self.elapsed_seconds / self.completed * (self.total - self.completed)
+
+
+ProgressCallback = Callable[[ChunkProgress], Awaitable[None]]
 
 
 class ISummarizer(ABC):
@@ -11,5 +43,30 @@ class ISummarizer(ABC):
         pass
 
     @abstractmethod
-    async def summarize(self, text: str) -> str:
+    def split_text_into_chunks(self, text: str) -> List[str]:
+        """Splits the text into the chunks summarized by the map stage."""
+        pass
+
+    @abstractmethod
+    async def summarize_chunks(
+        self, chunks: List[str], progress_callback: Optional[ProgressCallback] = None
+    ) -> List[str]:
+        """Map stage: summarizes each chunk, awaiting `progress_callback` after each chunk or batch."""
         pass
+
+    @abstractmethod
+    async def reduce(self, partial_summaries: List[str], length: SummaryLength) -> str:
+        """Reduce stage: combines chunk summaries into one summary of the requested length."""
+        pass
+
+    async def summarize(
+        self,
+        text: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        length: SummaryLength = SummaryLength.DETAILED,
+    ) -> str:
+        """Summarizes the text by running the map and reduce stages back to back."""
+        if not text.strip():
+            return ""
+        partial_summaries = await self.summarize_chunks(self.split_text_into_chunks(text), progress_callback)
+        return await self.reduce(partial_summaries, length)
@@ -1,15 +1,197 @@
 # src/summarization/infrastructure/openai_summarizer.py
-from src.summarization.infrastructure.interfaces import ISummarizer
-import openai
+import asyncio
+import logging
+import random
+import time
+import weakref
+from typing import List, Optional
 
+import httpx
 
+from src.shared.resilience.rate_limiter import get_rate_limiter
+from src.summarization.config.settings import LLMSettings
+from src.summarization.domain.summary import SummaryLength
+from src.summarization.infrastructure.chunking import pack_chunks, split_sentences
+from src.summarization.infrastructure.interfaces import ISummarizer, ChunkProgress, ProgressCallback
+from src.summarization.infrastructure.dependencies import register_summarizer
+
+logger = logging.getLogger(__name__)
+
+MAP_PROMPT = "Resuma o seguinte texto:"
+REDUCE_PROMPT = "Combine os resumos parciais a seguir em um único resumo coeso de no máximo {max_words} palavras:"
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 30.0
+# Re-summarizing passes over partial summaries too long for one reduce request
+MAX_REDUCE_PASSES = 4
+
+# One pooled client per event loop: Celery tasks run each job in a fresh loop via asyncio.run
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client(settings: LLMSettings) -> httpx.AsyncClient:
+    """Returns the keep-alive client shared by all OpenAI requests on the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=settings.openai_base_url,
+            headers={"Authorization": f"Bearer {settings.openai_api_key}"},
+            timeout=settings.openai_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_connections,
+                max_keepalive_connections=settings.openai_max_keepalive_connections,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), used for budgeting only."""
+    return max(1, len(text) // 4)
+
+
+@register_summarizer("openai")
 class OpenAISummarizer(ISummarizer):
-    async def summarize(self, text: str) -> str:
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "Resuma o seguinte texto:"},
-                {"role": "user", "content": text}
-            ]
+    def __init__(self, settings: Optional[LLMSettings] = None, http_client: Optional[httpx.AsyncClient] = None):
+        self.settings = settings or LLMSettings()
+        self._http_client = http_client
+        self.rate_limiter = get_rate_limiter(
+            f"openai_{self.settings.openai_base_url}",
+            requests_per_minute=self.settings.openai_requests_per_minute,
+            tokens_per_minute=self.settings.openai_tokens_per_minute,
         )
-        return response.choices[0].message["content"].strip()
+
+    @property
+    def provider_name(self) -> str:
+        return "openai"
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client or get_http_client(self.settings)
+
+    def split_text_into_chunks(self, text: str) -> List[str]:
+        """Splits the text on sentence/paragraph boundaries into chunks within the token budget."""
+        budget = self.settings.openai_chunk_tokens
+        pieces = self._pieces(text, budget)
+        # Budgeted in characters (one separator per piece) so the joined chunk stays within the estimate
+        return pack_chunks(pieces, [len(piece) + 1 for piece in pieces], budget * 4)
+
+    @staticmethod
+    def _pieces(text: str, budget: int) -> List[str]:
+        """Sentences, with any sentence longer than the budget hard-split on words."""
+        pieces = []
+        for sentence in split_sentences(text):
+            if estimate_tokens(sentence) <= budget:
+                pieces.append(sentence)
+                continue
+            current: List[str] = []
+            for word in sentence.split():
+                if current and estimate_tokens(" ".join(current + [word])) > budget:
+                    pieces.append(" ".join(current))
+                    current = []
+                current.append(word)
+            if current:
+                pieces.append(" ".join(current))
+        return pieces
+
+    async def summarize_chunks(
+        self, chunks: List[str], progress_callback: Optional[ProgressCallback] = None
+    ) -> List[str]:
+        """Map stage: the chunks are summarized in parallel, bounded by `openai_max_concurrency`."""
+        semaphore = asyncio.Semaphore(self.settings.openai_max_concurrency)
+        started_at = time.monotonic()
+        completed = 0
+
+        async def summarize_chunk(chunk: str) -> str:
+            nonlocal completed
+            async with semaphore:
+                summary = await self._complete(MAP_PROMPT, chunk)
+            completed += 1
+            if progress_callback:
+                await progress_callback(ChunkProgress.since(completed, len(chunks), started_at))
+            return summary
+
+        return list(await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks)))
+
+    async def reduce(self, partial_summaries: List[str], length: SummaryLength) -> str:
+        """
+        Combines partial summaries, re-summarizing them in chunks first while they do not fit
+        one request. A pass that does not shrink them (outputs as long as the chunks, e.g. when
+        `openai_max_output_tokens` is close to `openai_chunk_tokens`) stops the passes, and
+        whatever still exceeds the budget is cut off.
+        """
+        budget = self.settings.openai_chunk_tokens
+        for _ in range(MAX_REDUCE_PASSES):
+            if len(partial_summaries) == 1 and length == SummaryLength.DETAILED:
+                return partial_summaries[0]
+            combined = "\n\n".join(partial_summaries)
+            if estimate_tokens(combined) <= budget:
+                break
+            reduced = await self.summarize_chunks(self.split_text_into_chunks(combined))
+            if estimate_tokens("\n\n".join(reduced)) >= estimate_tokens(combined):
+                break
+            partial_summaries = reduced
+        combined = "\n\n".join(partial_summaries)
+        if estimate_tokens(combined) > budget:
+            logger.warning(
+                f"Partial summaries still have ~{estimate_tokens(combined)} tokens after reducing, "
+                f"truncating them to {budget}"
+            )
+            combined = combined[:budget * 4]
+        # ~1.3 tokens per word, plus some slack so the answer is not cut off
+        max_tokens = max(self.settings.openai_max_output_tokens, length.target_words * 2)
+        return await self._complete(REDUCE_PROMPT.format(max_words=length.target_words), combined, max_tokens)
+
+    async def _complete(self, instruction: str, content: str, max_tokens: Optional[int] = None) -> str:
+        """Sends one chat completion request within the rate limits, retrying with full jitter."""
+        max_tokens = max_tokens or self.settings.openai_max_output_tokens
+        payload = {
+            "model": self.settings.openai_model,
+            "messages": [
+                {"role": "system", "content": instruction},
+                {"role": "user", "content": content},
+            ],
+            "max_tokens": max_tokens,
+        }
+        estimated_tokens = estimate_tokens(instruction) + estimate_tokens(content) + max_tokens
+
+        for attempt in range(self.settings.openai_max_retries + 1):
+            await self.rate_limiter.acquire(estimated_tokens)
+            retry_after = None
+            try:
+                response = await self.http_client.post("/chat/completions", json=payload)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    body = response.json()
+                    self._settle_token_usage(body, estimated_tokens)
+                    return body["choices"][0]["message"]["content"].strip()
+                retry_after = self._retry_after_seconds(response)
+                error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                error = str(e) or e.__class__.__name__
+
+            if attempt == self.settings.openai_max_retries:
+                raise RuntimeError(f"OpenAI request failed after {attempt + 1} attempts: {error}")
+
+            delay = random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            logger.warning(f"OpenAI request failed ({error}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def _settle_token_usage(self, body: dict, estimated_tokens: int):
+        """Charges or refunds the difference between the estimated and the billed tokens."""
+        total_tokens = (body.get("usage") or {}).get("total_tokens")
+        if total_tokens is not None:
+            self.rate_limiter.tokens.adjust(total_tokens - estimated_tokens)
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("retry-after")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
@@ -1,10 +1,12 @@
 # src/summarization/infrastructure/summary_repository.py
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
 
 from src.summarization.domain.interfaces import ISummaryRepository
-from src.summarization.domain.summary import Summary
+from src.summarization.domain.summary import ChunkSummary, Summary, SummaryChapter, SummaryLength, SummaryStatusView
 
 
 class SummaryRepository(ISummaryRepository):
@@ -17,12 +19,73 @@ class SummaryRepository(ISummaryRepository):
         await self.session.refresh(summary)
         return summary
 
-    async def find_by_transcription_id(self, transcription_id: str) -> Optional[Summary]:
-        stmt = select(Summary).where(Summary.transcription_id == transcription_id)
+    @staticmethod
+    def _select(with_text: bool):
+        """Summaries are loaded without their (deferred) text unless the caller needs it."""
+        stmt = select(Summary)
+        return stmt.options(undefer(Summary.text)) if with_text else stmt
+
+    async def find_by_transcription_id(
+        self, transcription_id: str, length: SummaryLength = SummaryLength.DETAILED, with_text: bool = False
+    ) -> Optional[Summary]:
+        stmt = self._select(with_text).where(Summary.transcription_id == transcription_id, Summary.length == length)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def find_by_id(self, summary_id: str) -> Optional[Summary]:
-        stmt = select(Summary).where(Summary.id == summary_id)
+    async def list_by_transcription_id(self, transcription_id: str, with_text: bool = False) -> List[Summary]:
+        stmt = self._select(with_text).where(Summary.transcription_id == transcription_id).order_by(Summary.created_at)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def find_by_id(self, summary_id: str, with_text: bool = False) -> Optional[Summary]:
+        stmt = self._select(with_text).where(Summary.id == summary_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def find_status_by_id(self, summary_id: str) -> Optional[SummaryStatusView]:
+        stmt = select(
+            Summary.id,
+            Summary.transcription_id,
+            Summary.length,
+            Summary.status,
+            Summary.provider,
+            Summary.processed_at,
+            Summary.error_message,
+        ).where(Summary.id == summary_id)
+        row = (await self.session.execute(stmt)).first()
+        return SummaryStatusView(**row._mapping) if row else None
+
+    async def find_chunk_summaries(self, transcription_id: str, provider: str) -> List[ChunkSummary]:
+        stmt = (
+            select(ChunkSummary)
+            .where(ChunkSummary.transcription_id == transcription_id, ChunkSummary.provider == provider)
+            .order_by(ChunkSummary.position)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def replace_chunk_summaries(
+        self, transcription_id: str, provider: str, chunk_summaries: List[ChunkSummary]
+    ) -> List[ChunkSummary]:
+        await self.session.execute(
+            delete(ChunkSummary).where(
+                ChunkSummary.transcription_id == transcription_id, ChunkSummary.provider == provider
+            )
+        )
+        self.session.add_all(chunk_summaries)
+        await self.session.commit()
+        return chunk_summaries
+
+    async def add_chapter(self, chapter: SummaryChapter) -> SummaryChapter:
+        self.session.add(chapter)
+        await self.session.commit()
+        return chapter
+
+    async def delete_chapters(self, summary_id: str):
+        await self.session.execute(delete(SummaryChapter).where(SummaryChapter.summary_id == summary_id))
+        await self.session.commit()
+
+    async def find_chapters(self, summary_id: str) -> List[SummaryChapter]:
+        stmt = select(SummaryChapter).where(SummaryChapter.summary_id == summary_id).order_by(SummaryChapter.position)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
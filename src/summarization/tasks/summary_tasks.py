@@ -3,15 +3,19 @@ from celery import shared_task
 
 from src.shared.infrastructure.database import get_db
 # Import the new CQRS components
+from src.summarization.application.chapter_segmenter import ChapterSegmenter
 from src.summarization.application.commands.process_summary_command import ProcessSummaryCommand
 from src.summarization.application.commands.process_summary_command_handler import ProcessSummaryCommandHandler
+from src.summarization.config.settings import SummarizationSettings
+from src.summarization.domain.summary import SummaryLength
 from src.summarization.infrastructure.dependencies import create_summarizer_service
+from src.storage.infrastructure.dependencies import run_closing_storage_services
 # Import the container to help build dependencies
 from src.shared.container import ApplicationContainer
 
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
-def process_summary_task(self, transcription_id: str, provider: str):
+def process_summary_task(self, transcription_id: str, provider: str, length: str = SummaryLength.DETAILED.value):
     """
     Celery entrypoint to trigger the summarization pipeline with a specific provider.
     """
@@ -22,25 +26,42 @@ def process_summary_task(self, transcription_id: str, provider: str):
             await container.initialize(db_session)
 
             # 1. Create the specific summarizer instance using the factory
+            settings = SummarizationSettings()
             summarizer_instance = create_summarizer_service(provider)
-            
+            # Cheaper providers answer when the requested one is tripped or over its latency budget
+            fallback_summarizers = [
+                create_summarizer_service(name.strip())
+                for name in settings.fallback_providers.split(",")
+                if name.strip() and name.strip() != provider
+            ]
+
             # 2. Create the command handler with all its dependencies
             handler = ProcessSummaryCommandHandler(
                 summarizer=summarizer_instance,
                 summary_repo=container["summary_repository"],
-                transcription_service=container["transcription_service"],
+                transcription_queries=container["transcription_queries"],
                 metrics_service=container["metrics_service"],
-                analytics_service=container["analytics_service"],
-                event_bus=container["event_bus"]
+                analytics_queries=container["analytics_queries"],
+                event_bus=container["event_bus"],
+                fallback_summarizers=fallback_summarizers,
+                latency_budget_seconds=settings.latency_budget_seconds,
+                progress_min_interval_seconds=settings.progress_min_interval_seconds,
+                chapter_segmenter=ChapterSegmenter(
+                    window_sentences=settings.chapter_window_sentences,
+                    min_chapter_sentences=settings.chapter_min_sentences,
+                    max_chapters=settings.chapter_max_chapters
+                ),
+                chapter_max_concurrency=settings.chapter_max_concurrency
             )
             
             # 3. Create the command object
             command = ProcessSummaryCommand(
                 transcription_id=transcription_id,
-                provider=provider
+                provider=provider,
+                length=SummaryLength(length)
             )
 
             # 4. Execute the handler
             await handler.handle(command)
 
-    asyncio.run(run())
+    asyncio.run(run_closing_storage_services(run()))
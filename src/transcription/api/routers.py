@@ -1,13 +1,24 @@
-from typing import Optional
+import json
+from typing import Optional, AsyncIterator
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from src.auth.api.dependencies import get_current_user
 from src.auth.domain.user import User
 # Import the correct CQRS dependencies
-from src.shared.dependencies import get_summarization_service, get_transcription_queries
+from src.shared.dependencies import (
+    get_summarization_service, get_transcription_queries, get_event_bus_service, get_summary_queries
+)
+from src.shared.events.event_bus import EventBus
+from src.shared.utils.conditional_requests import http_date, is_not_modified, make_etag
+from src.summarization.application.progress_reporter import stream_progress
+from src.summarization.application.queries.summary_queries import SummaryQueries
 from src.summarization.application.summarization_service import SummarizationService
+from src.summarization.domain.summary import SummaryLength
+from src.transcription.application.queries.transcript_export import ExportFormat, SUBTITLE_FORMATS, iter_export
 from src.transcription.application.queries.transcription_queries import TranscriptionQueries
+from src.transcription.domain.transcription import TranscriptionStatus
 from .schemas import TranscriptionResponse
 
 router = APIRouter(prefix="/transcriptions", tags=["Transcriptions"])
@@ -19,7 +30,7 @@ async def get_transcription_by_id(
     queries: TranscriptionQueries = Depends(get_transcription_queries)
 ):
     """Retrieves a transcription by its ID."""
-    transcription = await queries.get_by_id(transcription_id)
+    transcription = await queries.get_by_id(transcription_id, with_text=True)
 
     if not transcription:
         raise HTTPException(
@@ -29,6 +40,43 @@ async def get_transcription_by_id(
     return transcription
 
 
+@router.get("/{transcription_id}/export", summary="Download the transcript (streamed)")
+async def export_transcription(
+    transcription_id: str,
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.TXT, description="Output format"),
+    queries: TranscriptionQueries = Depends(get_transcription_queries),
+    _: User = Depends(get_current_user),
+):
+    """Streams the transcript in the requested format; supports If-None-Match and If-Modified-Since."""
+    transcription = await queries.get_by_id(transcription_id)
+    if not transcription:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transcription not found")
+    if transcription.status != TranscriptionStatus.COMPLETED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Transcription is not completed")
+    if format in SUBTITLE_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{format.value} export needs timed segments, which this transcription does not have"
+        )
+
+    # Weak: the compressed and uncompressed encodings of the export share the tag
+    version = transcription.text_checksum or transcription.processed_at
+    etag = make_etag(transcription.id, version, format.value, weak=True)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+    if transcription.processed_at:
+        headers["Last-Modified"] = http_date(transcription.processed_at)
+    if is_not_modified(request, etag, transcription.processed_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Disposition"] = f'attachment; filename="{transcription.id}.{format.value}"'
+    return StreamingResponse(
+        iter_export(transcription, queries.iter_text(transcription), format),
+        media_type=format.media_type,
+        headers=headers
+    )
+
+
 @router.post("/{transcription_id}/summarization", status_code=status.HTTP_202_ACCEPTED)
 async def request_summary_for_transcription(
     transcription_id: str,
@@ -38,7 +86,7 @@ async def request_summary_for_transcription(
     _: User = Depends(get_current_user),
 ):
     """Triggers an asynchronous summarization process for a given transcription."""
-    transcription = await queries.get_by_id(transcription_id)
+    transcription = await queries.get_status(transcription_id)
 
     if not transcription:
         raise HTTPException(
@@ -53,3 +101,55 @@ async def request_summary_for_transcription(
     )
 
     return {"message": "Summarization requested successfully"}
+
+
+# Seconds without progress before a keep-alive comment is sent on the stream
+PROGRESS_KEEPALIVE_SECONDS = 15.0
+# Longest a single stream stays open; clients reconnect and start from a fresh snapshot
+PROGRESS_MAX_STREAM_SECONDS = 3600.0
+
+
+@router.get("/{transcription_id}/summarization/progress", summary="Stream summarization progress (Server-Sent Events)")
+async def stream_summarization_progress(
+    transcription_id: str,
+    length: SummaryLength = Query(SummaryLength.DETAILED, description="The summary variant to follow."),
+    queries: TranscriptionQueries = Depends(get_transcription_queries),
+    summary_queries: SummaryQueries = Depends(get_summary_queries),
+    event_bus: EventBus = Depends(get_event_bus_service),
+    _: User = Depends(get_current_user),
+):
+    """
+    Sends the summary's current status, then relays its SummarizationProgress events
+    until the job completes or fails.
+    """
+    transcription = await queries.get_status(transcription_id)
+
+    if not transcription:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcription not found"
+        )
+
+    async def load_status():
+        summary = await summary_queries.get_status_by_transcription_id(transcription_id, length)
+        return summary.status if summary else None
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for event in stream_progress(
+            event_bus,
+            transcription_id,
+            length,
+            load_status,
+            keepalive_seconds=PROGRESS_KEEPALIVE_SECONDS,
+            max_seconds=PROGRESS_MAX_STREAM_SECONDS
+        ):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
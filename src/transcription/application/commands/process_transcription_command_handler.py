@@ -1,19 +1,25 @@
 # src/transcription/application/commands/process_transcription_command_handler.py
+import asyncio
 import time
+from typing import Dict, Optional, Tuple
+
 import structlog
 
 from src.metrics.application.metrics_service import MetricsService
 from src.shared.events.domain_events import TranscriptionCompleted, TranscriptionFailed, TranscriptionStarted
 from src.shared.events.event_bus import EventBus
+from src.storage.application.ranged_download import verify_sha256
 from src.storage.application.storage_service import StorageService
 from src.transcription.domain.transcription import Transcription, TranscriptionStatus
 from src.transcription.infrastructure.interfaces import ISpeechRecognition
+from src.transcription.infrastructure.transcript_blob_store import TranscriptBlobStore
 from src.transcription.infrastructure.transcription_repository import TranscriptionRepository
 from src.video_management.application.queries.video_queries import VideoQueries
 from src.video_management.infrastructure.video_repository import VideoRepository
 from .process_transcription_command import ProcessTranscriptionCommand
 # Import the circuit breaker factory
-from src.shared.resilience.circuit_breaker import get_circuit_breaker
+from src.shared.resilience.circuit_breaker import calling, get_circuit_breaker
+from src.shared.resilience.hedging import HedgeBudget, LatencyTracker, get_hedge_budget, get_latency_tracker
 
 logger = structlog.get_logger(__name__)
 
@@ -28,6 +34,11 @@ class ProcessTranscriptionCommandHandler:
         video_queries: VideoQueries,
         video_repository: VideoRepository,
         metrics_service: MetricsService,
+        backup_speech_recognition: Optional[ISpeechRecognition] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+        hedge_budget: Optional[HedgeBudget] = None,
+        hedge_percentile: float = 95.0,
+        transcript_store: Optional[TranscriptBlobStore] = None,
     ):
         self.speech_recognition = speech_recognition
         self.storage_service = storage_service
@@ -36,6 +47,15 @@ class ProcessTranscriptionCommandHandler:
         self.video_queries = video_queries
         self.video_repository = video_repository
         self.metrics_service = metrics_service
+        # Large transcripts are moved to object storage before the row is saved
+        self.transcript_store = transcript_store
+        # Hedging is enabled by passing a backup provider
+        self.backup_speech_recognition = backup_speech_recognition
+        self.hedge_percentile = hedge_percentile
+        if backup_speech_recognition:
+            service_key = f"transcription_{speech_recognition.provider_name}"
+            self.latency_tracker = latency_tracker or get_latency_tracker(service_key)
+            self.hedge_budget = hedge_budget or get_hedge_budget(service_key, ratio=0.05)
 
     async def handle(self, command: ProcessTranscriptionCommand) -> Transcription:
         start_time = time.time()
@@ -52,7 +72,7 @@ class ProcessTranscriptionCommandHandler:
             await self.video_repository.save(video)
             await self.event_bus.publish(TranscriptionStarted(video_id=command.video_id))
 
-            if transcription and transcription.text and transcription.status == TranscriptionStatus.COMPLETED:
+            if transcription and transcription.status == TranscriptionStatus.COMPLETED:
                 video.complete()
                 await self.video_repository.save(video)
                 logger.info("transcription.completed", video_id=command.video_id, from_cache=True)
@@ -67,15 +87,20 @@ class ProcessTranscriptionCommandHandler:
             await self.transcription_repo.save(transcription)
 
             audio_bytes, _ = await self.storage_service.download(video.file_path)
+            if video.checksum:
+                # SHA-256 recorded while the upload streamed to storage
+                await asyncio.to_thread(verify_sha256, audio_bytes, video.checksum, video.file_path)
 
-            # Get a circuit breaker for the specific provider
-            breaker_key = f"transcription_{self.speech_recognition.provider_name}"
-            breaker = get_circuit_breaker(breaker_key)
-
-            # Wrap the external call with the circuit breaker
-            text = await breaker.call_async(self.speech_recognition.transcribe, audio_bytes, language=command.language)
+            if self.backup_speech_recognition:
+                text, provider = await self._transcribe_hedged(audio_bytes, command.language)
+            else:
+                provider = self.speech_recognition
+                text = await self._transcribe(provider, audio_bytes, command.language)
 
+            transcription.provider = provider.provider_name
             transcription.mark_as_completed(text)
+            if self.transcript_store:
+                await self.transcript_store.offload(transcription)
             await self.transcription_repo.save(transcription)
             
             video.complete()
@@ -85,7 +110,7 @@ class ProcessTranscriptionCommandHandler:
 
             duration = time.time() - start_time
             self.metrics_service.increment_transcription('success')
-            self.metrics_service.observe_transcription_duration(video_id=command.video_id, duration=duration, provider=self.speech_recognition.provider_name)
+            self.metrics_service.observe_transcription_duration(video_id=command.video_id, duration=duration, provider=provider.provider_name)
 
             logger.info("transcription.completed", video_id=command.video_id, duration=duration)
             return transcription
@@ -105,3 +130,59 @@ class ProcessTranscriptionCommandHandler:
 
             await self.event_bus.publish(TranscriptionFailed(video_id=command.video_id, error=str(e)))
             raise
+
+    @staticmethod
+    async def _transcribe(speech_recognition: ISpeechRecognition, audio_bytes: bytes, language: str) -> Optional[str]:
+        """Calls one provider behind its circuit breaker."""
+        breaker = get_circuit_breaker(f"transcription_{speech_recognition.provider_name}")
+        with calling(breaker):
+            return await speech_recognition.transcribe(audio_bytes, language=language)
+
+    async def _transcribe_hedged(self, audio_bytes: bytes, language: str) -> Tuple[Optional[str], ISpeechRecognition]:
+        """
+        Starts the backup provider once the primary runs past the usual latency of audio of
+        this size (within the hedge budget). The first successful result wins; the other
+        call is cancelled. Providers run inference on a worker thread (`run_inference`), which
+        is what lets the timer fire while the primary works; a cancelled loser's thread still
+        runs to the end, holding its CPU until then.
+        """
+        size = len(audio_bytes)
+        self.hedge_budget.record_request()
+        hedge_after = self.latency_tracker.percentile(size, self.hedge_percentile)
+
+        started_at = time.monotonic()
+        primary = asyncio.create_task(self._transcribe(self.speech_recognition, audio_bytes, language))
+        calls: Dict[asyncio.Task, ISpeechRecognition] = {primary: self.speech_recognition}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if done or hedge_after is None or not self.hedge_budget.try_spend():
+                outcome = "not_needed" if done or hedge_after is None else "budget_exhausted"
+                text = await primary
+                self.latency_tracker.observe(size, time.monotonic() - started_at)
+                self.metrics_service.increment_transcription_hedge(outcome)
+                return text, self.speech_recognition
+
+            logger.info("transcription.hedged", hedge_after=hedge_after,
+                        backup_provider=self.backup_speech_recognition.provider_name)
+            backup = asyncio.create_task(self._transcribe(self.backup_speech_recognition, audio_bytes, language))
+            calls[backup] = self.backup_speech_recognition
+            winner = await self._first_successful(calls)
+        finally:
+            for task in calls:
+                task.cancel()
+
+        # A cancelled primary took at least this long, which keeps the percentile from drifting down
+        self.latency_tracker.observe(size, time.monotonic() - started_at)
+        self.metrics_service.increment_transcription_hedge("primary_won" if winner is primary else "backup_won")
+        return winner.result(), calls[winner]
+
+    @staticmethod
+    async def _first_successful(calls: Dict[asyncio.Task, ISpeechRecognition]) -> asyncio.Task:
+        """The first call to succeed; if every call fails, the primary's error is raised."""
+        pending = set(calls)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task
+        raise next(iter(calls)).exception()
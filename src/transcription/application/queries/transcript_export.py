@@ -0,0 +1,53 @@
+# src/transcription/application/queries/transcript_export.py
+import enum
+import json
+from typing import AsyncIterator
+
+from src.transcription.domain.transcription import Transcription
+
+
+class ExportFormat(str, enum.Enum):
+    SRT = "srt"
+    VTT = "vtt"
+    JSON = "json"
+    TXT = "txt"
+
+    @property
+    def media_type(self) -> str:
+        return _MEDIA_TYPES[self]
+
+
+_MEDIA_TYPES = {
+    ExportFormat.SRT: "application/x-subrip; charset=utf-8",
+    ExportFormat.VTT: "text/vtt; charset=utf-8",
+    ExportFormat.JSON: "application/json",
+    ExportFormat.TXT: "text/plain; charset=utf-8",
+}
+
+# Formats made of timed cues
+SUBTITLE_FORMATS = {ExportFormat.SRT, ExportFormat.VTT}
+
+
+async def iter_export(
+    transcription: Transcription, text_chunks: AsyncIterator[str], export_format: ExportFormat
+) -> AsyncIterator[str]:
+    """Formats the transcript as it is read, so the whole document is never held in memory."""
+    if export_format in SUBTITLE_FORMATS:
+        raise ValueError(f"{export_format.value} export needs timed segments")
+
+    if export_format == ExportFormat.TXT:
+        async for chunk in text_chunks:
+            yield chunk
+        return
+
+    header = json.dumps({
+        "id": str(transcription.id),
+        "video_id": str(transcription.video_id),
+        "provider": transcription.provider,
+        "processed_at": transcription.processed_at.isoformat() if transcription.processed_at else None,
+    })
+    # The text member is written last, one escaped chunk at a time
+    yield header[:-1] + ', "text": "'
+    async for chunk in text_chunks:
+        yield json.dumps(chunk)[1:-1]
+    yield '"}'
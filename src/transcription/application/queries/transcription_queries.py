@@ -1,20 +1,57 @@
 # src/transcription/application/queries/transcription_queries.py
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from src.transcription.domain.transcription import Transcription
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.transcription.domain.transcription import Transcription, TranscriptionStatusView
+from src.transcription.infrastructure.transcript_blob_store import TranscriptBlobStore
 from src.transcription.infrastructure.transcription_repository import TranscriptionRepository
 
 
 class TranscriptionQueries:
     """Handles all read-only operations for transcriptions."""
-    def __init__(self, transcription_repository: TranscriptionRepository):
+    def __init__(
+        self,
+        transcription_repository: TranscriptionRepository,
+        transcript_store: Optional[TranscriptBlobStore] = None,
+    ):
         self.transcription_repository = transcription_repository
+        self.transcript_store = transcript_store
+
+    async def get_by_id(self, transcription_id: str, with_text: bool = False) -> Optional[Transcription]:
+        """Retrieves a transcription by its unique ID; its text is only loaded `with_text`."""
+        transcription = await self.transcription_repository.find_by_id(transcription_id, with_text=with_text)
+        if transcription and with_text:
+            await self._load_offloaded_text(transcription)
+        return transcription
+
+    async def get_by_video_id(self, video_id: str, with_text: bool = False) -> Optional[Transcription]:
+        """Retrieves a transcription by its associated video ID; its text is only loaded `with_text`."""
+        transcription = await self.transcription_repository.find_by_video_id(video_id, with_text=with_text)
+        if transcription and with_text:
+            await self._load_offloaded_text(transcription)
+        return transcription
+
+    async def iter_text(self, transcription: Transcription, chunk_chars: int = 64 * 1024) -> AsyncIterator[str]:
+        """
+        Streams the text of a transcription (loaded with or without its text): offloaded
+        ones are decompressed as they go, inline ones are read with a text-only query.
+        """
+        if transcription.is_offloaded and self.transcript_store:
+            async for chunk in self.transcript_store.iter_text(transcription):
+                yield chunk
+            return
+
+        text = await self.transcription_repository.find_text(transcription.id)
+        for start in range(0, len(text or ""), chunk_chars):
+            yield text[start:start + chunk_chars]
 
-    async def get_by_id(self, transcription_id: str) -> Optional[Transcription]:
-        """Retrieves a transcription by its unique ID."""
-        return await self.transcription_repository.find_by_id(transcription_id)
+    async def _load_offloaded_text(self, transcription: Transcription):
+        """Fills in the text of an offloaded transcription without marking the row as changed."""
+        if transcription.is_offloaded and self.transcript_store:
+            set_committed_value(transcription, "text", await self.transcript_store.load_text(transcription))
 
-    async def get_by_video_id(self, video_id: str) -> Optional[Transcription]:
-        """Retrieves a transcription by its associated video ID."""
-        return await self.transcription_repository.find_by_video_id(video_id)
+    async def get_status(self, transcription_id: str) -> Optional[TranscriptionStatusView]:
+        """Retrieves the status of a transcription without its text."""
+        return await self.transcription_repository.find_status_by_id(transcription_id)
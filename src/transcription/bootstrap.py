@@ -2,15 +2,33 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 
+from src.storage.infrastructure.dependencies import StorageServiceFactory
 from src.transcription.application.queries.transcription_queries import TranscriptionQueries
+from src.transcription.config.settings import TranscriptionSettings
+from src.transcription.infrastructure.transcript_blob_store import TranscriptBlobStore
 from src.transcription.infrastructure.transcription_repository import TranscriptionRepository
 
-def bootstrap_transcription_module(db_session: AsyncSession) -> Dict[str, Any]:
+def bootstrap_transcription_module(
+    db_session: AsyncSession,
+    storage_factory: StorageServiceFactory,
+) -> Dict[str, Any]:
     """Constructs and returns the query services for the transcription module."""
+    settings = TranscriptionSettings()
     transcription_repository = TranscriptionRepository(db=db_session)
-    transcription_queries = TranscriptionQueries(transcription_repository=transcription_repository)
+    # Built even when offloading is off, so transcripts offloaded earlier stay readable
+    transcript_store = TranscriptBlobStore(
+        storage_service_factory=storage_factory,
+        provider=settings.offload_storage_provider or "local",
+        threshold_bytes=settings.offload_threshold_bytes,
+        compression_level=settings.offload_compression_level,
+    )
+    transcription_queries = TranscriptionQueries(
+        transcription_repository=transcription_repository,
+        transcript_store=transcript_store,
+    )
 
     return {
         "transcription_repository": transcription_repository,
         "transcription_queries": transcription_queries,
+        "transcript_store": transcript_store,
     }
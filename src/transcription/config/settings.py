@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings
+
+
+class TranscriptionSettings(BaseSettings):
+    # Hedging (opt-in): provider started when the requested one runs past its usual latency
+    hedge_provider: Optional[str] = None
+    # Latency percentile, among recent jobs with audio of similar size, after which the backup starts
+    hedge_percentile: float = 95.0
+    hedge_window: int = 200
+    hedge_min_samples: int = 20
+    # Fraction of jobs allowed to start a backup call
+    hedge_budget_ratio: float = 0.05
+    # Offloading (opt-in): transcripts from this size on are stored zstd-compressed with this storage provider
+    offload_storage_provider: Optional[str] = None
+    offload_threshold_bytes: int = 256 * 1024
+    offload_compression_level: int = 10
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+        env_prefix = "TRANSCRIPTION_"
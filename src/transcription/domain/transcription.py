@@ -1,7 +1,11 @@
 from sqlalchemy import Column, String, DateTime, Enum as SqlEnum, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 from src.shared.infrastructure.database import Base
+from src.shared.infrastructure.full_text_search import search_vector_column, search_vector_index, to_search_vector
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 import enum
 import uuid
 
@@ -14,22 +18,54 @@ class TranscriptionStatus(str, enum.Enum):
 
 class Transcription(Base):
     __tablename__ = "transcriptions"
+    __table_args__ = (search_vector_index("transcriptions"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id"), nullable=False, unique=True)
-    text = Column(Text, nullable=True)
+    # Deferred: loaded only by the repository's with_text queries. NULL once offloaded, see below.
+    text = deferred(Column(Text, nullable=True))
+    # Large transcripts live compressed in object storage; the row keeps a pointer and the text's SHA-256
+    text_blob_provider = Column(String, nullable=True)
+    text_blob_key = Column(String, nullable=True)
+    text_checksum = Column(String(64), nullable=True)
     status = Column(SqlEnum(TranscriptionStatus), default=TranscriptionStatus.PROCESSING, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     processed_at = Column(DateTime, nullable=True)
     error_message = Column(String, nullable=True)
     provider = Column(String, nullable=True)  # Added provider field, nullable for now
+    # Assigned from the text on completion, so it survives offloading
+    search_vector = search_vector_column()
+
+    @property
+    def is_offloaded(self) -> bool:
+        return self.text_blob_key is not None
 
     def mark_as_completed(self, text: str):
         self.text = text
+        self.text_blob_provider = self.text_blob_key = self.text_checksum = None
+        self.search_vector = to_search_vector(text)
         self.status = TranscriptionStatus.COMPLETED
         self.processed_at = datetime.utcnow()
 
+    def offload_text(self, provider: str, blob_key: str, checksum: str):
+        """Replaces the inline text with a pointer to its compressed copy in object storage."""
+        self.text = None
+        self.text_blob_provider = provider
+        self.text_blob_key = blob_key
+        self.text_checksum = checksum
+
     def mark_as_failed(self, error: str):
         self.status = TranscriptionStatus.FAILED
         self.error_message = error
         self.processed_at = datetime.utcnow()
+
+
+@dataclass(frozen=True)
+class TranscriptionStatusView:
+    """Lightweight projection of a transcription for status checks: everything but the text."""
+    id: uuid.UUID
+    video_id: uuid.UUID
+    status: TranscriptionStatus
+    provider: Optional[str]
+    processed_at: Optional[datetime]
+    error_message: Optional[str]
@@ -3,6 +3,8 @@ import importlib
 import pkgutil
 import pathlib
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.transcription.infrastructure.interfaces import ISpeechRecognition
 from src.transcription.infrastructure.transcription_repository import TranscriptionRepository
 
@@ -57,7 +59,7 @@ def _load_speech_recognition_plugins():
     package_name = __name__.rsplit(".", 1)[0]
 
     for _, module_name, _ in pkgutil.iter_modules([str(package_path)]):
-        if module_name.startswith("_") or module_name == "dependencies" or module_name == "interfaces":
+        if module_name.startswith("_") or module_name in ("dependencies", "interfaces", "transcript_blob_store"):
             continue
         full_module_name = f"{package_name}.{module_name}"
         importlib.import_module(full_module_name)
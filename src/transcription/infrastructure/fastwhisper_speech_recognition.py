@@ -4,7 +4,7 @@ import asyncio
 import logging
 from faster_whisper import WhisperModel
 
-from src.transcription.infrastructure.interfaces import ISpeechRecognition
+from src.transcription.infrastructure.interfaces import ISpeechRecognition, run_inference
 from src.transcription.infrastructure.dependencies import register_speech_recognition
 
 logger = logging.getLogger(__name__)
@@ -42,12 +42,11 @@ class FastWhisperTranscriber(ISpeechRecognition):
             raise RuntimeError(f"Transcription error: {str(e)}")
 
     async def _transcribe_audio(self, audio: np.ndarray, language: str) -> str:
-        loop = asyncio.get_running_loop()
-
         # Run recognition in a separate thread
-        segments, _ = await loop.run_in_executor(
-            None,
-            self.model.transcribe,
+        return await run_inference(self._run_model, audio, language)
+
+    def _run_model(self, audio: np.ndarray, language: str) -> str:
+        segments, _ = self.model.transcribe(
             audio,
             language=language,
             beam_size=5,
@@ -55,7 +54,7 @@ class FastWhisperTranscriber(ISpeechRecognition):
             vad_parameters=dict(min_silence_duration_ms=500),
         )
 
-        # Combine all text segments
+        # Combine all text segments; they are decoded lazily while iterating, so this stays on the thread
         return " ".join(segment.text for segment in segments)
 
     async def _decode_audio_bytes(self, file_bytes: bytes) -> Tuple[np.ndarray, int]:
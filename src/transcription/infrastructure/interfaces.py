@@ -1,5 +1,17 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_inference(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a blocking model call on a worker thread, so the event loop keeps serving other
+    coroutines (and the hedging timer racing this call can fire). Cancelling the caller returns
+    at once, but the thread cannot be interrupted: it runs the call to the end and its result is dropped.
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
 
 
 class ISpeechRecognition(ABC):
@@ -12,5 +24,8 @@ class ISpeechRecognition(ABC):
 
     @abstractmethod
     async def transcribe(self, file: bytes, language: str = "en") -> Optional[str]:
-        """Transcribes an audio file to text, with an optional language hint."""
+        """
+        Transcribes an audio file to text, with an optional language hint. Blocking inference
+        must go through `run_inference`, so concurrent calls can be raced and cancelled.
+        """
         pass
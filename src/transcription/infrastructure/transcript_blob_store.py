@@ -0,0 +1,94 @@
+# src/transcription/infrastructure/transcript_blob_store.py
+import codecs
+import hashlib
+import logging
+from typing import AsyncIterator, Optional
+
+import zstandard
+
+from src.storage.application.storage_service import StorageException
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.transcription.domain.transcription import Transcription
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class TranscriptBlobStore:
+    """
+    Keeps transcripts above `threshold_bytes` out of Postgres: they are stored
+    zstd-compressed through a StorageService and the row keeps a pointer and checksum.
+    """
+
+    def __init__(
+        self,
+        storage_service_factory: StorageServiceFactory,
+        provider: str,
+        threshold_bytes: int = 256 * 1024,
+        compression_level: int = 10,
+    ):
+        self.storage_service_factory = storage_service_factory
+        self.provider = provider
+        self.threshold_bytes = threshold_bytes
+        self.compression_level = compression_level
+
+    @staticmethod
+    def blob_key(transcription: Transcription) -> str:
+        return f"transcripts/{transcription.id}.txt.zst"
+
+    async def offload(self, transcription: Transcription) -> bool:
+        """Moves the transcript to object storage if it is large enough. Call before saving the row."""
+        if not transcription.text:
+            return False
+        data = transcription.text.encode("utf-8")
+        if len(data) < self.threshold_bytes:
+            return False
+
+        compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        blob_key = self.blob_key(transcription)
+        await self.storage_service_factory(self.provider).upload(blob_key, compressed)
+        transcription.offload_text(self.provider, blob_key, hashlib.sha256(data).hexdigest())
+        logger.info(f"Offloaded transcript {transcription.id}: {len(data)} -> {len(compressed)} bytes")
+        return True
+
+    async def iter_text(self, transcription: Transcription) -> AsyncIterator[str]:
+        """
+        Streams the transcript, decompressing the blob as its ranged read arrives, so the
+        compressed blob is never held whole; the checksum is verified at the end.
+        """
+        if not transcription.is_offloaded:
+            if transcription.text:
+                yield transcription.text
+            return
+
+        storage_service = self.storage_service_factory(transcription.text_blob_provider)
+        metadata = await storage_service.stat(transcription.text_blob_key)
+        if metadata is None:
+            raise StorageException(f"Transcript blob {transcription.text_blob_key} not found")
+
+        digest = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        blob = storage_service.iter_range(
+            transcription.text_blob_key, 0, metadata.size - 1, chunk_size=READ_CHUNK_BYTES
+        )
+        async for compressed in blob:
+            data = decompressor.decompress(compressed)
+            digest.update(data)
+            # Text compresses well, so one read can expand a lot; it is yielded in bounded pieces
+            view = memoryview(data)
+            for offset in range(0, len(view), READ_CHUNK_BYTES):
+                text = decoder.decode(view[offset:offset + READ_CHUNK_BYTES])
+                if text:
+                    yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+        if digest.hexdigest() != transcription.text_checksum:
+            raise StorageException(f"Checksum mismatch for transcript blob {transcription.text_blob_key}")
+
+    async def load_text(self, transcription: Transcription) -> Optional[str]:
+        if not transcription.is_offloaded:
+            return transcription.text
+        return "".join([chunk async for chunk in self.iter_text(transcription)])
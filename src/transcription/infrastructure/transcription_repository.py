@@ -1,9 +1,9 @@
 from typing import Sequence, Optional, Union
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import select, delete
-from src.transcription.domain.transcription import Transcription
+from src.transcription.domain.transcription import Transcription, TranscriptionStatusView
 import logging
 import asyncio
 
@@ -17,8 +17,19 @@ class TranscriptionRepository:
     def _is_async(self):
         return isinstance(self.db, AsyncSession)
 
-    async def find_by_id(self, transcription_id: Union[str, UUID]) -> Optional[Transcription]:
-        stmt = select(Transcription).where(Transcription.id == str(transcription_id)).execution_options(
+    async def _execute(self, stmt):
+        if self._is_async():
+            return await self.db.execute(stmt)
+        return self.db.execute(stmt)
+
+    @staticmethod
+    def _select(with_text: bool):
+        """Transcriptions are loaded without their (deferred) text unless the caller needs it."""
+        stmt = select(Transcription)
+        return stmt.options(undefer(Transcription.text)) if with_text else stmt
+
+    async def find_by_id(self, transcription_id: Union[str, UUID], with_text: bool = False) -> Optional[Transcription]:
+        stmt = self._select(with_text).where(Transcription.id == str(transcription_id)).execution_options(
             populate_existing=True)
         if self._is_async():
             result = await self.db.execute(stmt)
@@ -58,8 +69,8 @@ class TranscriptionRepository:
                 deleted = result.scalar() is not None
                 return deleted
 
-    async def find_by_video_id(self, video_id: Union[str, UUID]) -> Optional[Transcription]:
-        stmt = select(Transcription).where(Transcription.video_id == str(video_id))
+    async def find_by_video_id(self, video_id: Union[str, UUID], with_text: bool = False) -> Optional[Transcription]:
+        stmt = self._select(with_text).where(Transcription.video_id == str(video_id))
         if self._is_async():
             result = await self.db.execute(stmt)
             return result.scalar_one_or_none()
@@ -76,3 +87,21 @@ class TranscriptionRepository:
         else:
             result = self.db.execute(query)
             return result.scalar()
+
+    async def find_status_by_id(self, transcription_id: Union[str, UUID]) -> Optional[TranscriptionStatusView]:
+        """Status projection: reads neither the text nor its TOAST chunks."""
+        stmt = select(
+            Transcription.id,
+            Transcription.video_id,
+            Transcription.status,
+            Transcription.provider,
+            Transcription.processed_at,
+            Transcription.error_message,
+        ).where(Transcription.id == str(transcription_id))
+        row = (await self._execute(stmt)).first()
+        return TranscriptionStatusView(**row._mapping) if row else None
+
+    async def find_text(self, transcription_id: Union[str, UUID]) -> Optional[str]:
+        """Only the (inline) text of a transcription."""
+        stmt = select(Transcription.text).where(Transcription.id == str(transcription_id))
+        return (await self._execute(stmt)).scalar_one_or_none()
@@ -9,7 +9,7 @@ import io
 import resampy
 import logging
 
-from src.transcription.infrastructure.interfaces import ISpeechRecognition
+from src.transcription.infrastructure.interfaces import ISpeechRecognition, run_inference
 from src.transcription.infrastructure.dependencies import register_speech_recognition
 
 logger = logging.getLogger(__name__)
@@ -26,17 +26,19 @@ class WhisperTranscriber(ISpeechRecognition):
         return "whisper"
 
     async def transcribe(self, file: bytes, language: str = "en") -> Optional[str]:
-        path = None
         try:
             path = await self._decode_file_bytes(file)
-            result = self.model.transcribe(path, language=language)
-            return result["text"]
+            return await run_inference(self._transcribe_file, path, language)
         except Exception as e:
             logger.error(f"Transcription failed: {str(e)}")
             raise RuntimeError(f"Transcription error: {str(e)}")
+
+    def _transcribe_file(self, path: str, language: str) -> str:
+        # The thread removes the file itself: it outlives the call when that is cancelled
+        try:
+            return self.model.transcribe(path, language=language)["text"]
         finally:
-            if path and os.path.exists(path):
-                os.unlink(path)
+            os.unlink(path)
 
     async def _decode_audio_bytes(self, file_bytes: bytes) -> np.ndarray:
         """Decodes audio or audio-track-from-video to float32 mono 16kHz"""
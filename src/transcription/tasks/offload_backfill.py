@@ -0,0 +1,100 @@
+# src/transcription/tasks/offload_backfill.py
+"""
+Moves existing large transcripts to object storage.
+
+    python -m src.transcription.tasks.offload_backfill --provider s3 --batch-size 200 [--dry-run]
+"""
+import argparse
+import asyncio
+import sys
+from typing import List
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from src.shared.infrastructure.full_text_search import to_search_vector
+from src.transcription.config.settings import TranscriptionSettings
+from src.transcription.domain.transcription import Transcription
+from src.transcription.infrastructure.transcript_blob_store import TranscriptBlobStore
+
+logger = structlog.get_logger(__name__)
+
+
+async def backfill_offloaded_transcripts(
+    session: AsyncSession, store: TranscriptBlobStore, batch_size: int = 200, dry_run: bool = False
+) -> dict:
+    """
+    Offloads every inline transcript of at least the store's threshold, one keyset-paginated
+    batch (and one commit) at a time, so memory stays bounded and the job can be resumed.
+    """
+    stats = {"offloaded": 0, "bytes": 0}
+    last_id = None
+    while True:
+        stmt = (
+            select(Transcription)
+            .options(undefer(Transcription.text))
+            .where(
+                Transcription.text_blob_key.is_(None),
+                # Read from the TOAST header, without decompressing the text
+                func.octet_length(Transcription.text) >= store.threshold_bytes,
+            )
+            .order_by(Transcription.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            stmt = stmt.where(Transcription.id > last_id)
+        batch: List[Transcription] = list((await session.execute(stmt)).scalars().all())
+        if not batch:
+            break
+
+        for transcription in batch:
+            stats["offloaded"] += 1
+            stats["bytes"] += len(transcription.text.encode("utf-8"))
+            if not dry_run:
+                # Rows written before the search vector was assigned in code get it now, while the text is at hand
+                transcription.search_vector = to_search_vector(transcription.text)
+                await store.offload(transcription)
+        last_id = batch[-1].id
+
+        if not dry_run:
+            await session.commit()
+        session.expunge_all()
+        logger.info("transcription.offload_backfill.batch", dry_run=dry_run, **stats)
+
+    return stats
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    from src.shared.infrastructure.database import AsyncSessionLocal
+    from src.storage.infrastructure.dependencies import create_storage_service, run_closing_storage_services
+
+    settings = TranscriptionSettings()
+    store = TranscriptBlobStore(
+        storage_service_factory=create_storage_service,
+        provider=args.provider or settings.offload_storage_provider or "local",
+        threshold_bytes=args.threshold_bytes or settings.offload_threshold_bytes,
+        compression_level=settings.offload_compression_level,
+    )
+    async with AsyncSessionLocal() as session:
+        return await run_closing_storage_services(
+            backfill_offloaded_transcripts(session, store, batch_size=args.batch_size, dry_run=args.dry_run)
+        )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.transcription.tasks.offload_backfill", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", help="Storage provider (default: TRANSCRIPTION_OFFLOAD_STORAGE_PROVIDER)")
+    parser.add_argument("--threshold-bytes", type=int, help="Minimum transcript size to offload")
+    parser.add_argument("--batch-size", type=int, default=200, help="Rows offloaded per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the rows that would be offloaded")
+    args = parser.parse_args(argv)
+    stats = asyncio.run(_main(args))
+    print(f"{'Would offload' if args.dry_run else 'Offloaded'} {stats['offloaded']} transcripts ({stats['bytes']} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,16 +5,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.events.event_bus import get_event_bus
 from src.shared.infrastructure.database import get_db
-from src.storage.infrastructure.dependencies import get_storage_service_factory
+from src.shared.resilience.hedging import get_hedge_budget, get_latency_tracker
+from src.storage.infrastructure.dependencies import get_storage_service_factory, run_closing_storage_services
+from src.transcription.config.settings import TranscriptionSettings
 # Import the new CQRS components
 from src.transcription.application.commands.process_transcription_command import ProcessTranscriptionCommand
 from src.transcription.application.commands.process_transcription_command_handler import ProcessTranscriptionCommandHandler
 from src.transcription.infrastructure.dependencies import get_transcription_repository, create_speech_recognition_service
+from src.transcription.infrastructure.transcript_blob_store import TranscriptBlobStore
 # Import dependencies for manual construction
 from src.video_management.application.queries.video_queries import VideoQueries
 from src.video_management.infrastructure.video_repository import VideoRepository
 from src.metrics.application.metrics_service import MetricsService
-from src.metrics.infrastructure.prometheus_provider import PrometheusMetricsProvider
+from src.metrics.infrastructure.prometheus_provider import get_prometheus_metrics_provider
 
 logger = structlog.get_logger(__name__)
 
@@ -23,7 +26,7 @@ logger = structlog.get_logger(__name__)
 def process_transcription_task(self, video_id: str, provider: str, language: str = "en"):
     """Celery async task to process video transcription with a specific provider."""
     try:
-        return asyncio.run(_run_transcription(video_id, provider, language))
+        return asyncio.run(run_closing_storage_services(_run_transcription(video_id, provider, language)))
     except Exception as e:
         logger.error(f"Error in transcription task for video {video_id}: {str(e)}", exc_info=True)
         return None
@@ -37,7 +40,7 @@ async def _run_transcription(video_id: str, provider: str, language: str):
 
         # --- Manual Dependency Injection for Celery Task ---
         event_bus = get_event_bus()
-        metrics_service = MetricsService(provider=PrometheusMetricsProvider())
+        metrics_service = MetricsService(provider=get_prometheus_metrics_provider())
         storage_service_factory = get_storage_service_factory()
         
         # The handler needs to read video data and write its updated state
@@ -54,6 +57,19 @@ async def _run_transcription(video_id: str, provider: str, language: str):
         speech_recognition_service = create_speech_recognition_service(provider)
         transcription_repository = await get_transcription_repository(db_session)
 
+        settings = TranscriptionSettings()
+        backup_service = None
+        if settings.hedge_provider and settings.hedge_provider != provider:
+            backup_service = create_speech_recognition_service(settings.hedge_provider)
+        transcript_store = None
+        if settings.offload_storage_provider:
+            transcript_store = TranscriptBlobStore(
+                storage_service_factory=storage_service_factory,
+                provider=settings.offload_storage_provider,
+                threshold_bytes=settings.offload_threshold_bytes,
+                compression_level=settings.offload_compression_level,
+            )
+
         # 1. Create the command handler
         handler = ProcessTranscriptionCommandHandler(
             speech_recognition=speech_recognition_service,
@@ -62,7 +78,14 @@ async def _run_transcription(video_id: str, provider: str, language: str):
             transcription_repository=transcription_repository,
             video_queries=video_queries,
             video_repository=video_repository,
-            metrics_service=metrics_service
+            metrics_service=metrics_service,
+            backup_speech_recognition=backup_service,
+            latency_tracker=get_latency_tracker(
+                f"transcription_{provider}", window=settings.hedge_window, min_samples=settings.hedge_min_samples
+            ),
+            hedge_budget=get_hedge_budget(f"transcription_{provider}", ratio=settings.hedge_budget_ratio),
+            hedge_percentile=settings.hedge_percentile,
+            transcript_store=transcript_store,
         )
         
         # 2. Create the command
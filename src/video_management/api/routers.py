@@ -1,22 +1,61 @@
 # src/video_management/api/routers.py
 import io
 import os
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, UploadFile, Depends, HTTPException, status, File, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, UploadFile, Depends, HTTPException, Request, Response, status, File, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.encoders import jsonable_encoder
 
 from src.auth.api.dependencies import get_current_user
 from src.auth.domain.user import User
 from src.shared.dependencies import get_service, get_video_queries
+from src.shared.utils.conditional_requests import (
+    RangeNotSatisfiable, http_date, if_range_matches, is_not_modified, make_etag, parse_byte_range,
+)
+from src.storage.application.storage_service import StorageException
+from src.storage.application.upload_stream import IncompleteUploadError, UploadTooLargeError
+from src.video_management.application.commands.complete_upload_command import CompleteUploadCommand
+from src.video_management.application.commands.create_upload_command import CreateUploadCommand
+from src.video_management.application.commands.upload_chunk_command import UploadChunkCommand
+from src.video_management.application.commands.upload_content_command import UploadContentCommand
 from src.video_management.application.commands.upload_video_command import UploadVideoCommand
-from src.video_management.application.video_service import VideoService
+from src.video_management.application.video_service import VideoContent, VideoService
 from src.video_management.application.queries.video_queries import VideoQueries
-from .schemas import VideoResponse, VideoDetailResponse
+from src.video_management.domain.video_upload import InvalidChunkError, UploadOffsetMismatchError, VideoUpload
+from .schemas import (
+    CreateUploadRequest, PresignedRequestResponse, ResumableUploadResponse, UploadTicketResponse, VideoResponse,
+    VideoDetailResponse,
+)
 from .dependencies import get_video_settings
 from ..config.settings import VideoSettings
 
+# Size of the reads from the spooled upload file; bounds the memory one upload holds at a time
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Carries the offset a resumable upload continues at
+UPLOAD_OFFSET_HEADER = "Upload-Offset"
+# Video files are per-user, so only the browser may cache them
+CONTENT_CACHE_CONTROL = "private, max-age=3600"
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        yield chunk
+
+
+def _file_too_large(settings: VideoSettings) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"File too large. Max size is {settings.max_file_size_mb}MB")
+
+
+def _validate_upload(filename: Optional[str], size: Optional[int], settings: VideoSettings):
+    """Rejects files of a format not allowed, or larger than the limit when the size is known up front."""
+    _, file_ext = os.path.splitext(filename or "")
+    if file_ext.lower() not in settings.allowed_extensions:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid file format. Allowed formats: {', '.join(settings.allowed_extensions)}")
+    if size is not None and size > settings.max_file_size_bytes:
+        raise _file_too_large(settings)
+
+
 router = APIRouter(
     prefix="/videos",
     tags=["Videos"],
@@ -34,23 +73,208 @@ async def create_video(
 ):
     """Uploads a video file to create a new video resource."""
     try:
-        _, file_ext = os.path.splitext(file.filename or "")
-        if file_ext.lower() not in settings.allowed_extensions:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid file format. Allowed formats: {', '.join(settings.allowed_extensions)}")
+        _validate_upload(file.filename, file.size, settings)
 
-        if file.size > settings.max_file_size_bytes:
-            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"File too large. Max size is {settings.max_file_size_mb}MB")
-
-        command = UploadVideoCommand(user_id=str(current_user.id), file=await file.read(), filename=file.filename, storage_provider=storage_provider)
-        video = await video_service.create_video(command)
+        command = UploadVideoCommand(
+            user_id=str(current_user.id),
+            file=_iter_upload(file),
+            filename=file.filename,
+            storage_provider=storage_provider,
+            max_bytes=settings.max_file_size_bytes
+        )
+        try:
+            video = await video_service.create_video(command)
+        except UploadTooLargeError:
+            raise _file_too_large(settings)
         return jsonable_encoder(video)
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Upload failed: {str(e)}") from e
 
 
+@router.post("/uploads", response_model=UploadTicketResponse, status_code=status.HTTP_201_CREATED, summary="Start a direct upload")
+async def create_upload(
+    body: CreateUploadRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    video_service: VideoService = Depends(get_service("video_service")),
+    settings: VideoSettings = Depends(get_video_settings),
+):
+    """
+    Step one of a direct upload. The response lists the requests that send the file straight to
+    storage: one presigned PUT, or one per part for large files on S3. Local storage gets a
+    tokenized URL on this API instead. Once they succeed, POST to `complete_url`.
+    """
+    _validate_upload(body.filename, body.size, settings)
+
+    command = CreateUploadCommand(
+        user_id=str(current_user.id), filename=body.filename, size=body.size, storage_provider=body.storage_provider
+    )
+    try:
+        ticket = await video_service.create_upload(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except StorageException as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Could not start the upload: {e}") from e
+
+    upload_id = str(ticket.upload.id)
+    if ticket.direct_upload:
+        requests = [
+            PresignedRequestResponse(method=r.method, url=r.url, part_number=r.part_number)
+            for r in ticket.direct_upload.requests
+        ]
+    else:
+        url = request.url_for("upload_video_content", upload_id=upload_id).include_query_params(token=ticket.token)
+        requests = [PresignedRequestResponse(method="PUT", url=str(url))]
+    return UploadTicketResponse(
+        upload_id=upload_id,
+        expires_at=ticket.upload.expires_at,
+        part_size=ticket.direct_upload.part_size if ticket.direct_upload else None,
+        requests=requests,
+        complete_url=str(request.url_for("complete_video_upload", upload_id=upload_id)),
+    )
+
+
+def _resumable_upload_response(request: Request, response: Response, upload: VideoUpload) -> ResumableUploadResponse:
+    upload_id = str(upload.id)
+    response.headers[UPLOAD_OFFSET_HEADER] = str(upload.received_bytes)
+    return ResumableUploadResponse(
+        upload_id=upload_id,
+        status=upload.status.value,
+        size=upload.size,
+        offset=upload.received_bytes,
+        chunk_size=upload.chunk_size,
+        expires_at=upload.expires_at,
+        chunk_url=str(request.url_for("upload_video_chunk", upload_id=upload_id)),
+        complete_url=str(request.url_for("complete_video_upload", upload_id=upload_id)),
+    )
+
+
+@router.post("/uploads/resumable", response_model=ResumableUploadResponse, status_code=status.HTTP_201_CREATED, summary="Start a resumable upload")
+async def create_resumable_upload(
+    body: CreateUploadRequest,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    video_service: VideoService = Depends(get_service("video_service")),
+    settings: VideoSettings = Depends(get_video_settings),
+):
+    """
+    Starts an upload sent in chunks: PUT each chunk to `chunk_url?offset=N`, in order. After a
+    failure, GET the upload (or read the Upload-Offset header of a 409) and continue from its
+    offset. Once `offset` equals `size`, POST to `complete_url`.
+    """
+    _validate_upload(body.filename, body.size, settings)
+
+    command = CreateUploadCommand(
+        user_id=str(current_user.id), filename=body.filename, size=body.size, storage_provider=body.storage_provider,
+        resumable=True,
+    )
+    try:
+        ticket = await video_service.create_upload(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except StorageException as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Could not start the upload: {e}") from e
+    return _resumable_upload_response(request, response, ticket.upload)
+
+
+@router.get("/uploads/{upload_id}", response_model=ResumableUploadResponse, summary="Get the progress of an upload")
+async def get_upload(
+    upload_id: UUID,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    video_queries: VideoQueries = Depends(get_video_queries),
+):
+    """Where a resumable upload continues: its `offset` is the number of bytes stored so far."""
+    upload = await video_queries.get_user_upload(str(upload_id), str(current_user.id))
+    if upload is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Upload {upload_id} not found")
+    response.headers["Cache-Control"] = "no-store"
+    return _resumable_upload_response(request, response, upload)
+
+
+@router.put("/uploads/{upload_id}/chunks", response_model=ResumableUploadResponse, name="upload_video_chunk", summary="Send one chunk of a resumable upload")
+async def upload_chunk(
+    upload_id: UUID,
+    request: Request,
+    response: Response,
+    offset: int = Query(..., ge=0, description="Byte offset of the chunk in the file; must be the upload's current offset"),
+    current_user: User = Depends(get_current_user),
+    video_service: VideoService = Depends(get_service("video_service")),
+):
+    """
+    The raw request body is the chunk: `chunk_size` bytes, or the rest of the file for the last
+    one. Resending a chunk whose response was lost is answered with 409 and the current offset.
+    """
+    command = UploadChunkCommand(
+        upload_id=str(upload_id), user_id=str(current_user.id), offset=offset, chunk=request.stream()
+    )
+    try:
+        upload = await video_service.upload_chunk(command)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadOffsetMismatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(e), headers={UPLOAD_OFFSET_HEADER: str(e.offset)}
+        )
+    except InvalidChunkError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except StorageException as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Could not store the chunk: {e}") from e
+    return _resumable_upload_response(request, response, upload)
+
+
+@router.put("/uploads/{upload_id}/content", status_code=status.HTTP_204_NO_CONTENT, name="upload_video_content", summary="Send the file of a direct upload to local storage")
+async def upload_video_content(
+    upload_id: UUID,
+    request: Request,
+    token: str = Query(..., description="The upload token from the upload's URL"),
+    video_service: VideoService = Depends(get_service("video_service")),
+):
+    """The raw request body is the file; it is streamed to storage as it arrives. The token authorizes the request."""
+    command = UploadContentCommand(upload_id=str(upload_id), token=token, file=request.stream())
+    try:
+        await video_service.upload_content(command)
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except StorageException as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Could not store the file: {e}") from e
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=VideoResponse, status_code=status.HTTP_201_CREATED, name="complete_video_upload", summary="Finish a direct upload")
+async def complete_upload(
+    upload_id: UUID,
+    current_user: User = Depends(get_current_user),
+    video_service: VideoService = Depends(get_service("video_service")),
+):
+    """Step two of a direct upload: verifies the stored file and creates the video. Safe to retry."""
+    command = CompleteUploadCommand(upload_id=str(upload_id), user_id=str(current_user.id))
+    try:
+        video = await video_service.complete_upload(command)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (IncompleteUploadError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except StorageException as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Could not complete the upload: {e}") from e
+    return jsonable_encoder(video)
+
+
 @router.get("/", response_model=List[VideoResponse], summary="List videos for the current user")
 async def list_current_user_videos(
     skip: int = 0, limit: int = 100, current_user: User = Depends(get_current_user), video_queries: VideoQueries = Depends(get_video_queries),
@@ -75,6 +299,68 @@ async def get_video_by_id(
     return jsonable_encoder(video)
 
 
+@router.get("/{video_id}/content", summary="Stream a video's file, with HTTP Range support")
+async def get_video_content(
+    video_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    video_queries: VideoQueries = Depends(get_video_queries),
+    video_service: VideoService = Depends(get_service("video_service")),
+):
+    """Serves the video file. `Range` (and `If-Range`) requests get 206 responses, so players can seek."""
+    if current_user.role.value == "admin":
+        video = await video_queries.get_video_by_id(video_id=str(video_id))
+    else:
+        video = await video_queries.get_video_by_user_by_id(video_id=str(video_id), user_id=str(current_user.id))
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    content = await video_service.get_video_content(video)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Video file not found")
+
+    local_path = content.storage_service.local_path(content.file_path)
+    if local_path is not None:
+        # Starlette answers Range/If-Range itself, and hands whole files to the server (pathsend) when it can
+        return FileResponse(local_path, media_type=content.media_type, headers={"Cache-Control": CONTENT_CACHE_CONTROL})
+    return _ranged_response(request, video_id, content)
+
+
+def _ranged_response(request: Request, video_id: UUID, content: VideoContent) -> Response:
+    """Streams the requested byte range of a remote file with ranged reads from storage."""
+    metadata = content.metadata
+    etag = metadata.etag or make_etag(video_id, metadata.size, metadata.last_modified.isoformat())
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": http_date(metadata.last_modified),
+        "Cache-Control": CONTENT_CACHE_CONTROL,
+    }
+    if is_not_modified(request, etag, metadata.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    if if_range_matches(request, etag, metadata.last_modified):
+        try:
+            byte_range = parse_byte_range(request.headers.get("range"), metadata.size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{metadata.size}"},
+            )
+
+    if byte_range is None:
+        start, end, status_code = 0, metadata.size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{metadata.size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    body = content.storage_service.iter_range(content.file_path, start, end) if metadata.size else iter(())
+    return StreamingResponse(body, status_code=status_code, media_type=content.media_type, headers=headers)
+
+
 @router.post("/{video_id}/transcription", status_code=status.HTTP_202_ACCEPTED, summary="Request transcription for a video")
 async def request_video_transcription(
     video_id: UUID,
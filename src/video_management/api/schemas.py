@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
@@ -26,3 +26,37 @@ class VideoDetailResponse(VideoResponse):
     model_config = {
         "from_attributes": True
     }
+
+
+class CreateUploadRequest(BaseModel):
+    filename: str
+    size: int = Field(..., gt=0, description="File size in bytes; the upload must match it")
+    storage_provider: str = "local"
+
+
+class PresignedRequestResponse(BaseModel):
+    method: str
+    url: str
+    part_number: Optional[int] = None
+
+
+class UploadTicketResponse(BaseModel):
+    upload_id: str
+    expires_at: datetime
+    # Multipart uploads: byte size of every part but the last, sent to the URL of its part number
+    part_size: Optional[int] = None
+    requests: List[PresignedRequestResponse]
+    complete_url: str
+
+
+class ResumableUploadResponse(BaseModel):
+    upload_id: str
+    status: str
+    size: int
+    # Bytes stored so far: the offset the next chunk starts at
+    offset: int
+    # Byte size of every chunk but the last
+    chunk_size: Optional[int] = None
+    expires_at: datetime
+    chunk_url: str
+    complete_url: str
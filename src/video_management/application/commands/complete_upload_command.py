@@ -0,0 +1,8 @@
+# src/video_management/application/commands/complete_upload_command.py
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CompleteUploadCommand:
+    upload_id: str
+    user_id: str
@@ -0,0 +1,93 @@
+# src/video_management/application/commands/complete_upload_command_handler.py
+from uuid import UUID
+
+import structlog
+
+from src.metrics.application.metrics_service import MetricsService
+from src.shared.events.domain_events import VideoUploaded
+from src.shared.events.event_bus import EventBus
+from src.storage.application.upload_stream import IncompleteUploadError
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.video_management.domain.video import Video, VideoStatus
+from src.video_management.domain.video_upload import UploadStatus
+from src.video_management.infrastructure.video_repository import VideoRepository
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
+from .complete_upload_command import CompleteUploadCommand
+
+logger = structlog.get_logger(__name__)
+
+
+class CompleteUploadCommandHandler:
+    def __init__(
+        self,
+        storage_service_factory: StorageServiceFactory,
+        upload_repository: VideoUploadRepository,
+        video_repository: VideoRepository,
+        event_bus: EventBus,
+        metrics_service: MetricsService,
+    ):
+        self.storage_service_factory = storage_service_factory
+        self.upload_repository = upload_repository
+        self.video_repository = video_repository
+        self.event_bus = event_bus
+        self.metrics_service = metrics_service
+
+    async def handle(self, command: CompleteUploadCommand) -> Video:
+        """
+        Verifies the uploaded file against the declared size and creates the Video. Completing
+        an already completed upload returns its video, so clients can safely retry.
+        """
+        upload = await self.upload_repository.find_by_id(UUID(command.upload_id), UUID(command.user_id))
+        if upload is None:
+            raise LookupError(f"Upload {command.upload_id} not found")
+
+        existing = await self.video_repository.find_by_id(upload.id)
+        if existing is not None:
+            if upload.status != UploadStatus.COMPLETED:
+                upload.mark_completed()
+                await self.upload_repository.save(upload)
+            return existing
+        if upload.status != UploadStatus.PENDING:
+            raise ValueError(f"Upload {command.upload_id} was {upload.status.value.lower()}")
+
+        storage_service = self.storage_service_factory(upload.storage_provider)
+        if upload.chunked_upload and upload.received_bytes != upload.size:
+            raise IncompleteUploadError(
+                f"Upload {command.upload_id} is incomplete: {upload.received_bytes} of {upload.size} bytes received"
+            )
+
+        metadata = await storage_service.stat(upload.file_path)
+        # An earlier attempt may have assembled the file and failed before creating the video:
+        # completing its multipart upload again would fail, as S3 no longer knows it
+        if metadata is None and (upload.chunked_upload or upload.multipart_upload_id):
+            if upload.chunked_upload:
+                await storage_service.complete_chunked_upload(upload.file_path, upload.chunked_upload, upload.size)
+            else:
+                await storage_service.complete_direct_upload(upload.file_path, upload.multipart_upload_id, upload.size)
+            metadata = await storage_service.stat(upload.file_path)
+        if metadata is None:
+            raise ValueError(f"The file of upload {command.upload_id} has not been uploaded yet")
+        if metadata.size != upload.size:
+            await storage_service.delete(upload.file_path)
+            upload.mark_aborted()
+            await self.upload_repository.save(upload)
+            self.metrics_service.increment_video_upload('failure')
+            raise ValueError(f"The uploaded file has {metadata.size} bytes, {upload.size} were declared")
+
+        video = Video(
+            id=upload.id,
+            user_id=upload.user_id,
+            file_path=upload.file_path,
+            status=VideoStatus.UPLOADED,
+            storage_provider=upload.storage_provider,
+            file_size=metadata.size,
+            checksum=upload.checksum,
+        )
+        saved_video = await self.video_repository.save(video)
+        upload.mark_completed()
+        await self.upload_repository.save(upload)
+
+        await self.event_bus.publish(VideoUploaded(video_id=str(upload.id), user_id=str(upload.user_id)))
+        self.metrics_service.increment_video_upload('success')
+        logger.info("video_upload.direct_completed", video_id=str(upload.id), size=metadata.size)
+        return saved_video
@@ -0,0 +1,13 @@
+# src/video_management/application/commands/create_upload_command.py
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CreateUploadCommand:
+    user_id: str
+    filename: str
+    # Declared size in bytes; the stored file must match it
+    size: int
+    storage_provider: str
+    # Send the file through the API in chunks that can be resumed after a failure
+    resumable: bool = False
@@ -0,0 +1,108 @@
+# src/video_management/application/commands/create_upload_command_handler.py
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import PurePath
+from typing import Optional
+from uuid import UUID, uuid4
+
+import structlog
+
+from src.storage.domain.direct_upload import ChunkedUpload, DirectUpload
+from src.storage.application.storage_service import StorageService
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.video_management.config.settings import VideoSettings
+from src.video_management.domain.video_upload import UploadStatus, VideoUpload, hash_upload_token
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
+from .create_upload_command import CreateUploadCommand
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class UploadTicket:
+    upload: VideoUpload
+    # Presigned requests to storage, for providers that support them
+    direct_upload: Optional[DirectUpload] = None
+    # Otherwise the secret that authorizes sending the file to the API
+    token: Optional[str] = None
+    # Resumable uploads: how the chunks sent to the API must be cut
+    chunked_upload: Optional[ChunkedUpload] = None
+
+
+class CreateUploadCommandHandler:
+    """
+    Starts a direct upload: the client is handed where to send the file, no bytes reach this
+    process. Resumable uploads are the exception; their chunks are received by the API.
+    """
+
+    def __init__(
+        self,
+        storage_service_factory: StorageServiceFactory,
+        upload_repository: VideoUploadRepository,
+        settings: VideoSettings,
+    ):
+        self.storage_service_factory = storage_service_factory
+        self.upload_repository = upload_repository
+        self.settings = settings
+
+    async def handle(self, command: CreateUploadCommand) -> UploadTicket:
+        upload_id = uuid4()
+        storage_service = self.storage_service_factory(command.storage_provider)
+        file_path = f"videos/{command.user_id}/{upload_id}/{PurePath(command.filename).name}"
+        if command.resumable:
+            return await self._start_resumable(command, upload_id, file_path, storage_service)
+        expires_in = self.settings.upload_url_ttl_seconds
+
+        direct_upload = await storage_service.create_direct_upload(file_path, command.size, expires_in)
+        token = None if direct_upload else secrets.token_urlsafe(32)
+        upload = VideoUpload(
+            id=upload_id,
+            user_id=UUID(command.user_id),
+            filename=command.filename,
+            file_path=file_path,
+            storage_provider=command.storage_provider,
+            size=command.size,
+            status=UploadStatus.PENDING,
+            multipart_upload_id=direct_upload.multipart_upload_id if direct_upload else None,
+            token_hash=hash_upload_token(token) if token else None,
+            expires_at=datetime.utcnow() + timedelta(seconds=expires_in),
+        )
+        await self.upload_repository.save(upload)
+
+        logger.info(
+            "video_upload.direct_started",
+            upload_id=str(upload_id),
+            provider=command.storage_provider,
+            size=command.size,
+            parts=len(direct_upload.requests) if direct_upload else None,
+        )
+        return UploadTicket(upload=upload, direct_upload=direct_upload, token=token)
+
+    async def _start_resumable(
+        self, command: CreateUploadCommand, upload_id: UUID, file_path: str, storage_service: StorageService
+    ) -> UploadTicket:
+        chunked_upload = await storage_service.start_chunked_upload(file_path, command.size)
+        upload = VideoUpload(
+            id=upload_id,
+            user_id=UUID(command.user_id),
+            filename=command.filename,
+            file_path=file_path,
+            storage_provider=command.storage_provider,
+            size=command.size,
+            status=UploadStatus.PENDING,
+            multipart_upload_id=chunked_upload.multipart_upload_id,
+            chunk_size=chunked_upload.chunk_size,
+            received_bytes=0,
+            expires_at=datetime.utcnow() + timedelta(seconds=self.settings.resumable_upload_ttl_seconds),
+        )
+        await self.upload_repository.save(upload)
+
+        logger.info(
+            "video_upload.resumable_started",
+            upload_id=str(upload_id),
+            provider=command.storage_provider,
+            size=command.size,
+            chunk_size=chunked_upload.chunk_size,
+        )
+        return UploadTicket(upload=upload, chunked_upload=chunked_upload)
@@ -0,0 +1,12 @@
+# src/video_management/application/commands/upload_chunk_command.py
+from dataclasses import dataclass
+from typing import AsyncIterable
+
+
+@dataclass(frozen=True)
+class UploadChunkCommand:
+    """One chunk of a resumable upload, starting `offset` bytes into the file."""
+    upload_id: str
+    user_id: str
+    offset: int
+    chunk: AsyncIterable[bytes]
@@ -0,0 +1,61 @@
+# src/video_management/application/commands/upload_chunk_command_handler.py
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import structlog
+
+from src.storage.application.upload_stream import MeteredStream
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.video_management.config.settings import VideoSettings
+from src.video_management.domain.video_upload import (
+    InvalidChunkError, UploadOffsetMismatchError, UploadStatus, VideoUpload,
+)
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
+from .upload_chunk_command import UploadChunkCommand
+
+logger = structlog.get_logger(__name__)
+
+
+class UploadChunkCommandHandler:
+    def __init__(
+        self,
+        storage_service_factory: StorageServiceFactory,
+        upload_repository: VideoUploadRepository,
+        settings: VideoSettings,
+    ):
+        self.storage_service_factory = storage_service_factory
+        self.upload_repository = upload_repository
+        self.settings = settings
+
+    async def handle(self, command: UploadChunkCommand) -> VideoUpload:
+        """
+        Stores the chunk that continues the upload and advances its offset. A chunk whose response
+        was lost is resent to the same offset and simply overwrites itself, so a failure costs at
+        most one chunk, never the whole file.
+        """
+        upload = await self.upload_repository.find_by_id(UUID(command.upload_id), UUID(command.user_id))
+        if upload is None or upload.chunked_upload is None:
+            raise LookupError(f"Resumable upload {command.upload_id} not found")
+        if upload.status != UploadStatus.PENDING or upload.is_expired:
+            raise ValueError(f"Upload {command.upload_id} is no longer accepting content")
+        if command.offset != upload.received_bytes:
+            raise UploadOffsetMismatchError(upload.received_bytes)
+
+        expected = upload.expected_chunk_length(command.offset)
+        data = bytearray()
+        async for piece in MeteredStream(command.chunk, max_bytes=expected):
+            data += piece
+        if len(data) != expected:
+            raise InvalidChunkError(f"The chunk at offset {command.offset} must be {expected} bytes, got {len(data)}")
+
+        storage_service = self.storage_service_factory(upload.storage_provider)
+        await storage_service.upload_chunk(upload.file_path, upload.chunked_upload, command.offset, bytes(data))
+
+        expires_at = datetime.utcnow() + timedelta(seconds=self.settings.resumable_upload_ttl_seconds)
+        received_bytes = command.offset + len(data)
+        if not await self.upload_repository.advance_offset(upload, command.offset, received_bytes, expires_at):
+            # A concurrent request stored the same chunk first
+            raise UploadOffsetMismatchError(upload.received_bytes)
+
+        logger.debug("video_upload.chunk_received", upload_id=command.upload_id, offset=command.offset, size=len(data))
+        return upload
@@ -0,0 +1,11 @@
+# src/video_management/application/commands/upload_content_command.py
+from dataclasses import dataclass
+from typing import AsyncIterable
+
+
+@dataclass(frozen=True)
+class UploadContentCommand:
+    """The file of a direct upload, for storage providers that cannot take it from the client themselves."""
+    upload_id: str
+    token: str
+    file: AsyncIterable[bytes]
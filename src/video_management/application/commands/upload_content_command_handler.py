@@ -0,0 +1,37 @@
+# src/video_management/application/commands/upload_content_command_handler.py
+from uuid import UUID
+
+import structlog
+
+from src.storage.application.upload_stream import MeteredStream
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.video_management.domain.video_upload import UploadStatus
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
+from .upload_content_command import UploadContentCommand
+
+logger = structlog.get_logger(__name__)
+
+
+class UploadContentCommandHandler:
+    def __init__(self, storage_service_factory: StorageServiceFactory, upload_repository: VideoUploadRepository):
+        self.storage_service_factory = storage_service_factory
+        self.upload_repository = upload_repository
+
+    async def handle(self, command: UploadContentCommand):
+        """Streams the file to storage, holding it to the declared size, and records its checksum."""
+        upload = await self.upload_repository.find_by_id(UUID(command.upload_id))
+        if upload is None or not upload.token_matches(command.token):
+            raise PermissionError("Invalid upload token")
+        if upload.status != UploadStatus.PENDING or upload.is_expired:
+            raise ValueError(f"Upload {command.upload_id} is no longer accepting content")
+
+        storage_service = self.storage_service_factory(upload.storage_provider)
+        stream = MeteredStream(command.file, max_bytes=upload.size)
+        await storage_service.upload_stream(upload.file_path, stream)
+        if stream.size != upload.size:
+            await storage_service.delete(upload.file_path)
+            raise ValueError(f"Expected {upload.size} bytes, received {stream.size}")
+
+        upload.checksum = stream.sha256
+        await self.upload_repository.save(upload)
+        logger.info("video_upload.content_received", upload_id=command.upload_id, size=stream.size)
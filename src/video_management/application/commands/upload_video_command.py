@@ -1,9 +1,13 @@
 # src/video_management/application/commands/upload_video_command.py
 from dataclasses import dataclass
+from typing import AsyncIterable, Optional, Union
 
 @dataclass(frozen=True)
 class UploadVideoCommand:
     user_id: str
-    file: bytes
+    # The file contents, or an async stream of chunks read straight from the request
+    file: Union[bytes, AsyncIterable[bytes]]
     filename: str
     storage_provider: str
+    # Enforced while streaming, for uploads whose size is not known up front
+    max_bytes: Optional[int] = None
@@ -1,13 +1,18 @@
 # src/video_management/application/commands/upload_video_command_handler.py
 import time
+from typing import Optional
 from uuid import uuid4
 import structlog
 
 from src.metrics.application.metrics_service import MetricsService
 from src.shared.events.domain_events import VideoUploaded
 from src.shared.events.event_bus import EventBus
+from src.storage.application.upload_stream import MeteredStream, UploadTooLargeError, iter_chunks
 from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.storage.application.storage_service import StorageService
 from src.video_management.domain.video import Video, VideoStatus
+from src.video_management.domain.video_blob import blob_path
+from src.video_management.infrastructure.video_blob_repository import VideoBlobRepository
 from src.video_management.infrastructure.video_repository import VideoRepository
 from .upload_video_command import UploadVideoCommand
 
@@ -21,11 +26,14 @@ class UploadVideoCommandHandler:
         event_bus: EventBus,
         video_repository: VideoRepository,
         metrics_service: MetricsService,
+        blob_repository: Optional[VideoBlobRepository] = None,
     ):
         self.storage_service_factory = storage_service_factory
         self.event_bus = event_bus
         self.video_repository = video_repository
         self.metrics_service = metrics_service
+        # Set to store files content-addressed, once per distinct content
+        self.blob_repository = blob_repository
 
     async def handle(self, command: UploadVideoCommand) -> Video:
         """Handles the video upload process."""
@@ -37,14 +45,22 @@ class UploadVideoCommandHandler:
             file_path = f"videos/{command.user_id}/{video_id}/{command.filename}"
             logger.info("video_upload.started", video_id=str(video_id), provider=command.storage_provider)
 
-            await storage_service.upload(file_path, command.file)
+            # Streamed to storage chunk by chunk, sized and hashed on the way
+            chunks = iter_chunks(command.file) if isinstance(command.file, bytes) else command.file
+            stream = MeteredStream(chunks, max_bytes=command.max_bytes)
+            await storage_service.upload_stream(file_path, stream)
+            stored_path = file_path
+            if self.blob_repository:
+                stored_path = await self._store_as_blob(storage_service, command, file_path, stream.sha256, stream.size)
 
             video = Video(
                 id=video_id,
                 user_id=command.user_id,
-                file_path=file_path,
+                file_path=stored_path,
                 status=VideoStatus.UPLOADED,
-                storage_provider=command.storage_provider
+                storage_provider=command.storage_provider,
+                file_size=stream.size,
+                checksum=stream.sha256
             )
             saved_video = await self.video_repository.save(video)
 
@@ -66,9 +82,32 @@ class UploadVideoCommandHandler:
         except Exception as e:
             self.metrics_service.increment_video_upload('failure')
             logger.error("video_upload.failed", video_id=str(video_id), error=str(e))
+            # Only this upload's own file: a blob may be shared, and orphaned ones are left to the GC
             if 'file_path' in locals():
                 try:
                     await storage_service.delete(file_path)
                 except Exception as cleanup_error:
                     logger.error("video_upload.cleanup_failed", video_id=str(video_id), error=str(cleanup_error))
+            if isinstance(e, UploadTooLargeError):
+                raise
             raise ValueError(f"Video upload failed: {str(e)}") from e
+
+    async def _store_as_blob(
+        self, storage_service: StorageService, command: UploadVideoCommand, file_path: str, sha256: str, size: int
+    ) -> str:
+        """
+        Moves the uploaded file to its content-addressed path, or drops it when that content is
+        already stored, so a duplicate only costs a reference. The reference commits with the video.
+        """
+        path = blob_path(sha256, command.filename)
+        try:
+            references = await self.blob_repository.acquire(command.storage_provider, path, sha256, size)
+            if references == 1:
+                await storage_service.move(file_path, path)
+            else:
+                await storage_service.delete(file_path)
+        except Exception:
+            await self.blob_repository.rollback()
+            raise
+        logger.info("video_upload.blob_stored", file_path=path, references=references)
+        return path
@@ -3,13 +3,16 @@ from typing import Optional, Sequence
 from uuid import UUID
 
 from src.video_management.domain.video import Video
+from src.video_management.domain.video_upload import VideoUpload
 from src.video_management.infrastructure.video_repository import VideoRepository
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
 
 
 class VideoQueries:
     """Handles all read-only operations for videos."""
-    def __init__(self, video_repository: VideoRepository):
+    def __init__(self, video_repository: VideoRepository, upload_repository: Optional[VideoUploadRepository] = None):
         self.video_repository = video_repository
+        self.upload_repository = upload_repository
 
     async def get_video_by_id(self, video_id: str) -> Optional[Video]:
         return await self.video_repository.find_by_id(UUID(video_id))
@@ -19,3 +22,6 @@ class VideoQueries:
 
     async def list_user_videos(self, user_id: str, skip: int = 0, limit: int = 100) -> Sequence[Video]:
         return await self.video_repository.list_by_user(user_id=UUID(user_id), skip=skip, limit=limit)
+
+    async def get_user_upload(self, upload_id: str, user_id: str) -> Optional[VideoUpload]:
+        return await self.upload_repository.find_by_id(UUID(upload_id), UUID(user_id))
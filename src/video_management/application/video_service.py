@@ -1,21 +1,45 @@
 # src/video_management/application/video_service.py
+import mimetypes
+from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 import structlog
 
 from src.shared.events.domain_events import TranscriptionRequested
 from src.shared.events.event_bus import EventBus
+from src.storage.application.storage_service import StorageService
+from src.storage.domain.file_metadata import FileMetadata
 from src.storage.infrastructure.dependencies import StorageServiceFactory
 from src.video_management.domain.video import Video, VideoStatus
+from src.video_management.domain.video_blob import is_blob_path
+from src.video_management.domain.video_upload import VideoUpload
+from src.video_management.infrastructure.video_blob_repository import VideoBlobRepository
 from src.video_management.infrastructure.video_repository import VideoRepository
 # CQRS imports
 from .commands.upload_video_command import UploadVideoCommand
 from .commands.upload_video_command_handler import UploadVideoCommandHandler
+from .commands.create_upload_command import CreateUploadCommand
+from .commands.create_upload_command_handler import CreateUploadCommandHandler, UploadTicket
+from .commands.upload_content_command import UploadContentCommand
+from .commands.upload_content_command_handler import UploadContentCommandHandler
+from .commands.upload_chunk_command import UploadChunkCommand
+from .commands.upload_chunk_command_handler import UploadChunkCommandHandler
+from .commands.complete_upload_command import CompleteUploadCommand
+from .commands.complete_upload_command_handler import CompleteUploadCommandHandler
 from .queries.video_queries import VideoQueries
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class VideoContent:
+    """A stored video file, ready to be streamed."""
+    storage_service: StorageService
+    file_path: str
+    metadata: FileMetadata
+    media_type: str
+
+
 class VideoService:
     """Acts as a facade for video-related operations, dispatching commands."""
     def __init__(
@@ -25,8 +49,18 @@ class VideoService:
         storage_service_factory: StorageServiceFactory,
         video_queries: VideoQueries,
         event_bus: EventBus,
+        create_upload_handler: Optional[CreateUploadCommandHandler] = None,
+        upload_content_handler: Optional[UploadContentCommandHandler] = None,
+        complete_upload_handler: Optional[CompleteUploadCommandHandler] = None,
+        upload_chunk_handler: Optional[UploadChunkCommandHandler] = None,
+        blob_repository: Optional[VideoBlobRepository] = None,
     ):
         self.upload_video_handler = upload_video_handler
+        self.create_upload_handler = create_upload_handler
+        self.upload_content_handler = upload_content_handler
+        self.complete_upload_handler = complete_upload_handler
+        self.upload_chunk_handler = upload_chunk_handler
+        self.blob_repository = blob_repository
         self.video_repository = video_repository
         self.storage_service_factory = storage_service_factory
         self.video_queries = video_queries
@@ -36,6 +70,22 @@ class VideoService:
         """Dispatches the UploadVideoCommand to its handler."""
         return await self.upload_video_handler.handle(command)
 
+    async def create_upload(self, command: CreateUploadCommand) -> UploadTicket:
+        """Dispatches the CreateUploadCommand (step one of a direct upload) to its handler."""
+        return await self.create_upload_handler.handle(command)
+
+    async def upload_content(self, command: UploadContentCommand):
+        """Dispatches the UploadContentCommand to its handler."""
+        await self.upload_content_handler.handle(command)
+
+    async def upload_chunk(self, command: UploadChunkCommand) -> VideoUpload:
+        """Dispatches the UploadChunkCommand (one chunk of a resumable upload) to its handler."""
+        return await self.upload_chunk_handler.handle(command)
+
+    async def complete_upload(self, command: CompleteUploadCommand) -> Video:
+        """Dispatches the CompleteUploadCommand (step two of a direct upload) to its handler."""
+        return await self.complete_upload_handler.handle(command)
+
     async def request_transcription(self, video_id: str, provider: str):
         """Validates and dispatches a transcription request event."""
         video = await self.video_queries.get_by_id(video_id)
@@ -53,6 +103,8 @@ class VideoService:
         video = await self.video_repository.find_by_id(UUID(video_id))
         if not video:
             return False
+        if self.blob_repository and is_blob_path(video.file_path):
+            return await self._delete_blob_video(video)
         try:
             storage_service = self.storage_service_factory(video.storage_provider)
             await storage_service.delete(video.file_path)
@@ -60,14 +112,45 @@ class VideoService:
             logger.error(f"Failed to delete video file from storage: {str(e)}")
         return await self.video_repository.delete(UUID(video_id))
 
-    async def get_video_streaming_url(self, video_id: str) -> Optional[str]:
-        video = await self.video_queries.get_by_id(video_id)
-        if not video or not video.storage_provider:
-            return None
+    async def _delete_blob_video(self, video: Video) -> bool:
+        """
+        Drops the video's reference together with its row; the shared file is only deleted by
+        the last video holding it. If that fails, the unreferenced row is left for a retry.
+        """
         try:
+            remaining = await self.blob_repository.release(video.storage_provider, video.file_path)
+        except Exception:
+            await self.blob_repository.rollback()
+            raise
+        deleted = await self.video_repository.delete(video.id)
+        if remaining == 0:
             storage_service = self.storage_service_factory(video.storage_provider)
-            url, _ = await storage_service.download(video.file_path)
-            return url
-        except Exception as e:
-            logger.error(f"Failed to get streaming URL: {str(e)}")
+            try:
+                await self.blob_repository.purge_unreferenced(
+                    video.storage_provider, video.file_path, lambda: storage_service.delete(video.file_path)
+                )
+            except Exception as e:
+                logger.error(f"Failed to delete unreferenced video file from storage: {str(e)}")
+        return deleted
+
+    async def get_video_content(self, video: Video) -> Optional[VideoContent]:
+        """
+        Locates a video's file for streaming without reading it: the storage service it lives in
+        and its size/version, from which the API answers full and ranged requests.
+        """
+        if not video.storage_provider:
+            return None
+        storage_service = self.storage_service_factory(video.storage_provider)
+        metadata = await storage_service.stat(video.file_path)
+        if metadata is None:
+            logger.warning("Video file missing from storage", video_id=str(video.id), file_path=video.file_path)
             return None
+        media_type = metadata.content_type
+        if not media_type or media_type == "application/octet-stream":
+            media_type = mimetypes.guess_type(video.file_path)[0] or "application/octet-stream"
+        return VideoContent(
+            storage_service=storage_service,
+            file_path=video.file_path,
+            metadata=metadata,
+            media_type=media_type,
+        )
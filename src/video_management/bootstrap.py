@@ -6,9 +6,16 @@ from src.metrics.application.metrics_service import MetricsService
 from src.shared.events.event_bus import EventBus
 from src.storage.infrastructure.dependencies import StorageServiceFactory
 from src.video_management.application.commands.upload_video_command_handler import UploadVideoCommandHandler
+from src.video_management.application.commands.create_upload_command_handler import CreateUploadCommandHandler
+from src.video_management.application.commands.upload_content_command_handler import UploadContentCommandHandler
+from src.video_management.application.commands.upload_chunk_command_handler import UploadChunkCommandHandler
+from src.video_management.application.commands.complete_upload_command_handler import CompleteUploadCommandHandler
 from src.video_management.application.queries.video_queries import VideoQueries
 from src.video_management.application.video_service import VideoService
+from src.video_management.config.settings import VideoSettings
+from src.video_management.infrastructure.video_blob_repository import VideoBlobRepository
 from src.video_management.infrastructure.video_repository import VideoRepository
+from src.video_management.infrastructure.video_upload_repository import VideoUploadRepository
 
 def bootstrap_video_module(
     db_session: AsyncSession,
@@ -18,13 +25,40 @@ def bootstrap_video_module(
 ) -> Dict[str, Any]:
     """Constructs and returns the services for the video_management module."""
     video_repository = VideoRepository(db=db_session)
-    video_queries = VideoQueries(video_repository=video_repository)
-    
+    upload_repository = VideoUploadRepository(db=db_session)
+    video_queries = VideoQueries(video_repository=video_repository, upload_repository=upload_repository)
+    video_settings = VideoSettings()
+    # Always available to deletes, which must honor references taken while the layout was enabled
+    blob_repository = VideoBlobRepository(db=db_session)
+
     upload_video_handler = UploadVideoCommandHandler(
         storage_service_factory=storage_service_factory,
         event_bus=event_bus,
         video_repository=video_repository,
-        metrics_service=metrics_service
+        metrics_service=metrics_service,
+        blob_repository=blob_repository if video_settings.content_addressed_storage else None,
+    )
+
+    create_upload_handler = CreateUploadCommandHandler(
+        storage_service_factory=storage_service_factory,
+        upload_repository=upload_repository,
+        settings=video_settings,
+    )
+    upload_content_handler = UploadContentCommandHandler(
+        storage_service_factory=storage_service_factory,
+        upload_repository=upload_repository,
+    )
+    upload_chunk_handler = UploadChunkCommandHandler(
+        storage_service_factory=storage_service_factory,
+        upload_repository=upload_repository,
+        settings=video_settings,
+    )
+    complete_upload_handler = CompleteUploadCommandHandler(
+        storage_service_factory=storage_service_factory,
+        upload_repository=upload_repository,
+        video_repository=video_repository,
+        event_bus=event_bus,
+        metrics_service=metrics_service,
     )
 
     video_service = VideoService(
@@ -32,11 +66,17 @@ def bootstrap_video_module(
         video_repository=video_repository,
         storage_service_factory=storage_service_factory,
         video_queries=video_queries,
-        event_bus=event_bus
+        event_bus=event_bus,
+        create_upload_handler=create_upload_handler,
+        upload_content_handler=upload_content_handler,
+        complete_upload_handler=complete_upload_handler,
+        upload_chunk_handler=upload_chunk_handler,
+        blob_repository=blob_repository,
     )
 
     return {
         "video_repository": video_repository,
+        "video_upload_repository": upload_repository,
         "video_queries": video_queries,
         "video_service": video_service,
     }
@@ -5,6 +5,12 @@ from typing import Set
 class VideoSettings(BaseSettings):
     allowed_extensions: Set[str] = {'.mp4', '.mov', '.avi', '.mkv', '.webm'}
     max_file_size_mb: int = 200
+    # Lifetime of presigned upload URLs and local upload tokens
+    upload_url_ttl_seconds: int = 3600
+    # Resumable uploads are discarded after this long without receiving a chunk
+    resumable_upload_ttl_seconds: int = 86400
+    # Store uploaded files by content hash, once per distinct file, with reference counting
+    content_addressed_storage: bool = False
 
     @property
     def max_file_size_bytes(self) -> int:
@@ -3,16 +3,10 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, String, Enum as SqlEnum, DateTime, ForeignKey, event
+from sqlalchemy import BigInteger, Column, String, Enum as SqlEnum, DateTime, ForeignKey, event
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.shared.infrastructure.database import Base
-# Import state classes
-from .states.video_state import VideoState
-from .states.uploaded_state import UploadedState
-from .states.processing_state import ProcessingState
-from .states.completed_state import CompletedState
-from .states.failed_state import FailedState
 
 
 class VideoStatus(str, Enum):
@@ -22,17 +16,29 @@ class VideoStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# Import state classes (after VideoStatus, which the state modules import back)
+from .states.video_state import VideoState
+from .states.uploaded_state import UploadedState
+from .states.processing_state import ProcessingState
+from .states.completed_state import CompletedState
+from .states.failed_state import FailedState
+
+
 class Video(Base):
     __tablename__ = "videos"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    file_path = Column(String, nullable=False)
+    file_path = Column(String, nullable=False, index=True)  # Looked up by path when collecting orphaned files
     status = Column(SqlEnum(VideoStatus), default=VideoStatus.UPLOADED, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     storage_provider = Column(String, nullable=False)
     error_message = Column(String, nullable=True)  # Field for failure reason
+    file_size = Column(BigInteger, nullable=True)  # Bytes, measured while the upload streamed to storage
+    checksum = Column(String(64), nullable=True)  # SHA-256 of the file
 
+    # The state object is not a mapped column; it is rebuilt from `status` on load.
+    __allow_unmapped__ = True
     _state: VideoState = None
 
     def __init__(self, **kwargs):
@@ -0,0 +1,39 @@
+# src/video_management/domain/video_blob.py
+from datetime import datetime
+from pathlib import PurePosixPath
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from src.shared.infrastructure.database import Base
+
+# Prefix of the content-addressed layout; files elsewhere belong to a single video
+BLOB_PREFIX = "blobs/"
+
+
+def blob_path(sha256: str, filename: str) -> str:
+    """Where a file with this content lives. The extension is kept, so its media type can still be guessed."""
+    return f"{BLOB_PREFIX}sha256/{sha256[:2]}/{sha256}{PurePosixPath(filename).suffix.lower()}"
+
+
+def is_blob_path(file_path: str) -> bool:
+    return file_path.startswith(BLOB_PREFIX)
+
+
+def blob_sha256(file_path: str) -> str:
+    """The content hash a blob path was built from."""
+    return PurePosixPath(file_path).name[:64]
+
+
+class VideoBlob(Base):
+    """
+    A stored file shared by every video with the same content. `ref_count` counts those
+    videos; the file is only deleted once it drops to zero.
+    """
+    __tablename__ = "video_blobs"
+
+    storage_provider = Column(String, primary_key=True)
+    file_path = Column(String, primary_key=True)
+    sha256 = Column(String(64), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,84 @@
+# src/video_management/domain/video_upload.py
+import hashlib
+import hmac
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Enum as SqlEnum, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.shared.infrastructure.database import Base
+from src.storage.domain.direct_upload import ChunkedUpload
+
+
+def hash_upload_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class UploadStatus(str, Enum):
+    PENDING = "PENDING"
+    COMPLETED = "COMPLETED"
+    ABORTED = "ABORTED"
+
+
+class UploadOffsetMismatchError(ValueError):
+    """Raised when a chunk does not start where the upload left off; the client resumes from `offset`."""
+
+    def __init__(self, offset: int):
+        super().__init__(f"The upload continues at offset {offset}")
+        self.offset = offset
+
+
+class InvalidChunkError(ValueError):
+    """Raised for a chunk whose length does not match its place in the upload."""
+
+
+class VideoUpload(Base):
+    """
+    A direct upload in progress: the client sends the file straight to storage and the
+    Video row (sharing this id) is only created once the upload is completed. Resumable
+    uploads instead send it through the API in chunks, tracked by `received_bytes`.
+    """
+    __tablename__ = "video_uploads"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False, index=True)  # Looked up by path when collecting orphaned files
+    storage_provider = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)  # Declared by the client, checked on completion
+    status = Column(SqlEnum(UploadStatus), default=UploadStatus.PENDING, nullable=False)
+    multipart_upload_id = Column(String, nullable=True)  # S3 multipart uploads only
+    token_hash = Column(String(64), nullable=True)  # Local uploads: SHA-256 of the upload token
+    checksum = Column(String(64), nullable=True)  # SHA-256, when the bytes passed through the API
+    chunk_size = Column(BigInteger, nullable=True)  # Resumable uploads only
+    received_bytes = Column(BigInteger, default=0, nullable=False)  # Resumable uploads: the offset to resume from
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    @property
+    def is_expired(self) -> bool:
+        return self.status == UploadStatus.PENDING and datetime.utcnow() >= self.expires_at
+
+    @property
+    def chunked_upload(self) -> Optional[ChunkedUpload]:
+        if self.chunk_size is None:
+            return None
+        return ChunkedUpload(chunk_size=self.chunk_size, multipart_upload_id=self.multipart_upload_id)
+
+    def expected_chunk_length(self, offset: int) -> int:
+        """Every chunk is `chunk_size` bytes except the last, which holds the rest."""
+        return min(self.chunk_size, self.size - offset)
+
+    def token_matches(self, token: str) -> bool:
+        return self.token_hash is not None and hmac.compare_digest(self.token_hash, hash_upload_token(token))
+
+    def mark_completed(self):
+        self.status = UploadStatus.COMPLETED
+        self.token_hash = None
+
+    def mark_aborted(self):
+        self.status = UploadStatus.ABORTED
+        self.token_hash = None
@@ -0,0 +1,134 @@
+# src/video_management/infrastructure/video_blob_repository.py
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.video_management.domain.video_blob import VideoBlob, blob_sha256
+
+logger = logging.getLogger(__name__)
+
+
+class VideoBlobRepository:
+    """
+    Reference counts of content-addressed files. `acquire` and `release` join the caller's
+    transaction, so the count commits (or rolls back) together with the video row it is for.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def acquire(self, storage_provider: str, file_path: str, sha256: str, size: int) -> int:
+        """
+        Adds a reference and returns the new count. A count of 1 means no other video holds
+        the file, so the caller must store it; the row stays locked until the transaction
+        ends, which makes concurrent uploads of the same content wait for that file.
+        """
+        stmt = (
+            insert(VideoBlob)
+            .values(storage_provider=storage_provider, file_path=file_path, sha256=sha256, size=size, ref_count=1)
+            .on_conflict_do_update(
+                index_elements=[VideoBlob.storage_provider, VideoBlob.file_path],
+                set_={"ref_count": VideoBlob.ref_count + 1},
+            )
+            .returning(VideoBlob.ref_count)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    async def release(self, storage_provider: str, file_path: str) -> Optional[int]:
+        """Drops a reference and returns the remaining count, or None for files not in the layout."""
+        stmt = (
+            update(VideoBlob)
+            .where(
+                VideoBlob.storage_provider == storage_provider,
+                VideoBlob.file_path == file_path,
+                VideoBlob.ref_count > 0,
+            )
+            .values(ref_count=VideoBlob.ref_count - 1)
+            .returning(VideoBlob.ref_count)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def rollback(self):
+        """Abandons the references taken in the current transaction (and releases their row locks)."""
+        await self.db.rollback()
+
+    async def purge_unreferenced(
+        self, storage_provider: str, file_path: str, delete_file: Callable[[], Awaitable]
+    ) -> bool:
+        """
+        Deletes the file and its row if nothing references it any more. The row is locked
+        meanwhile, so an upload of the same content waits and then stores the file anew.
+        """
+        try:
+            result = await self.db.execute(
+                select(VideoBlob)
+                .where(
+                    VideoBlob.storage_provider == storage_provider,
+                    VideoBlob.file_path == file_path,
+                    VideoBlob.ref_count == 0,
+                )
+                .with_for_update()
+            )
+            if result.scalar_one_or_none() is None:
+                await self.db.rollback()
+                return False
+            await delete_file()
+            await self.db.execute(
+                delete(VideoBlob).where(
+                    VideoBlob.storage_provider == storage_provider, VideoBlob.file_path == file_path
+                )
+            )
+            await self.db.commit()
+            return True
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to purge blob {file_path}: {e}")
+            raise
+
+    async def purge_orphans(
+        self, storage_provider: str, files: Dict[str, int], delete_files: Callable[[List[str]], Awaitable[int]]
+    ) -> int:
+        """
+        Deletes, in one batch, the files of `files` (path to size) that no video references:
+        those without a row and those whose count is zero. Each path gets a zero-count row and
+        is locked first, so an upload of the same content waits and then stores the file anew,
+        while rows a concurrent transaction holds are skipped. Returns how many files are gone.
+        """
+        paths = sorted(files)
+        try:
+            await self.db.execute(
+                insert(VideoBlob)
+                .values([
+                    dict(storage_provider=storage_provider, file_path=path, sha256=blob_sha256(path),
+                         size=files[path], ref_count=0)
+                    for path in paths
+                ])
+                .on_conflict_do_nothing(index_elements=[VideoBlob.storage_provider, VideoBlob.file_path])
+            )
+            result = await self.db.execute(
+                select(VideoBlob.file_path)
+                .where(
+                    VideoBlob.storage_provider == storage_provider,
+                    VideoBlob.file_path.in_(paths),
+                    VideoBlob.ref_count == 0,
+                )
+                .order_by(VideoBlob.file_path)
+                .with_for_update(skip_locked=True)
+            )
+            claimed = list(result.scalars())
+            deleted = await delete_files(claimed) if claimed else 0
+            await self.db.execute(
+                delete(VideoBlob).where(VideoBlob.storage_provider == storage_provider, VideoBlob.file_path.in_(claimed))
+            )
+            await self.db.commit()
+            return deleted
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to purge {len(paths)} orphaned blobs: {e}")
+            raise
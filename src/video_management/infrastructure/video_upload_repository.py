@@ -0,0 +1,60 @@
+# src/video_management/infrastructure/video_upload_repository.py
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.video_management.domain.video_upload import UploadStatus, VideoUpload
+
+logger = logging.getLogger(__name__)
+
+
+class VideoUploadRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, upload: VideoUpload) -> VideoUpload:
+        try:
+            self.db.add(upload)
+            await self.db.commit()
+            await self.db.refresh(upload)
+            return upload
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to save video upload {getattr(upload, 'id', None)}: {e}")
+            raise
+
+    async def find_by_id(self, upload_id: UUID, user_id: Optional[UUID] = None) -> Optional[VideoUpload]:
+        """Finds an upload, optionally only among the given user's."""
+        query = select(VideoUpload).where(VideoUpload.id == upload_id)
+        if user_id is not None:
+            query = query.where(VideoUpload.user_id == user_id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def advance_offset(self, upload: VideoUpload, offset: int, received_bytes: int, expires_at: datetime) -> bool:
+        """
+        Moves a resumable upload from `offset` to `received_bytes`, unless a concurrent request
+        already moved it (compare-and-set), and refreshes `upload` with the stored state.
+        """
+        try:
+            result = await self.db.execute(
+                update(VideoUpload)
+                .where(
+                    VideoUpload.id == upload.id,
+                    VideoUpload.status == UploadStatus.PENDING,
+                    VideoUpload.received_bytes == offset,
+                )
+                .values(received_bytes=received_bytes, expires_at=expires_at)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to advance video upload {upload.id}: {e}")
+            raise
+        await self.db.refresh(upload)
+        return result.rowcount == 1
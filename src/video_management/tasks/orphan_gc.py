@@ -0,0 +1,184 @@
+# src/video_management/tasks/orphan_gc.py
+"""
+Deletes stored video files that nothing references: files of uploads that failed after
+reaching storage, of videos whose deletion failed halfway, and content-addressed blobs
+left without references. Files younger than --min-age-hours are kept, as uploads in
+progress write them before their rows exist. Meant to run periodically (e.g. daily from cron).
+
+    python -m src.video_management.tasks.orphan_gc --provider s3 [--prefix videos/] [--min-age-hours 24]
+        [--max-deletes-per-second 1000] [--dry-run]
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Sequence, Set
+
+import structlog
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.resilience.rate_limiter import AsyncTokenBucket
+from src.storage.application.storage_service import (
+    DELETE_BATCH_MAX_KEYS, LIST_PAGE_SIZE, StorageException, StorageService,
+)
+from src.storage.domain.file_metadata import StoredFile
+from src.video_management.domain.video import Video
+from src.video_management.domain.video_blob import BLOB_PREFIX, VideoBlob, is_blob_path
+from src.video_management.domain.video_upload import UploadStatus, VideoUpload
+from src.video_management.infrastructure.video_blob_repository import VideoBlobRepository
+
+logger = structlog.get_logger(__name__)
+
+# The layouts whose files are referenced by video, upload and blob rows; other prefixes hold other data
+VIDEO_PREFIXES = ("videos/", BLOB_PREFIX)
+# The local provider writes unfinished uploads next to their target under this suffix
+PARTIAL_SUFFIX = ".part"
+
+
+def _referenced_path(file_path: str) -> str:
+    return file_path[:-len(PARTIAL_SUFFIX)] if file_path.endswith(PARTIAL_SUFFIX) else file_path
+
+
+async def find_referenced_paths(session: AsyncSession, storage_provider: str, paths: Set[str]) -> Set[str]:
+    """The paths among `paths` that a video, a pending upload or a referenced blob holds."""
+    stmt = union(
+        select(Video.file_path).where(Video.storage_provider == storage_provider, Video.file_path.in_(paths)),
+        select(VideoUpload.file_path).where(
+            VideoUpload.storage_provider == storage_provider,
+            VideoUpload.status == UploadStatus.PENDING,
+            VideoUpload.file_path.in_(paths),
+        ),
+        select(VideoBlob.file_path).where(
+            VideoBlob.storage_provider == storage_provider,
+            VideoBlob.ref_count > 0,
+            VideoBlob.file_path.in_(paths),
+        ),
+    )
+    return set((await session.execute(stmt)).scalars())
+
+
+async def _prefetched(pages: AsyncIterator[List[StoredFile]]) -> AsyncIterator[List[StoredFile]]:
+    """Requests the next page of a listing while the caller works on the current one."""
+    next_page = asyncio.ensure_future(pages.__anext__())
+    try:
+        while True:
+            try:
+                page = await next_page
+            except StopAsyncIteration:
+                return
+            next_page = asyncio.ensure_future(pages.__anext__())
+            yield page
+    finally:
+        next_page.cancel()
+        await asyncio.gather(next_page, return_exceptions=True)
+        await pages.aclose()
+
+
+async def collect_orphaned_files(
+    session: AsyncSession,
+    storage_service: StorageService,
+    blob_repository: VideoBlobRepository,
+    prefixes: Sequence[str] = VIDEO_PREFIXES,
+    min_age: timedelta = timedelta(hours=24),
+    page_size: int = LIST_PAGE_SIZE,
+    max_deletes_per_second: Optional[float] = None,
+    dry_run: bool = False,
+    now: Optional[datetime] = None,
+) -> dict:
+    """
+    Lists each prefix one page at a time and diffs the page against the rows referencing
+    its paths, so memory stays bounded by the page size however large the bucket is.
+    Orphans are deleted in batches of up to a thousand keys per request; blobs go through
+    the blob repository, which locks their rows against uploads of the same content.
+    """
+    for prefix in prefixes:
+        if not prefix.startswith(VIDEO_PREFIXES):
+            raise ValueError(f"Prefix {prefix!r} is outside the video layouts {VIDEO_PREFIXES}")
+    cutoff = (now or datetime.now(timezone.utc)) - min_age
+    provider = storage_service.provider_name
+    # Bursts of one batch, then deletes at the configured rate on average
+    limiter = (
+        AsyncTokenBucket(max(max_deletes_per_second, DELETE_BATCH_MAX_KEYS), max_deletes_per_second)
+        if max_deletes_per_second else None
+    )
+    stats = {"scanned": 0, "orphaned": 0, "orphaned_bytes": 0, "deleted": 0, "failed": 0}
+
+    for prefix in prefixes:
+        async for page in _prefetched(storage_service.list_files(prefix, page_size)):
+            stats["scanned"] += len(page)
+            candidates = [file for file in page if file.last_modified < cutoff]
+            if not candidates:
+                continue
+            referenced = await find_referenced_paths(
+                session, provider, {_referenced_path(file.path) for file in candidates}
+            )
+            # Ends the read-only transaction, so none stays open while storage is called
+            await session.rollback()
+            orphans = [file for file in candidates if _referenced_path(file.path) not in referenced]
+            stats["orphaned"] += len(orphans)
+            stats["orphaned_bytes"] += sum(file.size for file in orphans)
+            if dry_run:
+                continue
+
+            for start in range(0, len(orphans), DELETE_BATCH_MAX_KEYS):
+                batch = orphans[start:start + DELETE_BATCH_MAX_KEYS]
+                if limiter is not None:
+                    await limiter.acquire(len(batch))
+                blobs = {file.path: file.size for file in batch if is_blob_path(file.path)}
+                others = [file.path for file in batch if not is_blob_path(file.path)]
+                deleted = 0
+                try:
+                    if blobs:
+                        # Blobs a concurrent upload holds are skipped, and count as failed until the next run
+                        deleted += await blob_repository.purge_orphans(provider, blobs, storage_service.delete_many)
+                    if others:
+                        deleted += await storage_service.delete_many(others)
+                except StorageException as e:
+                    logger.warning("storage.orphan_gc_failed", prefix=prefix, files=len(batch), error=str(e))
+                stats["deleted"] += deleted
+                stats["failed"] += len(batch) - deleted
+            if orphans:
+                logger.info("storage.orphan_gc_batch", prefix=prefix, dry_run=dry_run, **stats)
+
+    return stats
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    from src.shared.infrastructure.database import AsyncSessionLocal
+    from src.storage.infrastructure.dependencies import create_storage_service, run_closing_storage_services
+
+    async with AsyncSessionLocal() as session:
+        return await run_closing_storage_services(collect_orphaned_files(
+            session,
+            create_storage_service(args.provider),
+            VideoBlobRepository(session),
+            prefixes=args.prefix or VIDEO_PREFIXES,
+            min_age=timedelta(hours=args.min_age_hours),
+            page_size=args.page_size,
+            max_deletes_per_second=args.max_deletes_per_second,
+            dry_run=args.dry_run,
+        ))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.video_management.tasks.orphan_gc", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", required=True, help="Storage provider to scan, e.g. s3 or local")
+    parser.add_argument("--prefix", action="append", help=f"Prefix to scan, repeatable (default: {' '.join(VIDEO_PREFIXES)})")
+    parser.add_argument("--min-age-hours", type=float, default=24, help="Keep files modified more recently than this")
+    parser.add_argument("--page-size", type=int, default=LIST_PAGE_SIZE, help="Files listed and diffed at a time")
+    parser.add_argument("--max-deletes-per-second", type=float, default=None, help="Average rate of deleted files")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the files that would be deleted")
+    args = parser.parse_args(argv)
+    for prefix in args.prefix or ():
+        if not prefix.startswith(VIDEO_PREFIXES):
+            parser.error(f"--prefix must start with one of {', '.join(VIDEO_PREFIXES)}")
+    stats = asyncio.run(_main(args))
+    print(f"Scanned {stats['scanned']} files: {stats['orphaned']} orphaned ({stats['orphaned_bytes']} bytes), "
+          f"{'would delete them' if args.dry_run else 'deleted ' + str(stats['deleted'])}, {stats['failed']} failed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,115 @@
+# src/video_management/tasks/upload_gc.py
+"""
+Discards expired uploads: aborts their multipart uploads, deletes their partial files and marks
+them aborted. Meant to run periodically (e.g. hourly from cron).
+
+    python -m src.video_management.tasks.upload_gc --batch-size 100 [--dry-run]
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.storage.application.storage_service import StorageException
+from src.storage.infrastructure.dependencies import StorageServiceFactory
+from src.video_management.domain.video import Video
+from src.video_management.domain.video_upload import UploadStatus, VideoUpload
+
+logger = structlog.get_logger(__name__)
+
+
+async def discard_upload_files(upload: VideoUpload, storage_service_factory: StorageServiceFactory):
+    """Releases everything storage holds for an unfinished upload."""
+    storage_service = storage_service_factory(upload.storage_provider)
+    if upload.chunked_upload:
+        await storage_service.abort_chunked_upload(upload.file_path, upload.chunked_upload)
+    elif upload.multipart_upload_id:
+        await storage_service.abort_direct_upload(upload.file_path, upload.multipart_upload_id)
+    # Single-request uploads (and multipart ones completed just before a crash) leave the file itself
+    await storage_service.delete(upload.file_path)
+
+
+async def collect_expired_uploads(
+    session: AsyncSession,
+    storage_service_factory: StorageServiceFactory,
+    batch_size: int = 100,
+    dry_run: bool = False,
+    now: Optional[datetime] = None,
+) -> dict:
+    """
+    Walks the pending uploads past their expiry one keyset-paginated batch at a time. Uploads
+    whose video exists were completed by a request that failed before recording it, and are
+    marked completed instead. Uploads storage fails to clean up stay pending for the next run.
+    """
+    now = now or datetime.utcnow()
+    stats = {"aborted": 0, "completed": 0, "failed": 0}
+    last_id = None
+    while True:
+        stmt = (
+            select(VideoUpload, Video.id)
+            .outerjoin(Video, Video.id == VideoUpload.id)
+            .where(VideoUpload.status == UploadStatus.PENDING, VideoUpload.expires_at < now)
+            .order_by(VideoUpload.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            stmt = stmt.where(VideoUpload.id > last_id)
+        batch: List[Tuple[VideoUpload, Optional[UUID]]] = list((await session.execute(stmt)).all())
+        if not batch:
+            break
+
+        for upload, video_id in batch:
+            if video_id is not None:
+                stats["completed"] += 1
+                if not dry_run:
+                    upload.mark_completed()
+                continue
+            if not dry_run:
+                try:
+                    await discard_upload_files(upload, storage_service_factory)
+                except StorageException as e:
+                    stats["failed"] += 1
+                    logger.warning("video_upload.gc_failed", upload_id=str(upload.id), error=str(e))
+                    continue
+                upload.mark_aborted()
+            stats["aborted"] += 1
+        last_id = batch[-1][0].id
+
+        if not dry_run:
+            await session.commit()
+        session.expunge_all()
+        logger.info("video_upload.gc_batch", dry_run=dry_run, **stats)
+
+    return stats
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    from src.shared.infrastructure.database import AsyncSessionLocal
+    from src.storage.infrastructure.dependencies import create_storage_service, run_closing_storage_services
+
+    async with AsyncSessionLocal() as session:
+        return await run_closing_storage_services(collect_expired_uploads(
+            session, create_storage_service, batch_size=args.batch_size, dry_run=args.dry_run
+        ))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.video_management.tasks.upload_gc", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=100, help="Uploads processed per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the uploads that would be discarded")
+    args = parser.parse_args(argv)
+    stats = asyncio.run(_main(args))
+    print(f"{'Would abort' if args.dry_run else 'Aborted'} {stats['aborted']} expired uploads "
+          f"({stats['completed']} already completed, {stats['failed']} failed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,62 @@
+# tests/unit/search/test_search_queries.py
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.search.application.queries.search_queries import SearchQueries
+from src.search.infrastructure.search_repository import SearchRepository
+
+
+@pytest.fixture
+def mock_search_repository():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_search_reports_another_page(mock_search_repository):
+    """One extra hit is fetched to tell whether another page exists."""
+    # Arrange
+    user_id = uuid4()
+    mock_search_repository.search.return_value = [{"id": i} for i in range(3)]
+    queries = SearchQueries(search_repository=mock_search_repository)
+
+    # Act
+    result = await queries.search(user_id, " solar power ", limit=2, offset=4)
+
+    # Assert
+    mock_search_repository.search.assert_awaited_once_with(user_id, "solar power", limit=3, offset=4)
+    assert result == {"items": [{"id": 0}, {"id": 1}], "limit": 2, "offset": 4, "has_more": True}
+
+
+@pytest.mark.asyncio
+async def test_blank_search_skips_the_database(mock_search_repository):
+    # Arrange
+    queries = SearchQueries(search_repository=mock_search_repository)
+
+    # Act
+    result = await queries.search(uuid4(), "   ")
+
+    # Assert
+    assert result["items"] == [] and result["has_more"] is False
+    mock_search_repository.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_repository_matches_indexed_vectors_within_the_users_videos():
+    # Arrange
+    db = AsyncMock()
+    db.execute.return_value = []
+    repository = SearchRepository(db=db)
+
+    # Act
+    await repository.search(uuid4(), "solar power", limit=21, offset=0)
+
+    # Assert
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "transcriptions.search_vector @@ websearch_to_tsquery" in sql
+    assert "summaries.search_vector @@ websearch_to_tsquery" in sql
+    assert sql.count("videos.user_id =") == 2
+    # Snippets are only built for the page, outside the ranked subquery
+    assert sql.index("ts_headline") < sql.index("LIMIT")
@@ -0,0 +1,70 @@
+# tests/unit/shared/test_circuit_breaker.py
+import asyncio
+
+import pytest
+from pybreaker import STATE_HALF_OPEN, CircuitBreaker, CircuitBreakerError
+
+from src.shared.resilience.circuit_breaker import calling
+
+
+async def _guarded(breaker: CircuitBreaker, call):
+    with calling(breaker):
+        return await call()
+
+
+async def _fail():
+    raise RuntimeError("provider down")
+
+
+@pytest.mark.asyncio
+async def test_cancellation_leaves_the_fail_counter_unchanged():
+    # Arrange
+    breaker = CircuitBreaker(fail_max=5)
+    with pytest.raises(RuntimeError):
+        await _guarded(breaker, _fail)
+    task = asyncio.create_task(_guarded(breaker, lambda: asyncio.sleep(10)))
+    await asyncio.sleep(0)
+
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert breaker.fail_counter == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_keeps_the_breaker_half_open():
+    # Arrange
+    breaker = CircuitBreaker(fail_max=1)
+    breaker.half_open()
+    task = asyncio.create_task(_guarded(breaker, lambda: asyncio.sleep(10)))
+    await asyncio.sleep(0)
+
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert breaker.current_state == STATE_HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_failures_and_successes_are_reported():
+    # Arrange
+    breaker = CircuitBreaker(fail_max=2)
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await _guarded(breaker, _fail)
+    assert breaker.fail_counter == 1
+    assert await _guarded(breaker, lambda: asyncio.sleep(0, result="ok")) == "ok"
+    assert breaker.fail_counter == 0
+    with pytest.raises(RuntimeError):
+        await _guarded(breaker, _fail)
+    with pytest.raises(CircuitBreakerError):
+        await _guarded(breaker, _fail)
+    with pytest.raises(CircuitBreakerError):
+        await _guarded(breaker, _fail)
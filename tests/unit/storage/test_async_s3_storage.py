@@ -0,0 +1,191 @@
+# tests/unit/storage/test_async_s3_storage.py
+import asyncio
+import io
+import weakref
+from contextlib import AsyncExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("aiobotocore")
+
+from botocore.exceptions import ClientError
+
+from src.storage.application.upload_stream import MeteredStream, UploadTooLargeError
+from src.storage.infrastructure import dependencies
+from src.storage.infrastructure.async_s3_storage_service import AsyncS3StorageService, _LoopClient
+
+MB = 1024 * 1024
+
+
+class FakeBody:
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self, amount=None):
+        return self._stream.read(amount)
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _storage(max_concurrency: int = 4, max_streams: int = 4):
+    storage = AsyncS3StorageService.__new__(AsyncS3StorageService)
+    storage.settings = SimpleNamespace(
+        bucket_name="videos", multipart_part_size_bytes=5 * MB, download_part_size_bytes=MB, download_concurrency=4
+    )
+    client = MagicMock()
+    client.create_multipart_upload = AsyncMock(return_value={"UploadId": "up-1"})
+    client.upload_part = AsyncMock(side_effect=lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"})
+    for method in ("put_object", "complete_multipart_upload", "abort_multipart_upload", "get_object", "head_object"):
+        setattr(client, method, AsyncMock())
+    loop_client = _LoopClient(client, AsyncExitStack(), asyncio.Semaphore(max_concurrency), asyncio.Semaphore(max_streams))
+    storage._loop_client = AsyncMock(return_value=loop_client)
+    return storage, client
+
+
+@pytest.mark.asyncio
+async def test_iter_range_streams_native_body():
+    # Arrange
+    storage, client = _storage()
+    client.get_object.return_value = {"Body": FakeBody(b"y" * 20)}
+
+    # Act
+    chunks = [chunk async for chunk in storage.iter_range("clip.mp4", 0, 19, chunk_size=8)]
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+    client.get_object.assert_awaited_once_with(Bucket="videos", Key="clip.mp4", Range="bytes=0-19")
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_frees_the_request_slot_once_the_headers_arrive():
+    # Arrange
+    storage, client = _storage(max_concurrency=1)
+    client.get_object.return_value = {"Body": FakeBody(b"y" * 20)}
+    client.head_object.return_value = {"ContentLength": 20, "LastModified": None}
+    stream = storage.iter_range("clip.mp4", 0, 19, chunk_size=8)
+    await stream.__anext__()
+
+    # Act: the stream is paused mid-body, as behind a slow viewer
+    metadata = await asyncio.wait_for(storage.stat("other.mp4"), timeout=1)
+
+    # Assert
+    assert metadata.size == 20
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_and_abort_on_failure():
+    # Arrange
+    storage, client = _storage()
+    stream = MeteredStream(_chunks(*[b"x" * (2 * MB)] * 4), max_bytes=7 * MB)
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await storage.upload_stream("videos/big.mp4", stream)
+    assert client.upload_part.await_count == 1
+    client.abort_multipart_upload.assert_awaited_once_with(Bucket="videos", Key="videos/big.mp4", UploadId="up-1")
+
+
+@pytest.mark.asyncio
+async def test_requests_in_flight_are_bounded():
+    # Arrange
+    storage, client = _storage(max_concurrency=2)
+    in_flight, peak = 0, 0
+
+    async def put_object(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    client.put_object.side_effect = put_object
+
+    # Act
+    await asyncio.gather(*(storage.upload(f"videos/{i}.mp4", b"data") for i in range(8)))
+
+    # Assert
+    assert client.put_object.await_count == 8
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stat_missing_object_returns_none():
+    # Arrange
+    storage, client = _storage()
+    client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    # Act & Assert
+    assert await storage.stat("videos/gone.mp4") is None
+    assert await storage.exists("videos/gone.mp4") is False
+
+
+@pytest.mark.asyncio
+async def test_large_download_is_fetched_as_ranges():
+    # Arrange
+    storage, client = _storage()
+    payload = bytes(range(256)) * (10 * 4096)  # 10 MiB
+
+    async def get_object(Bucket, Key, Range, IfMatch=None):
+        start, end = (int(value) for value in Range.removeprefix("bytes=").split("-"))
+        end = min(end, len(payload) - 1)
+        return {"Body": FakeBody(payload[start:end + 1]), "ContentRange": f"bytes {start}-{end}/{len(payload)}", "ETag": '"v1"'}
+
+    client.get_object.side_effect = get_object
+
+    # Act
+    data, _ = await storage.download("videos/big.mp4")
+
+    # Assert
+    assert data == payload
+    assert client.get_object.await_count == 10
+
+
+def test_each_job_loop_closes_the_client_it_opened(monkeypatch):
+    # Arrange
+    opened, closed = [], []
+
+    class FakeClientContext:
+        async def __aenter__(self):
+            client = MagicMock()
+            opened.append(client)
+            return client
+
+        async def __aexit__(self, *exc_info):
+            closed.append(opened[-1])
+            return False
+
+    storage = AsyncS3StorageService.__new__(AsyncS3StorageService)
+    storage.settings = SimpleNamespace(
+        bucket_name="videos", access_key="key", secret_key="secret", endpoint_url=None, async_max_concurrency=4,
+        async_max_streams=4,
+    )
+    storage._session = MagicMock(create_client=MagicMock(side_effect=lambda *args, **kwargs: FakeClientContext()))
+    storage._config = None
+    storage._clients = weakref.WeakKeyDictionary()
+    storage._locks = weakref.WeakKeyDictionary()
+    storage._bucket_verified = True
+    monkeypatch.setattr(dependencies, "_storage_instances", {"s3-async": storage})
+
+    async def job():
+        await storage._loop_client()
+
+    # Act
+    asyncio.run(dependencies.run_closing_storage_services(job()))
+    asyncio.run(dependencies.run_closing_storage_services(job()))
+
+    # Assert
+    assert len(opened) == 2
+    assert closed == opened
+    assert len(storage._clients) == 0
@@ -0,0 +1,94 @@
+# tests/unit/storage/test_chunked_upload.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.storage.application.storage_service import StorageException
+from src.storage.application.upload_stream import IncompleteUploadError
+from src.storage.domain.direct_upload import ChunkedUpload
+from src.storage.infrastructure.local_storage_service import LocalStorageService
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    storage = LocalStorageService.__new__(LocalStorageService)
+    storage.root = tmp_path
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_local_chunks_are_assembled_on_completion(local_storage, tmp_path):
+    # Arrange
+    upload = await local_storage.start_chunked_upload("videos/clip.mp4", 6)
+
+    # Act
+    await local_storage.upload_chunk("videos/clip.mp4", upload, 0, b"abcd")
+    await local_storage.upload_chunk("videos/clip.mp4", upload, 4, b"ef")
+    await local_storage.complete_chunked_upload("videos/clip.mp4", upload, 6)
+
+    # Assert
+    assert (tmp_path / "videos/clip.mp4").read_bytes() == b"abcdef"
+    assert not (tmp_path / "videos/clip.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_local_resent_chunk_replaces_a_partial_write(local_storage, tmp_path):
+    # Arrange
+    upload = await local_storage.start_chunked_upload("videos/clip.mp4", 8)
+    await local_storage.upload_chunk("videos/clip.mp4", upload, 0, b"abcd")
+    (tmp_path / "videos/clip.mp4.part").write_bytes(b"abcdXX")  # An interrupted write of the next chunk
+
+    # Act
+    await local_storage.upload_chunk("videos/clip.mp4", upload, 4, b"efgh")
+
+    # Assert
+    assert (tmp_path / "videos/clip.mp4.part").read_bytes() == b"abcdefgh"
+
+
+@pytest.mark.asyncio
+async def test_local_chunk_past_the_received_bytes_is_rejected(local_storage):
+    # Arrange
+    upload = await local_storage.start_chunked_upload("videos/clip.mp4", 8)
+
+    # Act / Assert
+    with pytest.raises(StorageException):
+        await local_storage.upload_chunk("videos/clip.mp4", upload, 4, b"efgh")
+
+
+@pytest.mark.asyncio
+async def test_local_incomplete_upload_is_not_assembled(local_storage, tmp_path):
+    # Arrange
+    upload = await local_storage.start_chunked_upload("videos/clip.mp4", 8)
+    await local_storage.upload_chunk("videos/clip.mp4", upload, 0, b"abcd")
+
+    # Act
+    with pytest.raises(IncompleteUploadError):
+        await local_storage.complete_chunked_upload("videos/clip.mp4", upload, 8)
+    await local_storage.abort_chunked_upload("videos/clip.mp4", upload)
+
+    # Assert
+    assert not (tmp_path / "videos/clip.mp4").exists()
+    assert not (tmp_path / "videos/clip.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_s3_chunks_map_to_parts_by_offset():
+    # Arrange
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(bucket_name="videos", multipart_part_size_bytes=5 * MB)
+    storage.client = MagicMock()
+    storage.client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+
+    # Act
+    upload = await storage.start_chunked_upload("videos/clip.mp4", 12 * MB)
+    await storage.upload_chunk("videos/clip.mp4", upload, 10 * MB, b"tail")
+
+    # Assert
+    assert upload == ChunkedUpload(chunk_size=5 * MB, multipart_upload_id="up-1")
+    storage.client.upload_part.assert_called_once_with(
+        Bucket="videos", Key="videos/clip.mp4", UploadId="up-1", PartNumber=3, Body=b"tail"
+    )
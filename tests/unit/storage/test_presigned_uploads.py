@@ -0,0 +1,83 @@
+# tests/unit/storage/test_presigned_uploads.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.storage.application.upload_stream import IncompleteUploadError
+from src.storage.domain.direct_upload import direct_upload_part_size
+from src.storage.infrastructure._s3_presigning import create_presigning_client
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+MB = 1024 * 1024
+
+
+def _storage() -> S3StorageService:
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(
+        bucket_name="videos", multipart_part_size_bytes=5 * MB, access_key="key", secret_key="secret",
+        endpoint_url="http://minio:9000", public_endpoint_url="https://files.example.com",
+    )
+    storage.presigning_client = create_presigning_client(storage.settings)
+    storage.client = MagicMock()
+    storage.client.create_multipart_upload.return_value = {"UploadId": "mp-1"}
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_small_file_gets_one_presigned_put_on_the_public_endpoint():
+    # Act
+    direct_upload = await _storage().create_direct_upload("videos/u/clip.mp4", size=MB, expires_in=600)
+
+    # Assert
+    assert direct_upload.multipart_upload_id is None
+    [request] = direct_upload.requests
+    url = urlparse(request.url)
+    assert request.method == "PUT"
+    assert url.netloc == "files.example.com" and url.path == "/videos/videos/u/clip.mp4"
+    assert parse_qs(url.query)["X-Amz-Expires"] == ["600"]
+
+
+@pytest.mark.asyncio
+async def test_large_file_gets_a_presigned_url_per_part():
+    # Arrange
+    storage = _storage()
+
+    # Act
+    direct_upload = await storage.create_direct_upload("videos/u/clip.mp4", size=12 * MB, expires_in=600)
+
+    # Assert
+    assert direct_upload.multipart_upload_id == "mp-1"
+    assert direct_upload.part_size == 5 * MB
+    assert [request.part_number for request in direct_upload.requests] == [1, 2, 3]
+    query = parse_qs(urlparse(direct_upload.requests[2].url).query)
+    assert query["partNumber"] == ["3"] and query["uploadId"] == ["mp-1"]
+
+
+def test_part_size_grows_to_stay_within_the_part_limit():
+    # Act & Assert
+    assert direct_upload_part_size(100 * MB, 5 * MB) == 5 * MB
+    assert direct_upload_part_size(100_000 * MB, 5 * MB) == 10 * MB
+
+
+@pytest.mark.asyncio
+async def test_incomplete_multipart_upload_is_not_completed():
+    # Arrange
+    storage = _storage()
+    paginator = MagicMock()
+    paginator.paginate.return_value = [{"Parts": [{"PartNumber": 1, "ETag": '"a"', "Size": 5 * MB}]}]
+    storage.client.get_paginator.return_value = paginator
+
+    # Act & Assert
+    with pytest.raises(IncompleteUploadError):
+        await storage.complete_direct_upload("videos/u/clip.mp4", "mp-1", size=12 * MB)
+    storage.client.complete_multipart_upload.assert_not_called()
+
+    # Once every part is there the upload is completed with the listed ETags
+    paginator.paginate.return_value = [
+        {"Parts": [{"PartNumber": 1, "ETag": '"a"', "Size": 5 * MB}, {"PartNumber": 2, "ETag": '"b"', "Size": 7 * MB}]}
+    ]
+    await storage.complete_direct_upload("videos/u/clip.mp4", "mp-1", size=12 * MB)
+    parts = storage.client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert parts == [{"PartNumber": 1, "ETag": '"a"'}, {"PartNumber": 2, "ETag": '"b"'}]
@@ -0,0 +1,119 @@
+# tests/unit/storage/test_ranged_download.py
+import asyncio
+import hashlib
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.storage.application.ranged_download import download_ranges, plan_ranges, verify_sha256
+from src.storage.application.storage_service import StorageException
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+MB = 1024 * 1024
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+def _s3_storage(payload: bytes, part_size_mb: int = 1, concurrency: int = 4) -> S3StorageService:
+    """An S3 provider over a fake client that serves `payload` honouring Range headers."""
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(
+        bucket_name="videos", download_part_size_bytes=part_size_mb * MB // 4, download_concurrency=concurrency
+    )
+
+    def get_object(Bucket, Key, Range=None, IfMatch=None):
+        if Range is None:
+            return {"Body": io.BytesIO(payload), "ETag": '"v1"'}
+        start, end = (int(value) for value in Range.removeprefix("bytes=").split("-"))
+        if start >= len(payload):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+        end = min(end, len(payload) - 1)
+        return {
+            "Body": io.BytesIO(payload[start:end + 1]),
+            "ContentRange": f"bytes {start}-{end}/{len(payload)}",
+            "ETag": '"v1"',
+        }
+
+    storage.client = MagicMock()
+    storage.client.get_object.side_effect = get_object
+    return storage
+
+
+def test_plan_ranges_covers_the_object():
+    # Act & Assert
+    assert plan_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+    assert plan_ranges(10, 4, offset=4) == [(4, 7), (8, 9)]
+    assert plan_ranges(0, 4) == []
+
+
+@pytest.mark.asyncio
+async def test_download_ranges_fills_preallocated_buffer_concurrently():
+    # Arrange
+    in_flight, peak = 0, 0
+
+    async def fetch(start, end):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return PAYLOAD[start:end + 1]
+
+    # Act
+    data = await download_ranges(fetch, len(PAYLOAD), 64 * 1024, concurrency=3, prefix=PAYLOAD[:64 * 1024])
+
+    # Assert
+    assert data == PAYLOAD
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_short_part_fails_the_download():
+    # Arrange
+    async def fetch(start, end):
+        return b"x"
+
+    # Act & Assert
+    with pytest.raises(StorageException):
+        await download_ranges(fetch, 100, 10, concurrency=4)
+
+
+@pytest.mark.asyncio
+async def test_s3_large_object_is_fetched_as_ranges_pinned_to_etag():
+    # Arrange
+    storage = _s3_storage(PAYLOAD)
+
+    # Act
+    data, filename = await storage.download("videos/u/clip.mp4")
+
+    # Assert
+    assert data == PAYLOAD
+    assert filename == "clip.mp4"
+    calls = storage.client.get_object.call_args_list
+    assert len(calls) == 4
+    assert all(call.kwargs.get("IfMatch") == '"v1"' for call in calls[1:])
+
+
+@pytest.mark.asyncio
+async def test_s3_small_and_empty_objects_take_one_request():
+    # Arrange
+    small, empty = _s3_storage(b"tiny"), _s3_storage(b"")
+
+    # Act
+    small_data, _ = await small.download("a.bin")
+    empty_data, _ = await empty.download("b.bin")
+
+    # Assert
+    assert small_data == b"tiny"
+    assert small.client.get_object.call_count == 1
+    assert empty_data == b""
+
+
+def test_verify_sha256():
+    # Act & Assert
+    verify_sha256(PAYLOAD, hashlib.sha256(PAYLOAD).hexdigest(), "clip.mp4")
+    verify_sha256(PAYLOAD, None, "clip.mp4")
+    with pytest.raises(StorageException):
+        verify_sha256(PAYLOAD[:-1], hashlib.sha256(PAYLOAD).hexdigest(), "clip.mp4")
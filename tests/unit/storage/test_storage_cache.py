@@ -0,0 +1,164 @@
+# tests/unit/storage/test_storage_cache.py
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.storage.infrastructure import dependencies
+from src.storage.infrastructure.cached_storage_service import CachedStorageService
+
+
+def _inner(contents: dict) -> MagicMock:
+    inner = MagicMock()
+    inner.provider_name = "s3"
+
+    async def download(file_path):
+        data = contents.get(str(file_path))
+        return (data, str(file_path).split("/")[-1]) if data is not None else None
+
+    inner.download = AsyncMock(side_effect=download)
+    inner.delete = AsyncMock(return_value=True)
+    return inner
+
+
+@pytest.mark.asyncio
+async def test_second_download_is_served_from_disk(tmp_path):
+    # Arrange
+    inner = _inner({"videos/a.mp4": b"video"})
+    cache = CachedStorageService(inner, tmp_path, max_bytes=1024)
+
+    # Act
+    first = await cache.download("videos/a.mp4")
+    second = await cache.download("videos/a.mp4")
+
+    # Assert
+    assert first == second == (b"video", "a.mp4")
+    inner.download.assert_awaited_once_with("videos/a.mp4")
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.bytes_fetched) == (1, 1, 5)
+    assert not any(path.name.startswith(".tmp-") for path in (tmp_path / "s3").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_share_one_fetch(tmp_path):
+    # Arrange
+    release = asyncio.Event()
+    inner = _inner({})
+
+    async def slow_download(file_path):
+        await release.wait()
+        return b"video", "a.mp4"
+
+    inner.download = AsyncMock(side_effect=slow_download)
+    cache = CachedStorageService(inner, tmp_path, max_bytes=1024)
+
+    # Act
+    downloads = [asyncio.create_task(cache.download("videos/a.mp4")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*downloads)
+
+    # Assert
+    assert results == [(b"video", "a.mp4")] * 5
+    inner.download.assert_awaited_once()
+    assert cache.stats.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_reaches_every_waiter_and_is_not_cached(tmp_path):
+    # Arrange
+    release = asyncio.Event()
+    inner = _inner({})
+
+    async def failing_download(file_path):
+        await release.wait()
+        raise RuntimeError("S3 is down")
+
+    inner.download = AsyncMock(side_effect=failing_download)
+    cache = CachedStorageService(inner, tmp_path, max_bytes=1024)
+
+    # Act
+    downloads = [asyncio.create_task(cache.download("videos/a.mp4")) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*downloads, return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert list((tmp_path / "s3").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Arrange
+    inner = _inner({f"videos/{name}": bytes(40) for name in ("a", "b", "c")})
+    cache = CachedStorageService(inner, tmp_path, max_bytes=100)
+    await cache.download("videos/a")
+    await cache.download("videos/b")
+    # a was used after b
+    os.utime(cache._entry_path("videos/b"), (1, 1))
+
+    # Act
+    await cache.download("videos/c")
+
+    # Assert
+    assert not cache._entry_path("videos/b").exists()
+    assert cache._entry_path("videos/a").exists() and cache._entry_path("videos/c").exists()
+    assert (cache.stats.evictions, cache.stats.bytes_evicted) == (1, 40)
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_the_entry(tmp_path):
+    # Arrange
+    inner = _inner({"videos/a.mp4": b"video"})
+    cache = CachedStorageService(inner, tmp_path, max_bytes=1024)
+    await cache.download("videos/a.mp4")
+
+    # Act
+    await cache.delete("videos/a.mp4")
+
+    # Assert
+    inner.delete.assert_awaited_once_with("videos/a.mp4")
+    assert not cache._entry_path("videos/a.mp4").exists()
+
+
+def test_factory_wraps_configured_providers(monkeypatch, tmp_path):
+    # Arrange
+    class RemoteStorage:
+        provider_name = "remote"
+
+    monkeypatch.setenv("STORAGE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("STORAGE_CACHE_PROVIDERS", "remote")
+    monkeypatch.setattr(dependencies, "_plugins_loaded", True)
+    monkeypatch.setattr(dependencies, "_storage_instances", {})
+    monkeypatch.setitem(dependencies._storage_registry, "remote", RemoteStorage)
+    monkeypatch.setitem(dependencies._storage_registry, "other", RemoteStorage)
+
+    # Act
+    cached = dependencies.create_storage_service("remote")
+    uncached = dependencies.create_storage_service("other")
+
+    # Assert
+    assert isinstance(cached, CachedStorageService) and cached.provider_name == "remote"
+    assert isinstance(uncached, RemoteStorage)
+
+
+@pytest.mark.asyncio
+async def test_lookups_and_evictions_are_exported_to_the_metrics_service(tmp_path):
+    # Arrange
+    inner = _inner({f"videos/{name}": bytes(40) for name in ("a", "b", "c")})
+    metrics_service = MagicMock()
+    cache = CachedStorageService(inner, tmp_path, max_bytes=100, metrics_service=metrics_service)
+    await cache.download("videos/a")
+    os.utime(cache._entry_path("videos/a"), (1, 1))
+
+    # Act
+    await cache.download("videos/b")
+    await cache.download("videos/b")
+    await cache.download("videos/c")
+
+    # Assert
+    lookups = [call.args for call in metrics_service.increment_storage_cache_lookup.call_args_list]
+    assert lookups == [("s3", "miss"), ("s3", "miss"), ("s3", "hit"), ("s3", "miss")]
+    assert metrics_service.increment_storage_cache_fetched_bytes.call_count == 3
+    metrics_service.increment_storage_cache_evictions.assert_called_once_with("s3", 1, 40)
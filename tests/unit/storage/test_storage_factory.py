@@ -0,0 +1,46 @@
+# tests/unit/storage/test_storage_factory.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.storage.infrastructure import dependencies
+
+
+@pytest.fixture
+def counting_provider(monkeypatch):
+    """Registers a provider that counts how often it is constructed."""
+    constructed = []
+
+    class CountingStorage:
+        def __init__(self):
+            constructed.append(self)
+
+    monkeypatch.setattr(dependencies, "_plugins_loaded", True)
+    monkeypatch.setattr(dependencies, "_storage_instances", {})
+    monkeypatch.setitem(dependencies._storage_registry, "counting", CountingStorage)
+    return constructed
+
+
+def test_storage_service_is_built_once_per_process(counting_provider):
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        instances = list(executor.map(lambda _: dependencies.create_storage_service("counting"), range(32)))
+
+    # Assert
+    assert len(counting_provider) == 1
+    assert all(instance is counting_provider[0] for instance in instances)
+
+
+def test_warm_up_builds_providers_up_front(counting_provider):
+    # Act
+    dependencies.warm_up_storage_services(["counting"])
+    instance = dependencies.get_storage_service_factory()("counting")
+
+    # Assert
+    assert counting_provider == [instance]
+
+
+def test_unknown_provider_is_rejected(counting_provider):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        dependencies.create_storage_service("missing")
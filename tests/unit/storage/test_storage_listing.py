@@ -0,0 +1,91 @@
+# tests/unit/storage/test_storage_listing.py
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.storage.infrastructure.local_storage_service import LocalStorageService
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    storage = LocalStorageService.__new__(LocalStorageService)
+    storage.root = tmp_path
+    return storage
+
+
+@pytest.fixture
+def s3_storage():
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(bucket_name="videos")
+    storage.client = MagicMock()
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_local_listing_is_paged_and_limited_to_the_prefix(local_storage, tmp_path):
+    # Arrange
+    for path in ("videos/u1/a/clip.mp4", "videos/u1/b/clip.mp4", "videos/u2/c/clip.mp4.part", "transcripts/t.txt.zst"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(b"data")
+    os.utime(tmp_path / "videos/u1/a/clip.mp4", (0, 0))
+
+    # Act
+    pages = [page async for page in local_storage.list_files("videos/", page_size=2)]
+
+    # Assert
+    assert [[file.path for file in page] for page in pages] == [
+        ["videos/u1/a/clip.mp4", "videos/u1/b/clip.mp4"], ["videos/u2/c/clip.mp4.part"],
+    ]
+    assert pages[0][0].size == 4
+    assert pages[0][0].last_modified == datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_local_listing_of_a_missing_directory_is_empty(local_storage):
+    # Act
+    pages = [page async for page in local_storage.list_files("blobs/")]
+
+    # Assert
+    assert pages == []
+
+
+@pytest.mark.asyncio
+async def test_s3_listing_maps_list_objects_pages(s3_storage):
+    # Arrange
+    modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    s3_storage.client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "videos/a.mp4", "Size": 3, "LastModified": modified}]},
+        {},
+    ]
+
+    # Act
+    pages = [page async for page in s3_storage.list_files("videos/", page_size=500)]
+
+    # Assert
+    assert [[(file.path, file.size) for file in page] for page in pages] == [[("videos/a.mp4", 3)]]
+    s3_storage.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Bucket="videos", Prefix="videos/", PaginationConfig={"PageSize": 500}
+    )
+
+
+@pytest.mark.asyncio
+async def test_s3_deletes_a_thousand_keys_per_request(s3_storage):
+    # Arrange
+    keys = [f"videos/{index}.mp4" for index in range(2500)]
+    s3_storage.client.delete_objects.side_effect = [
+        {}, {"Errors": [{"Key": "videos/1500.mp4", "Code": "AccessDenied", "Message": "Access Denied"}]}, {},
+    ]
+
+    # Act
+    deleted = await s3_storage.delete_many(keys)
+
+    # Assert
+    assert deleted == 2499
+    batches = [call.kwargs["Delete"]["Objects"] for call in s3_storage.client.delete_objects.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert batches[2][-1] == {"Key": "videos/2499.mp4"}
+    assert s3_storage.client.delete_objects.call_args.kwargs["Delete"]["Quiet"] is True
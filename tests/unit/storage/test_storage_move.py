@@ -0,0 +1,41 @@
+# tests/unit/storage/test_storage_move.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.storage.infrastructure.local_storage_service import LocalStorageService
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+
+@pytest.mark.asyncio
+async def test_local_move_renames_into_new_directories(tmp_path):
+    # Arrange
+    storage = LocalStorageService.__new__(LocalStorageService)
+    storage.root = tmp_path
+    (tmp_path / "videos").mkdir()
+    (tmp_path / "videos/clip.mp4").write_bytes(b"video")
+
+    # Act
+    await storage.move("videos/clip.mp4", "blobs/sha256/ab/abc.mp4")
+
+    # Assert
+    assert (tmp_path / "blobs/sha256/ab/abc.mp4").read_bytes() == b"video"
+    assert not (tmp_path / "videos/clip.mp4").exists()
+
+
+@pytest.mark.asyncio
+async def test_s3_move_copies_server_side():
+    # Arrange
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(bucket_name="videos")
+    storage.client = MagicMock()
+
+    # Act
+    await storage.move("videos/clip.mp4", "blobs/sha256/ab/abc.mp4")
+
+    # Assert
+    storage.client.copy.assert_called_once_with(
+        {"Bucket": "videos", "Key": "videos/clip.mp4"}, "videos", "blobs/sha256/ab/abc.mp4"
+    )
+    storage.client.delete_object.assert_called_once_with(Bucket="videos", Key="videos/clip.mp4")
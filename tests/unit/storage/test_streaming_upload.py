@@ -0,0 +1,114 @@
+# tests/unit/storage/test_streaming_upload.py
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.storage.application.storage_service import StorageException
+from src.storage.application.upload_stream import MeteredStream, UploadTooLargeError
+from src.storage.infrastructure.local_storage_service import LocalStorageService
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+
+MB = 1024 * 1024
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    storage = LocalStorageService.__new__(LocalStorageService)
+    storage.root = tmp_path
+    return storage
+
+
+def _s3_storage(part_size_mb: int = 5) -> S3StorageService:
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(bucket_name="videos", multipart_part_size_bytes=part_size_mb * MB)
+    storage.client = MagicMock()
+    storage.client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+    storage.client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_metered_stream_sizes_and_hashes():
+    # Arrange
+    stream = MeteredStream(_chunks(b"abc", b"def"), max_bytes=6)
+
+    # Act
+    chunks = [chunk async for chunk in stream]
+
+    # Assert
+    assert chunks == [b"abc", b"def"]
+    assert stream.size == 6
+    assert stream.sha256 == hashlib.sha256(b"abcdef").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_local_stream_upload_writes_incrementally(local_storage, tmp_path):
+    # Act
+    size = await local_storage.upload_stream("videos/a.mp4", _chunks(b"one", b"two"))
+
+    # Assert
+    assert size == 6
+    assert (tmp_path / "videos/a.mp4").read_bytes() == b"onetwo"
+    assert not (tmp_path / "videos/a.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_local_stream_upload_over_limit_leaves_nothing(local_storage, tmp_path):
+    # Arrange
+    stream = MeteredStream(_chunks(b"12345", b"67890"), max_bytes=8)
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await local_storage.upload_stream("videos/big.mp4", stream)
+    assert list((tmp_path / "videos").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_s3_small_stream_uses_one_put_object():
+    # Arrange
+    storage = _s3_storage()
+
+    # Act
+    size = await storage.upload_stream("videos/a.mp4", _chunks(b"a" * 100, b"b" * 100))
+
+    # Assert
+    assert size == 200
+    storage.client.put_object.assert_called_once_with(Bucket="videos", Key="videos/a.mp4", Body=b"a" * 100 + b"b" * 100)
+    storage.client.create_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_s3_large_stream_uses_multipart_parts():
+    # Arrange
+    storage = _s3_storage(part_size_mb=5)
+    chunks = [b"x" * (2 * MB)] * 6  # 12 MB: two full parts and a 2 MB tail
+
+    # Act
+    size = await storage.upload_stream("videos/big.mp4", _chunks(*chunks))
+
+    # Assert
+    assert size == 12 * MB
+    part_sizes = [len(call.kwargs["Body"]) for call in storage.client.upload_part.call_args_list]
+    assert part_sizes == [5 * MB, 5 * MB, 2 * MB]
+    parts = storage.client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert [part["PartNumber"] for part in parts] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_s3_failed_stream_aborts_multipart_upload():
+    # Arrange
+    storage = _s3_storage(part_size_mb=5)
+    stream = MeteredStream(_chunks(*[b"x" * (2 * MB)] * 4), max_bytes=7 * MB)
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await storage.upload_stream("videos/big.mp4", stream)
+    storage.client.abort_multipart_upload.assert_called_once_with(Bucket="videos", Key="videos/big.mp4", UploadId="up-1")
+    storage.client.complete_multipart_upload.assert_not_called()
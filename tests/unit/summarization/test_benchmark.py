@@ -0,0 +1,123 @@
+# tests/unit/summarization/test_benchmark.py
+import asyncio
+import threading
+
+import pytest
+
+from src.summarization.benchmark.harness import (
+    BenchmarkConfig,
+    expand_sweep,
+    find_regressions,
+    load_corpus,
+    run_benchmark,
+    run_config,
+)
+from src.summarization.config.settings import LLMSettings
+from src.summarization.infrastructure import dependencies
+from src.summarization.infrastructure.extractive_summarizer import ExtractiveSummarizer
+from src.summarization.infrastructure.openai_summarizer import estimate_tokens
+from src.summarization.benchmark.rouge import rouge_scores
+
+
+def test_rouge_scores():
+    """Tests ROUGE-1/2/L on identical, disjoint and partially overlapping summaries."""
+    identical = rouge_scores("the cat sat on the mat", "the cat sat on the mat")
+    assert identical == {"rouge1": 1.0, "rouge2": 1.0, "rougeL": 1.0}
+    assert rouge_scores("the cat sat", "dogs bark loudly")["rouge1"] == 0.0
+
+    scores = rouge_scores("the cat sat on the mat", "the cat lay on the mat")
+    assert scores["rouge1"] == pytest.approx(5 / 6)
+    assert scores["rouge2"] == pytest.approx(3 / 5)
+    assert scores["rougeL"] == pytest.approx(5 / 6)
+
+
+def test_expand_sweep_builds_the_cartesian_product():
+    """Tests that every provider, batch size and swept setting combination is benchmarked."""
+    configs = expand_sweep(
+        providers=["extractive", "huggingface"],
+        batch_sizes=[1, 4],
+        env_sweep={"HF_SUMMARIZER_NUM_BEAMS": ["1", "4"], "HF_SUMMARIZER_EXECUTION_MODE": ["fp32", "int8"]},
+    )
+
+    assert len(configs) == 16
+    assert len({config.key for config in configs}) == 16
+    env = {"HF_SUMMARIZER_EXECUTION_MODE": "int8", "HF_SUMMARIZER_NUM_BEAMS": "1"}
+    assert BenchmarkConfig(provider="huggingface", batch_size=4, env=env) in configs
+
+
+def test_bundled_corpus_exercises_map_reduce():
+    """Tests that several documents span multiple chunks and one exceeds a whole OpenAI chunk."""
+    # Arrange
+    corpus = load_corpus()
+    summarizer = ExtractiveSummarizer()
+
+    # Act
+    chunk_counts = [len(summarizer.split_text_into_chunks(document.transcript)) for document in corpus]
+    longest = max(estimate_tokens(document.transcript) for document in corpus)
+
+    # Assert
+    assert sum(count > 1 for count in chunk_counts) >= 5
+    assert longest > LLMSettings().openai_chunk_tokens
+
+
+def test_run_benchmark_reports_throughput_latency_and_quality():
+    """Tests a full in-process run of the CPU-only provider over the bundled corpus."""
+    # Act
+    [result] = run_benchmark([BenchmarkConfig(provider="extractive", repeats=2)], isolate=False)
+
+    # Assert
+    assert result["error"] is None
+    assert result["documents"] == 2 * len(load_corpus())
+    assert result["tokens_per_second"] > 0
+    assert 0 < result["latency_p50_seconds"] <= result["latency_p95_seconds"]
+    assert result["peak_rss_mb"] > 0
+    assert 0 < result["rougeL"] <= 1
+
+
+def test_concurrent_batches_complete_on_a_lock_bound_provider(monkeypatch):
+    """Tests that batch sizes above one do not deadlock a provider that serializes generation on a thread lock."""
+    # Arrange
+    class LockBoundSummarizer:
+        model_lock = threading.Lock()
+
+        async def summarize(self, text, progress_callback=None, length=None):
+            def generate():
+                with self.model_lock:
+                    return " ".join(text.split()[:20])
+
+            return await asyncio.get_running_loop().run_in_executor(None, generate)
+
+    monkeypatch.setattr(dependencies, "_plugins_loaded", True)
+    monkeypatch.setitem(dependencies._summarizer_registry, "lock-bound", LockBoundSummarizer)
+
+    # Act
+    result = asyncio.run(asyncio.wait_for(
+        run_config(BenchmarkConfig(provider="lock-bound", batch_size=4), load_corpus()), timeout=10
+    ))
+
+    # Assert
+    assert result.documents == len(load_corpus())
+    assert result.rougeL > 0
+
+
+def test_unknown_provider_is_reported_as_an_error():
+    [result] = run_benchmark([BenchmarkConfig(provider="missing")], isolate=False)
+
+    assert "not registered" in result["error"]
+
+
+def test_find_regressions():
+    """Tests that drops beyond the tolerance are flagged and others are not."""
+    baseline = [
+        {"key": "a", "tokens_per_second": 100.0, "rougeL": 0.3},
+        {"key": "b", "tokens_per_second": 100.0, "rougeL": 0.3},
+    ]
+    results = [
+        {"key": "a", "tokens_per_second": 95.0, "rougeL": 0.3, "error": None},
+        {"key": "b", "tokens_per_second": 50.0, "rougeL": 0.3, "error": None},
+    ]
+
+    regressions = find_regressions(baseline, results, tolerance=0.1)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b: tokens_per_second")
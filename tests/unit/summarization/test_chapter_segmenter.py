@@ -0,0 +1,46 @@
+# tests/unit/summarization/test_chapter_segmenter.py
+import random
+
+from src.summarization.application.chapter_segmenter import ChapterSegmenter
+
+TOPICS = [
+    ["solar", "panels", "sunlight", "electricity", "batteries", "inverter", "rooftop", "energy"],
+    ["recipe", "flour", "oven", "butter", "bread", "dough", "knead", "sugar"],
+    ["rocket", "orbit", "launch", "satellite", "astronaut", "moon", "fuel", "mission"],
+]
+
+
+def _transcript(sentences_per_topic=14):
+    rng = random.Random(7)
+    topics = []
+    for words in TOPICS:
+        sentences = [" ".join(rng.choice(words) for _ in range(6)).capitalize() + "." for _ in range(sentences_per_topic)]
+        topics.append(" ".join(sentences))
+    return topics
+
+
+def test_segment_splits_on_topic_changes():
+    """Tests that chapters start where the vocabulary of the transcript changes."""
+    # Arrange
+    topics = _transcript()
+    text = " ".join(topics)
+
+    # Act
+    segments = ChapterSegmenter().segment(text)
+
+    # Assert
+    assert [segment.text for segment in segments] == topics
+    assert [segment.start_offset for segment in segments] == [text.index(topic) for topic in topics]
+    for segment, words in zip(segments, TOPICS):
+        assert all(term in words for term in segment.title.lower().split(", "))
+
+
+def test_short_text_is_a_single_chapter():
+    """Tests that texts too short to hold two chapters are not split."""
+    text = "Solar panels convert sunlight. Bread needs flour."
+
+    segments = ChapterSegmenter().segment(text)
+
+    assert len(segments) == 1
+    assert segments[0].start_offset == 0
+    assert segments[0].text == text
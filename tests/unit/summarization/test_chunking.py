@@ -0,0 +1,50 @@
+# tests/unit/summarization/test_chunking.py
+import numpy as np
+
+from src.summarization.infrastructure.chunking import pack_chunks, split_sentences, tfidf_matrix
+
+SENTENCES = [f"Sentence number {i} talks about topic {i % 7} in some detail." for i in range(300)]
+
+
+def _chunk(sentences):
+    return pack_chunks(sentences, [len(sentence.split()) for sentence in sentences], budget=60)
+
+
+def test_pack_chunks_respects_budget_and_keeps_every_piece():
+    """Tests that chunks stay within the budget and preserve the text in order."""
+    # Act
+    chunks = _chunk(SENTENCES)
+
+    # Assert
+    assert all(len(chunk.split()) <= 60 for chunk in chunks)
+    assert split_sentences(" ".join(chunks)) == SENTENCES
+
+
+def test_edit_only_changes_nearby_chunks():
+    """Tests that inserting a sentence mid-transcript leaves most chunk boundaries untouched."""
+    # Arrange
+    edited = SENTENCES[:150] + ["An inserted correction that was missing from the first transcription."] + SENTENCES[150:]
+
+    # Act
+    original_chunks = _chunk(SENTENCES)
+    edited_chunks = _chunk(edited)
+
+    # Assert
+    changed = set(edited_chunks) - set(original_chunks)
+    assert len(original_chunks) > 20
+    assert 1 <= len(changed) <= 3
+
+
+def test_tfidf_matrix_weights_rare_terms_and_normalizes_rows():
+    """Tests that terms shared by every sentence weigh less and normalized rows have unit length."""
+    # Arrange
+    sentences = ["The cat sat.", "The dog sat.", "The cat ran."]
+
+    # Act
+    raw, vocabulary = tfidf_matrix(sentences)
+    normalized, _ = tfidf_matrix(sentences, normalize=True)
+
+    # Assert
+    assert vocabulary == ["the", "cat", "sat", "dog", "ran"]
+    assert raw[1, vocabulary.index("dog")] > raw[1, vocabulary.index("the")]
+    assert np.allclose(np.asarray(normalized.multiply(normalized).sum(axis=1)).ravel(), 1.0)
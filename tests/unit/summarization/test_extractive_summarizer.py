@@ -0,0 +1,78 @@
+# tests/unit/summarization/test_extractive_summarizer.py
+import pytest
+
+from src.summarization.domain.summary import SummaryLength
+from src.summarization.infrastructure.dependencies import create_summarizer_service, get_available_summarizer_providers
+from src.summarization.infrastructure.extractive_summarizer import ExtractiveSummarizer
+
+TRANSCRIPT = (
+    "Solar panels convert sunlight into electricity. "
+    "The weather was nice on the day of the recording. "
+    "Modern solar panels convert about twenty percent of sunlight into electricity. "
+    "Electricity from solar panels can be stored in batteries. "
+    "My cat likes to sleep on the sofa."
+)
+
+
+@pytest.mark.asyncio
+async def test_summarize_selects_central_sentences_in_original_order():
+    """Tests that the most central sentences are kept and returned in document order."""
+    # Arrange
+    summarizer = ExtractiveSummarizer(target_ratio=0.5)
+
+    # Act
+    result = await summarizer.summarize(TRANSCRIPT)
+
+    # Assert
+    assert "Modern solar panels convert about twenty percent" in result
+    assert "cat" not in result
+    sentences = summarizer.split_sentences(TRANSCRIPT)
+    positions = [TRANSCRIPT.index(s) for s in summarizer.split_sentences(result)]
+    assert positions == sorted(positions)
+    assert len(summarizer.split_sentences(result)) < len(sentences)
+
+
+@pytest.mark.asyncio
+async def test_summarize_respects_word_budget():
+    """Tests that the summary stops once the word budget is reached."""
+    # Arrange
+    summarizer = ExtractiveSummarizer(max_summary_words=12)
+
+    # Act
+    result = await summarizer.summarize(" ".join([TRANSCRIPT] * 10))
+
+    # Assert
+    assert 0 < len(result.split()) <= 12
+
+
+@pytest.mark.asyncio
+async def test_reduce_shortens_cached_chunk_summaries_to_requested_length():
+    """Tests that shorter variants are produced from the same chunk summaries."""
+    # Arrange
+    summarizer = ExtractiveSummarizer(chunk_words=20, target_ratio=0.9)
+    text = " ".join([TRANSCRIPT] * 10)
+    partial_summaries = await summarizer.summarize_chunks(summarizer.split_text_into_chunks(text))
+
+    # Act
+    tweet = await summarizer.reduce(partial_summaries, SummaryLength.TWEET)
+    detailed = await summarizer.reduce(partial_summaries, SummaryLength.DETAILED)
+
+    # Assert
+    assert len(partial_summaries) > 1
+    assert 0 < len(tweet.split()) <= SummaryLength.TWEET.target_words
+    assert len(tweet.split()) < len(detailed.split())
+
+
+@pytest.mark.asyncio
+async def test_summarize_empty_and_single_sentence():
+    """Tests degenerate inputs."""
+    summarizer = ExtractiveSummarizer()
+
+    assert await summarizer.summarize("   ") == ""
+    assert await summarizer.summarize("Only one sentence here.") == "Only one sentence here."
+
+
+def test_extractive_provider_is_registered():
+    """Tests that the provider is discoverable through the summarizer registry."""
+    assert "extractive" in get_available_summarizer_providers()
+    assert isinstance(create_summarizer_service("extractive"), ExtractiveSummarizer)
@@ -0,0 +1,16 @@
+# tests/unit/summarization/test_generation_params.py
+from src.summarization.config.settings import HuggingFaceSummarizerSettings
+from src.summarization.infrastructure.generation import generation_params
+
+
+def test_generation_params_scale_with_chunk_size():
+    """Tests that fragments are passed through, short chunks decode greedily and full chunks use beam search."""
+    settings = HuggingFaceSummarizerSettings(passthrough_tokens=24, greedy_below_tokens=128, num_beams=4)
+
+    def params(tokens):
+        return generation_params(tokens, settings, max_summary_length=64, min_summary_length=16)
+
+    assert params(10) is None
+    assert (params(60).num_beams, params(60).max_length, params(60).min_length) == (1, 16, 8)
+    assert (params(100).num_beams, params(100).max_length) == (1, 25)
+    assert (params(512).num_beams, params(512).max_length, params(512).min_length) == (4, 64, 16)
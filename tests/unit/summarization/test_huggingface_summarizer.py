@@ -0,0 +1,87 @@
+# tests/unit/summarization/test_huggingface_summarizer.py
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from src.summarization.domain.summary import SummaryLength  # noqa: E402
+from src.summarization.infrastructure.huggingface_summarizer import (  # noqa: E402
+    HuggingFaceSummarizer,
+    apply_execution_mode,
+    unigram_f1,
+)
+
+
+def _model():
+    return torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+
+
+def test_int8_mode_quantizes_linear_layers():
+    """Tests that the int8 mode swaps Linear layers for dynamically quantized ones."""
+    # Act
+    model, mode = apply_execution_mode(_model(), "int8")
+
+    # Assert
+    assert mode == "int8"
+    assert not any(type(layer) is torch.nn.Linear for layer in model.modules())
+    assert model(torch.randn(1, 8)).shape == (1, 2)
+
+
+def test_bf16_mode_falls_back_to_fp32_without_cpu_support(monkeypatch):
+    """Tests that bf16 is only applied when the CPU supports it."""
+    # Arrange
+    monkeypatch.setattr("src.summarization.infrastructure.huggingface_summarizer.cpu_supports_bf16", lambda: False)
+
+    # Act
+    model, mode = apply_execution_mode(_model(), "bf16")
+
+    # Assert
+    assert mode == "fp32"
+    assert next(model.parameters()).dtype == torch.float32
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        apply_execution_mode(_model(), "fp8")
+
+
+def test_unigram_f1_measures_output_drift():
+    assert unigram_f1("the council approved the plan", "the council approved the plan") == 1.0
+    assert unigram_f1("the council approved the plan", "rain is expected") == 0.0
+    assert 0 < unigram_f1("the council approved the plan", "the council rejected the plan") < 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chunks_share_the_model_without_blocking_the_loop():
+    """Tests that chunks summarized concurrently wait for the model lock on executor threads."""
+    # Arrange
+    summarizer = HuggingFaceSummarizer.__new__(HuggingFaceSummarizer)
+    summarizer.lock = threading.Lock()
+    summarizer._generate = lambda chunk, *args: time.sleep(0.01) or f"Summary of {chunk}"
+
+    # Act
+    summaries = await asyncio.wait_for(
+        asyncio.gather(summarizer._summarize_chunk("one"), summarizer._summarize_chunk("two")), timeout=5
+    )
+
+    # Assert
+    assert summaries == ["Summary of one", "Summary of two"]
+
+
+@pytest.mark.asyncio
+async def test_reduce_fails_clearly_when_every_chunk_of_a_pass_fails():
+    """Tests that a reduce pass whose chunks all come back empty raises instead of an IndexError."""
+    # Arrange
+    summarizer = HuggingFaceSummarizer.__new__(HuggingFaceSummarizer)
+    summarizer.split_text_into_chunks = lambda text: text.split("|") if text else []
+    summarizer._summarize_chunk = AsyncMock(return_value="")
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="no chunk could be summarized"):
+        await summarizer.reduce(["first|second", "third"], SummaryLength.TWEET)
+    assert summarizer._summarize_chunk.await_count == 2
@@ -0,0 +1,133 @@
+# tests/unit/summarization/test_openai_summarizer.py
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.shared.resilience.rate_limiter import AsyncTokenBucket
+from src.summarization.config.settings import LLMSettings
+from src.summarization.domain.summary import SummaryLength
+from src.summarization.infrastructure.dependencies import get_available_summarizer_providers
+from src.summarization.infrastructure.openai_summarizer import OpenAISummarizer
+
+
+class StubChatCompletions(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible endpoint that rate-limits the first request."""
+    requests = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            self.requests.append(body)
+            first = len(self.requests) == 1
+
+        if first:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        system, user = body["messages"][0]["content"], body["messages"][1]["content"]
+        content = "FINAL" if system.startswith("Combine") else f"summary of {len(user)} chars"
+        payload = json.dumps({
+            "choices": [{"message": {"role": "assistant", "content": content}}],
+            "usage": {"total_tokens": 10},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubChatCompletions.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubChatCompletions)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_summarize_maps_chunks_in_parallel_and_reduces(stub_server):
+    """Tests the map-reduce flow against a local HTTP stub, including a retried 429."""
+    # Arrange
+    settings = LLMSettings(
+        openai_api_key="test",
+        openai_base_url=stub_server,
+        openai_chunk_tokens=100,
+        openai_max_output_tokens=10,
+    )
+    summarizer = OpenAISummarizer(settings=settings)
+    text = " ".join(f"Sentence number {i} talks about a topic." for i in range(40))
+    progress = []
+
+    async def on_progress(update):
+        progress.append((update.completed, update.total))
+
+    # Act
+    result = await summarizer.summarize(text, progress_callback=on_progress)
+
+    # Assert
+    chunks = summarizer.split_text_into_chunks(text)
+    assert len(chunks) > 1
+    assert result == "FINAL"
+    # one map request per chunk + the throttled retry + one reduce request
+    assert len(StubChatCompletions.requests) == len(chunks) + 2
+    assert progress[-1] == (len(chunks), len(chunks))
+
+
+def test_split_text_respects_token_budget():
+    """Tests that no chunk exceeds the configured token budget."""
+    summarizer = OpenAISummarizer(settings=LLMSettings(openai_chunk_tokens=20))
+    text = "word " * 500 + ". Short sentence."
+
+    chunks = summarizer.split_text_into_chunks(text)
+
+    assert all(len(chunk) // 4 <= 20 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+@pytest.mark.asyncio
+async def test_reduce_stops_when_a_pass_does_not_shrink_the_summaries(monkeypatch):
+    """Tests that reduce ends, truncated to one request, when chunk outputs are as long as their inputs."""
+    # Arrange
+    summarizer = OpenAISummarizer(settings=LLMSettings(openai_chunk_tokens=20, openai_max_output_tokens=40))
+    requests = []
+
+    async def echo(instruction, content, max_tokens=None):
+        requests.append((instruction, content))
+        return content
+
+    monkeypatch.setattr(summarizer, "_complete", echo)
+    partial_summaries = [f"Partial summary number {index} of the transcript." for index in range(10)]
+
+    # Act
+    result = await summarizer.reduce(partial_summaries, SummaryLength.TWEET)
+
+    # Assert
+    reduce_requests = [content for instruction, content in requests if instruction.startswith("Combine")]
+    assert len(reduce_requests) == 1
+    assert result == reduce_requests[0]
+    assert len(result) <= 20 * 4
+
+
+def test_token_bucket_reports_wait_for_deficit():
+    """Tests that over-reserving returns the time needed to refill the deficit."""
+    bucket = AsyncTokenBucket(capacity=10, refill_per_second=5)
+
+    assert bucket.reserve(10) == 0
+    assert bucket.reserve(5) == pytest.approx(1.0, abs=0.05)
+
+
+def test_openai_provider_is_registered():
+    """Tests that the provider is discoverable through the summarizer registry."""
+    assert "openai" in get_available_summarizer_providers()
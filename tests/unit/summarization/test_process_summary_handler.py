@@ -1,21 +1,33 @@
 # tests/unit/summarization/test_process_summary_handler.py
+import asyncio
+import threading
+import time
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch, ANY
+from pybreaker import CircuitBreakerError
 
 from src.summarization.application.commands.process_summary_command import ProcessSummaryCommand
 from src.summarization.application.commands.process_summary_command_handler import ProcessSummaryCommandHandler
-from src.summarization.domain.summary import Summary, SummaryStatus
+from src.summarization.application.chapter_segmenter import Segment
+from src.summarization.domain.summary import ChunkSummary, Summary, SummaryLength, SummaryStatus, content_hash
 from src.transcription.domain.transcription import Transcription
 from src.shared.events.domain_events import SummarizationProgress
+from src.summarization.infrastructure.interfaces import ChunkProgress
+from src.shared.resilience.circuit_breaker import get_circuit_breaker
 
 @pytest.fixture
 def handler_mocks():
     """Sets up mocks for the ProcessSummaryCommandHandler dependencies."""
+    summarizer = AsyncMock()
+    summarizer.split_text_into_chunks = MagicMock(return_value=["chunk one", "chunk two"])
+    summary_repo = AsyncMock()
+    summary_repo.find_chunk_summaries.return_value = []
     return {
-        "summarizer": AsyncMock(),
-        "summary_repo": AsyncMock(),
+        "summarizer": summarizer,
+        "summary_repo": summary_repo,
         "transcription_queries": AsyncMock(),
-        "metrics_service": AsyncMock(),
+        "metrics_service": MagicMock(),
         "analytics_queries": AsyncMock(),
         "event_bus": AsyncMock(),
     }
@@ -30,9 +42,12 @@ async def test_process_new_summary_success(handler_mocks):
     summarized_text = "This is a summary."
 
     handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
     handler_mocks["transcription_queries"].get_by_id.return_value = transcription
     handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
-    handler_mocks["summarizer"].summarize.return_value = summarized_text
+    handler_mocks["summarizer"].provider_name = provider
+    handler_mocks["summarizer"].summarize_chunks.return_value = ["Summary one.", "Summary two."]
+    handler_mocks["summarizer"].reduce.return_value = summarized_text
 
     handler = ProcessSummaryCommandHandler(**handler_mocks)
     command = ProcessSummaryCommand(transcription_id=transcription_id, provider=provider)
@@ -46,7 +61,12 @@ async def test_process_new_summary_success(handler_mocks):
     assert result.provider == provider
 
     handler_mocks["summary_repo"].save.assert_awaited()
-    handler_mocks["summarizer"].summarize.assert_awaited_with(transcription.text)
+    handler_mocks["summarizer"].summarize_chunks.assert_awaited_with(["chunk one", "chunk two"], progress_callback=ANY)
+    saved_chunks = handler_mocks["summary_repo"].replace_chunk_summaries.await_args.args[2]
+    assert [(chunk.position, chunk.text) for chunk in saved_chunks] == [(0, "Summary one."), (1, "Summary two.")]
+    assert saved_chunks[0].content_hash == content_hash("chunk one")
+    assert result.source_hash == content_hash(transcription.text)
+    handler_mocks["summarizer"].reduce.assert_awaited_once_with(["Summary one.", "Summary two."], SummaryLength.DETAILED)
 
     published_events = [call.args[0] for call in handler_mocks["event_bus"].publish.await_args_list]
     assert any(isinstance(event, SummarizationProgress) for event in published_events)
@@ -57,7 +77,14 @@ async def test_process_summary_for_existing_completed_summary(handler_mocks):
     # Arrange
     transcription_id = "trans1"
     provider = "huggingface"
-    existing_summary = Summary(transcription_id=transcription_id, status=SummaryStatus.COMPLETED, text="An existing summary.")
+    transcription = Transcription(id=transcription_id, text="This is a long transcription text.")
+    existing_summary = Summary(
+        transcription_id=transcription_id,
+        status=SummaryStatus.COMPLETED,
+        text="An existing summary.",
+        source_hash=content_hash(transcription.text)
+    )
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
     handler_mocks["summary_repo"].find_by_transcription_id.return_value = existing_summary
 
     handler = ProcessSummaryCommandHandler(**handler_mocks)
@@ -68,4 +95,289 @@ async def test_process_summary_for_existing_completed_summary(handler_mocks):
 
     # Assert
     assert result == existing_summary
-    handler_mocks["summarizer"].summarize.assert_not_awaited()
+    handler_mocks["summarizer"].summarize_chunks.assert_not_awaited()
+    handler_mocks["summarizer"].reduce.assert_not_awaited()
+
+@pytest.mark.asyncio
+@patch("src.summarization.application.commands.process_summary_command_handler.get_circuit_breaker")
+async def test_process_summary_falls_back_when_breaker_is_open(mock_get_breaker, handler_mocks):
+    """Tests that the fallback summarizer answers when the primary provider's breaker is open."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="This is a long transcription text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+
+    open_breaker = MagicMock()
+    open_breaker.call.side_effect = CircuitBreakerError("open")
+    mock_get_breaker.side_effect = lambda key: open_breaker if key == "summarization_huggingface" else MagicMock()
+
+    fallback = AsyncMock()
+    fallback.provider_name = "extractive"
+    fallback.split_text_into_chunks = MagicMock(return_value=[transcription.text])
+    fallback.summarize_chunks.return_value = ["Extractive chunk summary."]
+    fallback.reduce.return_value = "Extractive summary."
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks, fallback_summarizers=[fallback])
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface")
+
+    # Act
+    result = await handler.handle(command)
+
+    # Assert
+    assert result.status == SummaryStatus.COMPLETED
+    assert result.text == "Extractive summary."
+    assert result.provider == "extractive"
+    handler_mocks["summarizer"].summarize_chunks.assert_not_awaited()
+    fallback.summarize_chunks.assert_awaited_once_with([transcription.text], progress_callback=ANY)
+    handler_mocks["summary_repo"].find_chunk_summaries.assert_awaited_once_with("trans1", "extractive")
+    handler_mocks["metrics_service"].increment_summarization_answer.assert_called_once_with("extractive", "breaker_open")
+
+
+@pytest.mark.asyncio
+async def test_process_summary_falls_through_chain_when_latency_budget_is_spent(handler_mocks):
+    """Tests that a provider running past the latency budget is abandoned for the next one in the chain."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="This is a long transcription text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "openai"
+
+    async def hang(chunks, progress_callback=None):
+        await asyncio.sleep(10)
+
+    handler_mocks["summarizer"].summarize_chunks.side_effect = hang
+
+    def fallback_summarizer(name, answer):
+        summarizer = AsyncMock()
+        summarizer.provider_name = name
+        summarizer.split_text_into_chunks = MagicMock(return_value=[transcription.text])
+        summarizer.summarize_chunks.return_value = [answer]
+        summarizer.reduce.return_value = answer
+        return summarizer
+
+    slow = fallback_summarizer("huggingface", "Abstractive summary.")
+    slow.summarize_chunks.side_effect = hang
+    cheapest = fallback_summarizer("extractive", "Extractive summary.")
+
+    handler = ProcessSummaryCommandHandler(
+        **handler_mocks, fallback_summarizers=[slow, cheapest], latency_budget_seconds=0.05
+    )
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="openai")
+
+    # Act
+    with patch(
+        "src.summarization.application.commands.process_summary_command_handler.get_circuit_breaker",
+        wraps=get_circuit_breaker,
+    ) as breakers:
+        result = await handler.handle(command)
+
+    # Assert
+    assert result.text == "Extractive summary."
+    assert result.provider == "extractive"
+    # The primary spent the whole budget, so the next timed provider is not even started, nor its breaker charged
+    slow.summarize_chunks.assert_not_awaited()
+    assert [call.args[0] for call in breakers.call_args_list] == ["summarization_openai", "summarization_extractive"]
+    handler_mocks["metrics_service"].increment_summarization_answer.assert_called_once_with(
+        "extractive", "budget_exceeded"
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_summary_relays_chunk_progress(handler_mocks):
+    """Tests that progress reported by the summarizer is published between the start and completion events."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="This is a long transcription text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+
+    async def summarize_chunks(chunks, progress_callback=None):
+        for completed in (1, 2):
+            await progress_callback(ChunkProgress(completed=completed, total=2, elapsed_seconds=float(completed)))
+        return ["Summary one.", "Summary two."]
+
+    handler_mocks["summarizer"].summarize_chunks.side_effect = summarize_chunks
+    handler_mocks["summarizer"].reduce.return_value = "Summary."
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks, progress_min_interval_seconds=0)
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface")
+
+    # Act
+    await handler.handle(command)
+
+    # Assert
+    published = [call.args[0] for call in handler_mocks["event_bus"].publish.await_args_list]
+    assert [event.progress for event in published] == [0, 50, 99, 100]
+    assert [event.completed_chunks for event in published[1:3]] == [1, 2]
+    assert published[-1].stage == "completed"
+
+
+@pytest.mark.asyncio
+async def test_process_summary_reuses_cached_chunk_summaries_for_new_length(handler_mocks):
+    """Tests that a new summary length only runs the reduce stage over the persisted chunk summaries."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="This is a long transcription text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["summary_repo"].find_chunk_summaries.return_value = [
+        ChunkSummary(position=0, content_hash=content_hash("chunk one"), text="Cached one."),
+        ChunkSummary(position=1, content_hash=content_hash("chunk two"), text="Cached two."),
+    ]
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+    handler_mocks["summarizer"].reduce.return_value = "Tweet-sized summary."
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks)
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface", length=SummaryLength.TWEET)
+
+    # Act
+    result = await handler.handle(command)
+
+    # Assert
+    assert result.text == "Tweet-sized summary."
+    assert result.length == SummaryLength.TWEET
+    handler_mocks["summary_repo"].find_by_transcription_id.assert_awaited_once_with("trans1", SummaryLength.TWEET)
+    handler_mocks["summarizer"].summarize_chunks.assert_not_awaited()
+    handler_mocks["summary_repo"].replace_chunk_summaries.assert_not_awaited()
+    handler_mocks["summarizer"].reduce.assert_awaited_once_with(["Cached one.", "Cached two."], SummaryLength.TWEET)
+
+
+@pytest.mark.asyncio
+async def test_process_summary_resummarizes_only_edited_chunks(handler_mocks):
+    """Tests that after a transcript edit only chunks with a new content hash go through the map stage."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="This is the corrected transcription text.")
+    existing_summary = Summary(
+        transcription_id="trans1",
+        length=SummaryLength.DETAILED,
+        status=SummaryStatus.COMPLETED,
+        text="Summary of the old text.",
+        source_hash=content_hash("This is the old transcription text.")
+    )
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = existing_summary
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["summary_repo"].find_chunk_summaries.return_value = [
+        ChunkSummary(position=0, content_hash=content_hash("chunk one"), text="Cached one."),
+        ChunkSummary(position=1, content_hash=content_hash("old chunk two"), text="Old two."),
+        ChunkSummary(position=2, content_hash=content_hash("chunk three"), text="Cached three."),
+    ]
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+    handler_mocks["summarizer"].split_text_into_chunks.return_value = ["chunk one", "new chunk two", "chunk three"]
+    handler_mocks["summarizer"].summarize_chunks.return_value = ["New two."]
+    handler_mocks["summarizer"].reduce.return_value = "Summary of the corrected text."
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks)
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface")
+
+    # Act
+    result = await handler.handle(command)
+
+    # Assert
+    assert result.text == "Summary of the corrected text."
+    assert result.source_hash == content_hash(transcription.text)
+    handler_mocks["summarizer"].summarize_chunks.assert_awaited_once_with(["new chunk two"], progress_callback=ANY)
+    handler_mocks["summarizer"].reduce.assert_awaited_once_with(
+        ["Cached one.", "New two.", "Cached three."], SummaryLength.DETAILED
+    )
+    saved_chunks = handler_mocks["summary_repo"].replace_chunk_summaries.await_args.args[2]
+    assert [chunk.text for chunk in saved_chunks] == ["Cached one.", "New two.", "Cached three."]
+
+
+@pytest.mark.asyncio
+async def test_process_summary_summarizes_chapters_concurrently(handler_mocks):
+    """Tests that chapter mode summarizes each segment and stores the chapters alongside the summary."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="Topic one text. Topic two text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+
+    segmenter = MagicMock()
+    segmenter.segment.return_value = [
+        Segment(title="Topic, one", start_offset=0, text="Topic one text."),
+        Segment(title="Topic, two", start_offset=16, text="Topic two text."),
+    ]
+    running = 0
+    max_running = 0
+
+    async def summarize(text, progress_callback=None, length=SummaryLength.DETAILED):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return f"Summary of {text}"
+
+    handler_mocks["summarizer"].summarize.side_effect = summarize
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks, chapter_segmenter=segmenter, progress_min_interval_seconds=0)
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface", length=SummaryLength.CHAPTERS)
+
+    # Act
+    result = await handler.handle(command)
+
+    # Assert
+    assert max_running == 2
+    handler_mocks["summarizer"].summarize.assert_any_await("Topic one text.", length=SummaryLength.PARAGRAPH)
+    handler_mocks["summary_repo"].delete_chapters.assert_awaited_once_with(result.id)
+    chapters = sorted(
+        (call.args[0] for call in handler_mocks["summary_repo"].add_chapter.await_args_list), key=lambda c: c.position
+    )
+    assert [(c.title, c.start_offset, c.text) for c in chapters] == [
+        ("Topic, one", 0, "Summary of Topic one text."),
+        ("Topic, two", 16, "Summary of Topic two text."),
+    ]
+    assert all(chapter.summary_id == result.id for chapter in chapters)
+    assert result.text == "Topic, one\nSummary of Topic one text.\n\nTopic, two\nSummary of Topic two text."
+    published = [call.args[0] for call in handler_mocks["event_bus"].publish.await_args_list]
+    assert [event.completed_chunks for event in published[1:3]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_process_summary_chapters_complete_with_a_lock_bound_summarizer(handler_mocks):
+    """Tests that concurrent chapters do not deadlock on a summarizer that serializes generation on a thread lock."""
+    # Arrange
+    transcription = Transcription(id="trans1", text="Topic one text. Topic two text.")
+    handler_mocks["summary_repo"].find_by_transcription_id.return_value = None
+    handler_mocks["summary_repo"].save.side_effect = lambda summary: summary
+    handler_mocks["transcription_queries"].get_by_id.return_value = transcription
+    handler_mocks["analytics_queries"].estimate_processing_time.return_value = {"estimated_total_seconds": 60}
+    handler_mocks["summarizer"].provider_name = "huggingface"
+
+    segmenter = MagicMock()
+    segmenter.segment.return_value = [
+        Segment(title="One", start_offset=0, text="Topic one text."),
+        Segment(title="Two", start_offset=16, text="Topic two text."),
+    ]
+    model_lock = threading.Lock()
+
+    async def summarize(text, progress_callback=None, length=SummaryLength.DETAILED):
+        def generate():
+            with model_lock:
+                time.sleep(0.01)
+                return f"Summary of {text}"
+
+        return await asyncio.get_running_loop().run_in_executor(None, generate)
+
+    handler_mocks["summarizer"].summarize.side_effect = summarize
+
+    handler = ProcessSummaryCommandHandler(**handler_mocks, chapter_segmenter=segmenter, progress_min_interval_seconds=0)
+    command = ProcessSummaryCommand(transcription_id="trans1", provider="huggingface", length=SummaryLength.CHAPTERS)
+
+    # Act
+    result = await asyncio.wait_for(handler.handle(command), timeout=5)
+
+    # Assert
+    assert result.text == "One\nSummary of Topic one text.\n\nTwo\nSummary of Topic two text."
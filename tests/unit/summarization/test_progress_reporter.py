@@ -0,0 +1,151 @@
+# tests/unit/summarization/test_progress_reporter.py
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.shared.events.domain_events import SummarizationProgress
+from src.summarization.application.progress_reporter import SummarizationProgressReporter, stream_progress
+from src.summarization.domain.summary import SummaryLength, SummaryStatus
+from src.summarization.infrastructure.interfaces import ChunkProgress
+
+
+@pytest.fixture
+def mock_event_bus():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_reporter_publishes_counts_and_eta(mock_event_bus):
+    """Tests that chunk progress is translated into a SummarizationProgress event."""
+    # Arrange
+    reporter = SummarizationProgressReporter(event_bus=mock_event_bus, transcription_id="trans1", length="tweet")
+
+    # Act
+    await reporter(ChunkProgress(completed=1, total=4, elapsed_seconds=2.0))
+
+    # Assert
+    event = mock_event_bus.publish.await_args.args[0]
+    assert isinstance(event, SummarizationProgress)
+    assert event.transcription_id == "trans1"
+    assert event.progress == 25
+    assert (event.completed_chunks, event.total_chunks) == (1, 4)
+    assert event.eta_seconds == pytest.approx(6.0)
+    assert event.length == "tweet"
+
+
+@pytest.mark.asyncio
+async def test_reporter_rate_limits_but_always_publishes_final_chunk(mock_event_bus):
+    """Tests that intermediate events are throttled and the last chunk is never dropped."""
+    # Arrange
+    reporter = SummarizationProgressReporter(event_bus=mock_event_bus, transcription_id="trans1", min_interval_seconds=60)
+
+    # Act
+    for completed in range(1, 11):
+        await reporter(ChunkProgress(completed=completed, total=10, elapsed_seconds=float(completed)))
+
+    # Assert
+    published = [call.args[0] for call in mock_event_bus.publish.await_args_list]
+    assert [event.completed_chunks for event in published] == [1, 10]
+    assert published[-1].progress == 99
+
+
+def test_chunk_progress_eta_is_unknown_before_first_chunk():
+    """Tests that no ETA is extrapolated without any completed chunk."""
+    assert ChunkProgress(completed=0, total=3, elapsed_seconds=0.5).eta_seconds is None
+
+
+def _bus_streaming(*events):
+    """An event bus whose progress stream yields the given payloads, then ends."""
+    async def stream(event_type, timeout):
+        for event in events:
+            yield event
+
+    event_bus = MagicMock()
+    event_bus.stream = MagicMock(side_effect=stream)
+    return event_bus
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_after_the_snapshot_of_a_finished_summary():
+    """Tests that a completed summary is reported at once, without subscribing to live events."""
+    # Arrange
+    event_bus = _bus_streaming()
+    load_status = AsyncMock(return_value=SummaryStatus.COMPLETED)
+
+    # Act
+    events = await _collect(stream_progress(
+        event_bus, "trans1", SummaryLength.TWEET, load_status, keepalive_seconds=15, max_seconds=60
+    ))
+
+    # Assert
+    assert [(event["stage"], event["progress"], event["length"]) for event in events] == [("completed", 100, "tweet")]
+    event_bus.stream.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_relays_only_events_of_the_requested_summary():
+    """Tests that events of other transcriptions or summary lengths are filtered out."""
+    # Arrange
+    event_bus = _bus_streaming(
+        {"transcription_id": "trans2", "length": "tweet", "stage": "summarization", "progress": 10},
+        {"transcription_id": "trans1", "length": "detailed", "stage": "completed", "progress": 100},
+        {"transcription_id": "trans1", "length": "tweet", "stage": "summarization", "progress": 50},
+        {"transcription_id": "trans1", "length": "tweet", "stage": "completed", "progress": 100},
+        {"transcription_id": "trans1", "length": "tweet", "stage": "summarization", "progress": 0},
+    )
+    load_status = AsyncMock(return_value=SummaryStatus.PROCESSING)
+
+    # Act
+    events = await _collect(stream_progress(
+        event_bus, "trans1", SummaryLength.TWEET, load_status, keepalive_seconds=15, max_seconds=60
+    ))
+
+    # Assert
+    assert [event["progress"] for event in events] == [0, 50, 100]
+    assert events[0]["stage"] == "summarization"
+
+
+@pytest.mark.asyncio
+async def test_stream_rechecks_the_status_on_keepalive():
+    """Tests that a job which ended before the subscription started still closes the stream."""
+    # Arrange
+    event_bus = _bus_streaming(None, None, None)
+    load_status = AsyncMock(side_effect=[SummaryStatus.PENDING, SummaryStatus.PENDING, SummaryStatus.FAILED])
+
+    # Act
+    events = await _collect(stream_progress(
+        event_bus, "trans1", SummaryLength.TWEET, load_status, keepalive_seconds=15, max_seconds=60
+    ))
+
+    # Assert
+    assert events[0]["stage"] == "pending"
+    assert events[1] is None
+    assert events[2]["stage"] == "failed"
+    assert len(events) == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_once_the_maximum_duration_passes(monkeypatch):
+    """Tests that the stream is capped even while the job keeps running."""
+    # Arrange
+    clock = iter([0.0, 10.0, 61.0])
+    monkeypatch.setattr(
+        "src.summarization.application.progress_reporter.time", SimpleNamespace(monotonic=lambda: next(clock))
+    )
+    event_bus = _bus_streaming(
+        {"transcription_id": "trans1", "length": "tweet", "stage": "summarization", "progress": 10},
+        {"transcription_id": "trans1", "length": "tweet", "stage": "summarization", "progress": 20},
+    )
+    load_status = AsyncMock(return_value=SummaryStatus.PROCESSING)
+
+    # Act
+    events = await _collect(stream_progress(
+        event_bus, "trans1", SummaryLength.TWEET, load_status, keepalive_seconds=15, max_seconds=60
+    ))
+
+    # Assert
+    assert [event["progress"] for event in events] == [0, 10]
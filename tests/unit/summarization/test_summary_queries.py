@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from src.summarization.application.queries.summary_queries import SummaryQueries
-from src.summarization.domain.summary import Summary
+from src.summarization.domain.summary import Summary, SummaryLength
 
 
 @pytest.fixture
@@ -27,7 +27,7 @@ async def test_get_by_id(mock_summary_repository):
 
     # Assert
     assert result == expected_summary
-    mock_summary_repository.find_by_id.assert_awaited_once_with(summary_id)
+    mock_summary_repository.find_by_id.assert_awaited_once_with(summary_id, with_text=True)
 
 
 @pytest.mark.asyncio
@@ -45,4 +45,25 @@ async def test_get_by_transcription_id(mock_summary_repository):
 
     # Assert
     assert result == expected_summary
-    mock_summary_repository.find_by_transcription_id.assert_awaited_once_with(transcription_id)
+    mock_summary_repository.find_by_transcription_id.assert_awaited_once_with(transcription_id, SummaryLength.DETAILED, with_text=True)
+
+
+@pytest.mark.asyncio
+async def test_list_by_transcription_id(mock_summary_repository):
+    """Tests retrieving every summary variant of a transcription."""
+    # Arrange
+    transcription_id = str(uuid4())
+    expected_summaries = [
+        Summary(id=str(uuid4()), transcription_id=transcription_id, length=SummaryLength.TWEET),
+        Summary(id=str(uuid4()), transcription_id=transcription_id, length=SummaryLength.DETAILED),
+    ]
+    mock_summary_repository.list_by_transcription_id.return_value = expected_summaries
+
+    queries = SummaryQueries(summary_repository=mock_summary_repository)
+
+    # Act
+    result = await queries.list_by_transcription_id(transcription_id)
+
+    # Assert
+    assert result == expected_summaries
+    mock_summary_repository.list_by_transcription_id.assert_awaited_once_with(transcription_id, with_text=True)
@@ -0,0 +1,180 @@
+# tests/unit/transcription/test_hedging.py
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.shared.resilience.hedging import HedgeBudget, LatencyTracker
+from src.transcription.application.commands.process_transcription_command_handler import ProcessTranscriptionCommandHandler
+from src.transcription.infrastructure.interfaces import run_inference
+
+
+def _provider(name: str, delay: float, text: str = None, error: Exception = None):
+    provider = MagicMock()
+    provider.provider_name = name
+
+    async def transcribe(audio_bytes, language="en"):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return text or f"{name} text"
+
+    provider.transcribe = AsyncMock(side_effect=transcribe)
+    return provider
+
+
+def _warm_tracker(size: int, seconds: float) -> LatencyTracker:
+    tracker = LatencyTracker(window=50, min_samples=5)
+    for _ in range(5):
+        tracker.observe(size, seconds)
+    return tracker
+
+
+def _handler(primary, backup, tracker, budget, metrics_service):
+    return ProcessTranscriptionCommandHandler(
+        speech_recognition=primary,
+        storage_service=AsyncMock(),
+        event_bus=AsyncMock(),
+        transcription_repository=AsyncMock(),
+        video_queries=AsyncMock(),
+        video_repository=AsyncMock(),
+        metrics_service=metrics_service,
+        backup_speech_recognition=backup,
+        latency_tracker=tracker,
+        hedge_budget=budget,
+    )
+
+
+def _full_budget() -> HedgeBudget:
+    budget = HedgeBudget(ratio=1.0)
+    budget.record_request()
+    return budget
+
+
+def test_latency_tracker_percentile_per_size_class():
+    # Arrange
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(1, 101):
+        tracker.observe(1_100_000, i / 100)
+    tracker.observe(10, 50.0)
+
+    # Act & Assert
+    assert tracker.percentile(2_000_000, 95) == pytest.approx(0.95)
+    assert tracker.percentile(10, 95) is None  # too few samples for small audio yet
+
+
+def test_hedge_budget_caps_hedges_to_ratio():
+    # Arrange
+    budget = HedgeBudget(ratio=0.25)
+
+    # Act
+    hedges = 0
+    for _ in range(100):
+        budget.record_request()
+        hedges += budget.try_spend()
+
+    # Assert
+    assert hedges == 25
+
+
+@pytest.mark.asyncio
+@patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
+async def test_backup_wins_when_primary_is_slow(mock_get_breaker):
+    # Arrange
+    mock_get_breaker.return_value = MagicMock()
+    primary, backup = _provider("whisper", delay=5), _provider("fastwhisper", delay=0.01)
+    metrics_service = MagicMock()
+    handler = _handler(primary, backup, _warm_tracker(4, 0.02), _full_budget(), metrics_service)
+
+    # Act
+    text, provider = await handler._transcribe_hedged(b"data", "en")
+
+    # Assert
+    assert (text, provider) == ("fastwhisper text", backup)
+    metrics_service.increment_transcription_hedge.assert_called_once_with("backup_won")
+
+
+@pytest.mark.asyncio
+@patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
+async def test_no_hedge_without_latency_history(mock_get_breaker):
+    # Arrange
+    mock_get_breaker.return_value = MagicMock()
+    primary, backup = _provider("whisper", delay=0.05), _provider("fastwhisper", delay=0)
+    metrics_service = MagicMock()
+    tracker = LatencyTracker(min_samples=5)
+    handler = _handler(primary, backup, tracker, _full_budget(), metrics_service)
+
+    # Act
+    text, provider = await handler._transcribe_hedged(b"data", "en")
+
+    # Assert
+    assert provider is primary
+    backup.transcribe.assert_not_awaited()
+    assert tracker.percentile(4, 50) is None and len(tracker._samples[2]) == 1
+    metrics_service.increment_transcription_hedge.assert_called_once_with("not_needed")
+
+
+@pytest.mark.asyncio
+@patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
+async def test_no_hedge_when_budget_is_spent(mock_get_breaker):
+    # Arrange
+    mock_get_breaker.return_value = MagicMock()
+    primary, backup = _provider("whisper", delay=0.05), _provider("fastwhisper", delay=0)
+    metrics_service = MagicMock()
+    handler = _handler(primary, backup, _warm_tracker(4, 0.01), HedgeBudget(ratio=0.01), metrics_service)
+
+    # Act
+    _, provider = await handler._transcribe_hedged(b"data", "en")
+
+    # Assert
+    assert provider is primary
+    backup.transcribe.assert_not_awaited()
+    metrics_service.increment_transcription_hedge.assert_called_once_with("budget_exhausted")
+
+
+@pytest.mark.asyncio
+@patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
+async def test_primary_result_is_kept_when_backup_fails(mock_get_breaker):
+    # Arrange
+    mock_get_breaker.return_value = MagicMock()
+    primary = _provider("whisper", delay=0.1)
+    backup = _provider("fastwhisper", delay=0, error=RuntimeError("backup down"))
+    metrics_service = MagicMock()
+    handler = _handler(primary, backup, _warm_tracker(4, 0.01), _full_budget(), metrics_service)
+
+    # Act
+    text, provider = await handler._transcribe_hedged(b"data", "en")
+
+    # Assert
+    assert (text, provider) == ("whisper text", primary)
+    metrics_service.increment_transcription_hedge.assert_called_once_with("primary_won")
+
+
+@pytest.mark.asyncio
+@patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
+async def test_backup_wins_against_a_primary_blocked_in_inference(mock_get_breaker):
+    # Arrange
+    mock_get_breaker.return_value = MagicMock()
+    release = threading.Event()
+    primary = MagicMock()
+    primary.provider_name = "whisper"
+
+    async def transcribe(audio_bytes, language="en"):
+        # A model call that blocks until released, like a real inference
+        return await run_inference(lambda: release.wait(5) and "whisper text")
+
+    primary.transcribe = AsyncMock(side_effect=transcribe)
+    backup = _provider("fastwhisper", delay=0.01)
+    handler = _handler(primary, backup, _warm_tracker(4, 0.02), _full_budget(), MagicMock())
+
+    # Act
+    started_at = time.monotonic()
+    text, provider = await asyncio.wait_for(handler._transcribe_hedged(b"data", "en"), timeout=2)
+    elapsed = time.monotonic() - started_at
+    release.set()
+
+    # Assert
+    assert (text, provider) == ("fastwhisper text", backup)
+    assert elapsed < 1
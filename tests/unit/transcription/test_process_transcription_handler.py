@@ -1,6 +1,6 @@
 # tests/unit/transcription/test_process_transcription_handler.py
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from pybreaker import CircuitBreakerError
 
 from src.transcription.application.commands.process_transcription_command import ProcessTranscriptionCommand
@@ -34,9 +34,7 @@ async def test_handle_new_transcription_success(mock_get_breaker, handler_mocks)
     handler_mocks["speech_recognition"].transcribe.return_value = "Transcribed text"
 
     # Mock the circuit breaker to execute the call directly
-    mock_breaker = AsyncMock()
-    mock_breaker.call_async.return_value = "Transcribed text"
-    mock_get_breaker.return_value = mock_breaker
+    mock_get_breaker.return_value = MagicMock()
 
     handler = ProcessTranscriptionCommandHandler(**handler_mocks)
     command = ProcessTranscriptionCommand(video_id="vid1", provider="whisper", language="en")
@@ -50,7 +48,7 @@ async def test_handle_new_transcription_success(mock_get_breaker, handler_mocks)
     assert video.status == VideoStatus.COMPLETED # Check final state
 
     handler_mocks["video_repository"].save.assert_awaited()
-    mock_breaker.call_async.assert_awaited_once()
+    handler_mocks["speech_recognition"].transcribe.assert_awaited_once_with(b"audio_data", language="en")
 
 @pytest.mark.asyncio
 @patch("src.transcription.application.commands.process_transcription_command_handler.get_circuit_breaker")
@@ -62,10 +60,9 @@ async def test_handle_transcription_failure(mock_get_breaker, handler_mocks):
     handler_mocks["transcription_repository"].find_by_video_id.return_value = None
     handler_mocks["storage_service"].download.return_value = (b"audio_data", "audio.mp3")
 
-    # Mock the circuit breaker to raise an error
-    mock_breaker = AsyncMock()
-    mock_breaker.call_async.side_effect = RuntimeError("External service failed")
-    mock_get_breaker.return_value = mock_breaker
+    # The call goes through the circuit breaker and fails
+    mock_get_breaker.return_value = MagicMock()
+    handler_mocks["speech_recognition"].transcribe.side_effect = RuntimeError("External service failed")
 
     handler = ProcessTranscriptionCommandHandler(**handler_mocks)
     command = ProcessTranscriptionCommand(video_id="vid1", provider="whisper", language="en")
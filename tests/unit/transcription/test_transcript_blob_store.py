@@ -0,0 +1,161 @@
+# tests/unit/transcription/test_transcript_blob_store.py
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+pytest.importorskip("zstandard")
+
+from src.storage.application.storage_service import RANGE_CHUNK_BYTES, StorageException
+from src.storage.domain.file_metadata import FileMetadata
+from src.transcription.application.queries.transcription_queries import TranscriptionQueries
+from src.transcription.domain.transcription import Transcription
+from src.transcription.infrastructure.transcript_blob_store import READ_CHUNK_BYTES, TranscriptBlobStore
+from src.transcription.tasks.offload_backfill import backfill_offloaded_transcripts
+
+
+class InMemoryStorage:
+    """Serves reads through stat/iter_range only, so a whole-blob download would fail the tests."""
+    def __init__(self):
+        self.blobs = {}
+        self.chunks_served = 0
+
+    async def upload(self, file_path, file):
+        self.blobs[str(file_path)] = file
+        return True
+
+    async def stat(self, file_path):
+        blob = self.blobs.get(str(file_path))
+        return FileMetadata(size=len(blob), last_modified=datetime.now()) if blob is not None else None
+
+    async def iter_range(self, file_path, start, end, chunk_size=RANGE_CHUNK_BYTES):
+        blob = self.blobs[str(file_path)][start:end + 1]
+        for offset in range(0, len(blob), chunk_size):
+            self.chunks_served += 1
+            yield blob[offset:offset + chunk_size]
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorage()
+
+
+@pytest.fixture
+def store(storage):
+    return TranscriptBlobStore(storage_service_factory=lambda provider: storage, provider="local", threshold_bytes=1024)
+
+
+def _transcription(text: str) -> Transcription:
+    transcription = Transcription(id=uuid4(), video_id=uuid4())
+    transcription.mark_as_completed(text)
+    return transcription
+
+
+@pytest.mark.asyncio
+async def test_large_transcript_is_offloaded_and_streamed_back(store, storage):
+    # Arrange
+    text = "Olá, transcrição longa. " * 20_000
+    transcription = _transcription(text)
+
+    # Act
+    offloaded = await store.offload(transcription)
+    chunks = [chunk async for chunk in store.iter_text(transcription)]
+
+    # Assert
+    assert offloaded and transcription.text is None and transcription.is_offloaded
+    assert len(storage.blobs[transcription.text_blob_key]) < len(text) // 10
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+
+
+@pytest.mark.asyncio
+async def test_offloaded_transcript_is_decompressed_from_ranged_reads(store, storage):
+    # Arrange
+    text = " ".join(f"word{i}" for i in range(200_000))
+    transcription = _transcription(text)
+    await store.offload(transcription)
+    blob_size = len(storage.blobs[transcription.text_blob_key])
+
+    # Act
+    loaded = await store.load_text(transcription)
+
+    # Assert
+    assert loaded == text
+    assert storage.chunks_served == -(-blob_size // READ_CHUNK_BYTES) > 1
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_reported(store):
+    # Arrange
+    transcription = _transcription("z" * 4096)
+    await store.offload(transcription)
+    transcription.text_blob_key = "transcripts/missing.txt.zst"
+
+    # Act & Assert
+    with pytest.raises(StorageException, match="not found"):
+        await store.load_text(transcription)
+
+
+@pytest.mark.asyncio
+async def test_small_transcript_stays_inline(store, storage):
+    # Arrange
+    transcription = _transcription("short")
+
+    # Act
+    offloaded = await store.offload(transcription)
+
+    # Assert
+    assert not offloaded and transcription.text == "short"
+    assert storage.blobs == {}
+
+
+@pytest.mark.asyncio
+async def test_checksum_mismatch_is_reported(store):
+    # Arrange
+    transcription = _transcription("x" * 4096)
+    await store.offload(transcription)
+    transcription.text_checksum = "0" * 64
+
+    # Act & Assert
+    with pytest.raises(StorageException, match="Checksum mismatch"):
+        await store.load_text(transcription)
+
+
+@pytest.mark.asyncio
+async def test_queries_load_offloaded_text_lazily(store):
+    # Arrange
+    text = "y" * 4096
+    transcription = _transcription(text)
+    await store.offload(transcription)
+    repository = AsyncMock()
+    repository.find_by_id.return_value = transcription
+    queries = TranscriptionQueries(transcription_repository=repository, transcript_store=store)
+
+    # Act
+    without_text = await queries.get_by_id(str(transcription.id))
+    assert without_text.text is None
+    result = await queries.get_by_id(str(transcription.id), with_text=True)
+
+    # Assert
+    assert result.text == text
+    assert result.is_offloaded  # the pointer is kept: the text is not written back inline
+
+
+@pytest.mark.asyncio
+async def test_backfill_offloads_in_batches(store, storage):
+    # Arrange
+    batches = [[_transcription("a" * 2048), _transcription("b" * 2048)], []]
+    session = AsyncMock()
+    session.execute.side_effect = [
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=batch)))) for batch in batches
+    ]
+    session.expunge_all = MagicMock()
+
+    # Act
+    stats = await backfill_offloaded_transcripts(session, store, batch_size=2)
+
+    # Assert
+    assert stats == {"offloaded": 2, "bytes": 4096}
+    assert len(storage.blobs) == 2
+    session.commit.assert_awaited_once()
+    assert all(transcription.is_offloaded for transcription in batches[0])
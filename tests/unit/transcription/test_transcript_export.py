@@ -0,0 +1,82 @@
+# tests/unit/transcription/test_transcript_export.py
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.shared.utils.conditional_requests import http_date, is_not_modified, make_etag
+from src.transcription.application.queries.transcript_export import ExportFormat, iter_export
+from src.transcription.application.queries.transcription_queries import TranscriptionQueries
+from src.transcription.domain.transcription import Transcription
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _transcription() -> Transcription:
+    transcription = Transcription(id=uuid4(), video_id=uuid4(), provider="whisper")
+    transcription.processed_at = datetime(2026, 10, 1, 12, 30, 15, 500)
+    return transcription
+
+
+def _request(headers: dict):
+    request = MagicMock()
+    request.headers = {name.lower(): value for name, value in headers.items()}
+    return request
+
+
+@pytest.mark.asyncio
+async def test_json_export_is_valid_across_chunks():
+    # Arrange
+    transcription = _transcription()
+    chunks = _chunks('He said "hi"\n', "and left \\ ", "— fim")
+
+    # Act
+    document = "".join([part async for part in iter_export(transcription, chunks, ExportFormat.JSON)])
+
+    # Assert
+    parsed = json.loads(document)
+    assert parsed["text"] == 'He said "hi"\nand left \\ — fim'
+    assert parsed["id"] == str(transcription.id) and parsed["provider"] == "whisper"
+
+
+@pytest.mark.asyncio
+async def test_txt_export_passes_chunks_through():
+    # Act
+    parts = [part async for part in iter_export(_transcription(), _chunks("a", "b"), ExportFormat.TXT)]
+
+    # Assert
+    assert parts == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_inline_text_is_streamed_in_chunks():
+    # Arrange
+    repository = AsyncMock()
+    repository.find_text.return_value = "x" * 10
+    queries = TranscriptionQueries(transcription_repository=repository)
+
+    # Act
+    chunks = [chunk async for chunk in queries.iter_text(_transcription(), chunk_chars=4)]
+
+    # Assert
+    assert chunks == ["xxxx", "xxxx", "xx"]
+
+
+def test_conditional_requests():
+    # Arrange
+    processed_at = _transcription().processed_at
+    etag = make_etag("id", "v1", "txt", weak=True)
+
+    # Act & Assert
+    assert is_not_modified(_request({"If-None-Match": etag.removeprefix("W/")}), etag, processed_at)
+    assert not is_not_modified(_request({"If-None-Match": make_etag("id", "v2", "txt")}), etag, processed_at)
+    assert is_not_modified(_request({"If-Modified-Since": http_date(processed_at)}), etag, processed_at)
+    # If-None-Match takes precedence over If-Modified-Since
+    assert not is_not_modified(
+        _request({"If-None-Match": '"other"', "If-Modified-Since": http_date(processed_at)}), etag, processed_at
+    )
@@ -1,10 +1,19 @@
 # tests/unit/transcription/test_transcription_queries.py
+import re
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql
+
 from src.transcription.application.queries.transcription_queries import TranscriptionQueries
-from src.transcription.domain.transcription import Transcription
+from src.transcription.domain.transcription import Transcription, TranscriptionStatus
+from src.transcription.infrastructure.transcription_repository import TranscriptionRepository
+
+
+# The text column itself, not the text_blob_* pointer columns
+TEXT_COLUMN = re.compile(r"transcriptions\.text(?!_)")
 
 
 @pytest.fixture
@@ -27,7 +36,7 @@ async def test_get_by_id(mock_transcription_repository):
 
     # Assert
     assert result == expected_transcription
-    mock_transcription_repository.find_by_id.assert_awaited_once_with(transcription_id)
+    mock_transcription_repository.find_by_id.assert_awaited_once_with(transcription_id, with_text=False)
 
 
 @pytest.mark.asyncio
@@ -45,4 +54,47 @@ async def test_get_by_video_id(mock_transcription_repository):
 
     # Assert
     assert result == expected_transcription
-    mock_transcription_repository.find_by_video_id.assert_awaited_once_with(video_id)
+    mock_transcription_repository.find_by_video_id.assert_awaited_once_with(video_id, with_text=False)
+
+
+@pytest.mark.asyncio
+async def test_status_projection_does_not_select_text():
+    """Status checks read a projection that leaves the transcript text in the database."""
+    # Arrange
+    db = AsyncMock()
+    row = MagicMock()
+    row._mapping = {
+        "id": uuid4(), "video_id": uuid4(), "status": TranscriptionStatus.COMPLETED,
+        "provider": "whisper", "processed_at": None, "error_message": None,
+    }
+    db.execute.return_value = MagicMock(first=MagicMock(return_value=row))
+    repository = TranscriptionRepository(db=db)
+    repository._is_async = lambda: True
+
+    # Act
+    status = await repository.find_status_by_id(uuid4())
+
+    # Assert
+    assert status.status == TranscriptionStatus.COMPLETED
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert not TEXT_COLUMN.search(sql)
+
+
+@pytest.mark.asyncio
+async def test_text_is_only_selected_with_text():
+    # Arrange
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    repository = TranscriptionRepository(db=db)
+    repository._is_async = lambda: True
+
+    # Act
+    await repository.find_by_id(uuid4())
+    await repository.find_by_id(uuid4(), with_text=True)
+
+    # Assert
+    without_text, with_text = (
+        str(call.args[0].compile(dialect=postgresql.dialect())) for call in db.execute.await_args_list
+    )
+    assert not TEXT_COLUMN.search(without_text)
+    assert TEXT_COLUMN.search(with_text)
@@ -0,0 +1,153 @@
+# tests/unit/video_management/test_content_addressed_storage.py
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.storage.application.storage_service import StorageException
+from src.video_management.application import video_service as video_service_module
+from src.video_management.application.commands import upload_video_command_handler
+from src.video_management.application.commands.upload_video_command import UploadVideoCommand
+from src.video_management.application.commands.upload_video_command_handler import UploadVideoCommandHandler
+from src.video_management.application.video_service import VideoService
+from src.video_management.domain.video_blob import blob_path, is_blob_path
+
+CONTENT = b"same video bytes"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+async def _consume(file_path, stream):
+    return sum([len(chunk) async for chunk in stream])
+
+
+@pytest.fixture
+def storage():
+    storage = AsyncMock()
+    storage.upload_stream.side_effect = _consume
+    storage.provider_name = "s3"
+    return storage
+
+
+@pytest.fixture
+def blob_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def handler(storage, blob_repository, monkeypatch):
+    monkeypatch.setattr(upload_video_command_handler, "Video", lambda **fields: SimpleNamespace(**fields))
+    video_repository = AsyncMock()
+    video_repository.save.side_effect = lambda video: video
+    return UploadVideoCommandHandler(
+        storage_service_factory=lambda provider: storage,
+        event_bus=AsyncMock(),
+        video_repository=video_repository,
+        metrics_service=MagicMock(),
+        blob_repository=blob_repository,
+    )
+
+
+def _command() -> UploadVideoCommand:
+    return UploadVideoCommand(user_id="user1", file=CONTENT, filename="Clip.MP4", storage_provider="s3")
+
+
+def test_blob_path_is_keyed_by_content():
+    # Act
+    path = blob_path(SHA256, "Clip.MP4")
+
+    # Assert
+    assert path == f"blobs/sha256/{SHA256[:2]}/{SHA256}.mp4"
+    assert is_blob_path(path) and not is_blob_path("videos/u/1/clip.mp4")
+
+
+@pytest.mark.asyncio
+async def test_first_upload_of_content_moves_it_to_its_blob(handler, storage, blob_repository):
+    # Arrange
+    blob_repository.acquire.return_value = 1
+
+    # Act
+    video = await handler.handle(_command())
+
+    # Assert
+    assert video.file_path == blob_path(SHA256, "Clip.MP4")
+    staging_path = storage.upload_stream.await_args.args[0]
+    blob_repository.acquire.assert_awaited_once_with("s3", video.file_path, SHA256, len(CONTENT))
+    storage.move.assert_awaited_once_with(staging_path, video.file_path)
+    storage.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_content_only_adds_a_reference(handler, storage, blob_repository):
+    # Arrange
+    blob_repository.acquire.return_value = 3
+
+    # Act
+    video = await handler.handle(_command())
+
+    # Assert
+    assert video.file_path == blob_path(SHA256, "Clip.MP4")
+    storage.move.assert_not_awaited()
+    storage.delete.assert_awaited_once_with(storage.upload_stream.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_failed_move_only_cleans_up_the_staged_file(handler, storage, blob_repository):
+    # Arrange
+    blob_repository.acquire.return_value = 1
+    storage.move.side_effect = StorageException("copy failed")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await handler.handle(_command())
+    blob_repository.rollback.assert_awaited_once()
+    storage.delete.assert_awaited_once_with(storage.upload_stream.await_args.args[0])
+
+
+def _service(storage, blob_repository, video):
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = video
+    video_repository.delete.return_value = True
+    return VideoService(
+        upload_video_handler=AsyncMock(),
+        video_repository=video_repository,
+        storage_service_factory=lambda provider: storage,
+        video_queries=AsyncMock(),
+        event_bus=AsyncMock(),
+        blob_repository=blob_repository,
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_keeps_a_blob_other_videos_reference(storage, blob_repository):
+    # Arrange
+    video = SimpleNamespace(id=uuid4(), storage_provider="s3", file_path=blob_path(SHA256, "a.mp4"))
+    blob_repository.release.return_value = 1
+
+    # Act
+    deleted = await _service(storage, blob_repository, video).delete_video(str(video.id))
+
+    # Assert
+    assert deleted
+    blob_repository.purge_unreferenced.assert_not_awaited()
+    storage.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_of_the_last_reference_purges_the_blob(storage, blob_repository):
+    # Arrange
+    video = SimpleNamespace(id=uuid4(), storage_provider="s3", file_path=blob_path(SHA256, "a.mp4"))
+    blob_repository.release.return_value = 0
+
+    async def purge(storage_provider, file_path, delete_file):
+        await delete_file()
+        return True
+
+    blob_repository.purge_unreferenced.side_effect = purge
+
+    # Act
+    await _service(storage, blob_repository, video).delete_video(str(video.id))
+
+    # Assert
+    storage.delete.assert_awaited_once_with(video.file_path)
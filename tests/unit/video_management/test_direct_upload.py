@@ -0,0 +1,228 @@
+# tests/unit/video_management/test_direct_upload.py
+import hashlib
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.shared.events.domain_events import VideoUploaded
+from src.storage.application.upload_stream import UploadTooLargeError
+from src.storage.domain.direct_upload import DirectUpload, PresignedRequest
+from src.storage.domain.file_metadata import FileMetadata
+from src.video_management.application.commands import complete_upload_command_handler
+from src.video_management.application.commands.complete_upload_command import CompleteUploadCommand
+from src.video_management.application.commands.complete_upload_command_handler import CompleteUploadCommandHandler
+from src.video_management.application.commands.create_upload_command import CreateUploadCommand
+from src.video_management.application.commands.create_upload_command_handler import CreateUploadCommandHandler
+from src.video_management.application.commands.upload_content_command import UploadContentCommand
+from src.video_management.application.commands.upload_content_command_handler import UploadContentCommandHandler
+from src.video_management.config.settings import VideoSettings
+from src.video_management.domain.video_upload import UploadStatus, VideoUpload, hash_upload_token
+
+USER_ID = str(uuid4())
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _consume(file_path, stream):
+    return sum([len(chunk) async for chunk in stream])
+
+
+def _upload(size: int = 6, token: str = "secret", **overrides) -> VideoUpload:
+    fields = dict(
+        id=uuid4(), user_id=uuid4(), filename="clip.mp4", file_path="videos/u/1/clip.mp4",
+        storage_provider="local", size=size, status=UploadStatus.PENDING, token_hash=hash_upload_token(token),
+        expires_at=datetime.utcnow() + timedelta(hours=1),
+    )
+    fields.update(overrides)
+    return VideoUpload(**fields)
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock()
+    for method in ("create_direct_upload", "complete_direct_upload", "stat", "delete"):
+        setattr(storage, method, AsyncMock())
+    storage.upload_stream = AsyncMock(side_effect=_consume)
+    return storage
+
+
+@pytest.fixture
+def upload_repository():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_local_upload_gets_a_token(storage, upload_repository):
+    # Arrange
+    storage.create_direct_upload.return_value = None
+    handler = CreateUploadCommandHandler(lambda provider: storage, upload_repository, VideoSettings())
+
+    # Act
+    ticket = await handler.handle(CreateUploadCommand(user_id=USER_ID, filename="../clip.mp4", size=10, storage_provider="local"))
+
+    # Assert
+    assert ticket.direct_upload is None
+    assert ticket.upload.status == UploadStatus.PENDING
+    assert ticket.upload.token_matches(ticket.token)
+    assert ticket.upload.file_path == f"videos/{USER_ID}/{ticket.upload.id}/clip.mp4"
+    upload_repository.save.assert_awaited_once_with(ticket.upload)
+
+
+@pytest.mark.asyncio
+async def test_s3_upload_gets_presigned_parts(storage, upload_repository):
+    # Arrange
+    storage.create_direct_upload.return_value = DirectUpload(
+        requests=[PresignedRequest("PUT", "https://s3/part1", 1), PresignedRequest("PUT", "https://s3/part2", 2)],
+        multipart_upload_id="mp-1",
+        part_size=8,
+    )
+    handler = CreateUploadCommandHandler(lambda provider: storage, upload_repository, VideoSettings())
+
+    # Act
+    ticket = await handler.handle(CreateUploadCommand(user_id=USER_ID, filename="clip.mp4", size=10, storage_provider="s3"))
+
+    # Assert
+    assert ticket.token is None
+    assert ticket.upload.token_hash is None
+    assert ticket.upload.multipart_upload_id == "mp-1"
+
+
+@pytest.mark.asyncio
+async def test_content_requires_the_token(storage, upload_repository):
+    # Arrange
+    upload_repository.find_by_id.return_value = _upload()
+    handler = UploadContentCommandHandler(lambda provider: storage, upload_repository)
+
+    # Act & Assert
+    with pytest.raises(PermissionError):
+        await handler.handle(UploadContentCommand(upload_id=str(uuid4()), token="wrong", file=_chunks(b"abcdef")))
+    storage.upload_stream.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_content_is_held_to_the_declared_size(storage, upload_repository):
+    # Arrange
+    upload_repository.find_by_id.return_value = _upload(size=6)
+    handler = UploadContentCommandHandler(lambda provider: storage, upload_repository)
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await handler.handle(UploadContentCommand(upload_id=str(uuid4()), token="secret", file=_chunks(b"abcd", b"efgh")))
+    with pytest.raises(ValueError):
+        await handler.handle(UploadContentCommand(upload_id=str(uuid4()), token="secret", file=_chunks(b"abc")))
+    storage.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_content_records_checksum(storage, upload_repository):
+    # Arrange
+    upload = _upload(size=6)
+    upload_repository.find_by_id.return_value = upload
+    handler = UploadContentCommandHandler(lambda provider: storage, upload_repository)
+
+    # Act
+    await handler.handle(UploadContentCommand(upload_id=str(upload.id), token="secret", file=_chunks(b"abc", b"def")))
+
+    # Assert
+    assert upload.checksum == hashlib.sha256(b"abcdef").hexdigest()
+    upload_repository.save.assert_awaited_once_with(upload)
+
+
+def _complete_handler(storage, upload_repository, video_repository, event_bus=None, metrics=None):
+    return CompleteUploadCommandHandler(
+        storage_service_factory=lambda provider: storage,
+        upload_repository=upload_repository,
+        video_repository=video_repository,
+        event_bus=event_bus or AsyncMock(),
+        metrics_service=metrics or MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_creates_the_video(storage, upload_repository, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(complete_upload_command_handler, "Video", lambda **fields: SimpleNamespace(**fields))
+    upload = _upload(size=6, storage_provider="s3", multipart_upload_id="mp-1")
+    upload_repository.find_by_id.return_value = upload
+    storage.stat.side_effect = [None, FileMetadata(size=6, last_modified=datetime.now(timezone.utc))]
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = None
+    video_repository.save.side_effect = lambda video: video
+    event_bus = AsyncMock()
+
+    # Act
+    video = await _complete_handler(storage, upload_repository, video_repository, event_bus).handle(
+        CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+    )
+
+    # Assert
+    assert video.id == upload.id and video.file_size == 6
+    assert upload.status == UploadStatus.COMPLETED
+    storage.complete_direct_upload.assert_awaited_once_with(upload.file_path, "mp-1", 6)
+    event_bus.publish.assert_awaited_once_with(VideoUploaded(video_id=str(upload.id), user_id=str(upload.user_id)))
+
+
+@pytest.mark.asyncio
+async def test_complete_retry_skips_an_already_completed_multipart_upload(storage, upload_repository, monkeypatch):
+    # Arrange: an earlier attempt completed the multipart upload, then failed before saving the video
+    monkeypatch.setattr(complete_upload_command_handler, "Video", lambda **fields: SimpleNamespace(**fields))
+    upload = _upload(size=6, storage_provider="s3", multipart_upload_id="mp-1")
+    upload_repository.find_by_id.return_value = upload
+    storage.stat.return_value = FileMetadata(size=6, last_modified=datetime.now(timezone.utc))
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = None
+    video_repository.save.side_effect = lambda video: video
+
+    # Act
+    video = await _complete_handler(storage, upload_repository, video_repository).handle(
+        CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+    )
+
+    # Assert
+    assert video.id == upload.id
+    assert upload.status == UploadStatus.COMPLETED
+    storage.complete_direct_upload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_rejects_size_mismatch(storage, upload_repository):
+    # Arrange
+    upload = _upload(size=6)
+    upload_repository.find_by_id.return_value = upload
+    storage.stat.return_value = FileMetadata(size=5, last_modified=datetime.now(timezone.utc))
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await _complete_handler(storage, upload_repository, video_repository).handle(
+            CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+        )
+    assert upload.status == UploadStatus.ABORTED
+    storage.delete.assert_awaited_once_with(upload.file_path)
+    video_repository.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_is_idempotent(storage, upload_repository):
+    # Arrange
+    upload = _upload(status=UploadStatus.COMPLETED)
+    existing_video = SimpleNamespace(id=upload.id)
+    upload_repository.find_by_id.return_value = upload
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = existing_video
+
+    # Act
+    video = await _complete_handler(storage, upload_repository, video_repository).handle(
+        CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+    )
+
+    # Assert
+    assert video is existing_video
+    storage.stat.assert_not_awaited()
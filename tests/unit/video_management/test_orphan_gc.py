@@ -0,0 +1,135 @@
+# tests/unit/video_management/test_orphan_gc.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.storage.application.storage_service import StorageException
+from src.storage.domain.file_metadata import StoredFile
+from src.video_management.tasks.orphan_gc import collect_orphaned_files
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+OLD = NOW - timedelta(days=2)
+
+BLOB = "blobs/sha256/ab/" + "ab" * 32 + ".mp4"
+
+
+def _storage(listing: dict) -> MagicMock:
+    storage = MagicMock()
+    storage.provider_name = "s3"
+
+    async def list_files(prefix, page_size):
+        for page in listing.get(prefix, []):
+            yield page
+
+    storage.list_files = list_files
+    storage.delete_many = AsyncMock(side_effect=lambda paths: len(paths))
+    return storage
+
+
+def _session(*referenced: set) -> MagicMock:
+    session = MagicMock()
+    session.rollback = AsyncMock()
+    session.execute = AsyncMock(side_effect=[
+        MagicMock(scalars=MagicMock(return_value=paths)) for paths in referenced
+    ])
+    return session
+
+
+def _blob_repository() -> MagicMock:
+    blob_repository = MagicMock()
+
+    async def purge_orphans(provider, files, delete_files):
+        return await delete_files(sorted(files))
+
+    blob_repository.purge_orphans = AsyncMock(side_effect=purge_orphans)
+    return blob_repository
+
+
+@pytest.mark.asyncio
+async def test_unreferenced_files_are_deleted_in_one_batch():
+    # Arrange
+    storage = _storage({"videos/": [[
+        StoredFile("videos/u/1/clip.mp4", 10, OLD),
+        StoredFile("videos/u/2/clip.mp4", 20, OLD),
+        StoredFile("videos/u/3/clip.mp4", 30, OLD),
+    ]]})
+    session = _session({"videos/u/2/clip.mp4"})
+
+    # Act
+    stats = await collect_orphaned_files(session, storage, _blob_repository(), prefixes=["videos/"], now=NOW)
+
+    # Assert
+    assert stats == {"scanned": 3, "orphaned": 2, "orphaned_bytes": 40, "deleted": 2, "failed": 0}
+    storage.delete_many.assert_awaited_once_with(["videos/u/1/clip.mp4", "videos/u/3/clip.mp4"])
+    session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_recent_files_and_partial_files_of_pending_uploads_are_kept():
+    # Arrange
+    storage = _storage({"videos/": [[
+        StoredFile("videos/u/1/clip.mp4", 10, NOW - timedelta(minutes=5)),
+        StoredFile("videos/u/2/clip.mp4.part", 10, OLD),
+    ]]})
+    session = _session({"videos/u/2/clip.mp4"})
+
+    # Act
+    stats = await collect_orphaned_files(session, storage, _blob_repository(), prefixes=["videos/"], now=NOW)
+
+    # Assert
+    assert stats["orphaned"] == 0
+    storage.delete_many.assert_not_awaited()
+    referenced_query = session.execute.await_args.args[0]
+    assert "videos/u/1/clip.mp4" not in str(referenced_query.compile(compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_orphaned_blobs_are_purged_through_the_blob_repository():
+    # Arrange
+    storage = _storage({"blobs/": [[StoredFile(BLOB, 50, OLD)]]})
+    session = _session(set())
+    blob_repository = _blob_repository()
+
+    # Act
+    stats = await collect_orphaned_files(session, storage, blob_repository, prefixes=["blobs/"], now=NOW)
+
+    # Assert
+    assert stats["deleted"] == 1
+    blob_repository.purge_orphans.assert_awaited_once_with("s3", {BLOB: 50}, storage.delete_many)
+    session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_only_counts():
+    # Arrange
+    storage = _storage({"videos/": [[StoredFile("videos/u/1/clip.mp4", 10, OLD)], [StoredFile("videos/u/2/clip.mp4", 5, OLD)]]})
+
+    # Act
+    stats = await collect_orphaned_files(
+        _session(set(), set()), storage, _blob_repository(), prefixes=["videos/"], dry_run=True, now=NOW
+    )
+
+    # Assert
+    assert stats == {"scanned": 2, "orphaned": 2, "orphaned_bytes": 15, "deleted": 0, "failed": 0}
+    storage.delete_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_counted_and_the_scan_goes_on():
+    # Arrange
+    storage = _storage({"videos/": [[StoredFile("videos/u/1/clip.mp4", 10, OLD)], [StoredFile("videos/u/2/clip.mp4", 5, OLD)]]})
+    storage.delete_many.side_effect = [StorageException("S3 is down"), 1]
+
+    # Act
+    stats = await collect_orphaned_files(_session(set(), set()), storage, _blob_repository(), prefixes=["videos/"], now=NOW)
+
+    # Assert
+    assert (stats["deleted"], stats["failed"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prefixes_outside_the_video_layouts_are_refused():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await collect_orphaned_files(_session(), _storage({}), _blob_repository(), prefixes=["transcripts/"], now=NOW)
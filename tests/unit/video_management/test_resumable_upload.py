@@ -0,0 +1,222 @@
+# tests/unit/video_management/test_resumable_upload.py
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.storage.application.upload_stream import IncompleteUploadError, UploadTooLargeError
+from src.storage.domain.direct_upload import ChunkedUpload
+from src.storage.domain.file_metadata import FileMetadata
+from src.video_management.application.commands import complete_upload_command_handler
+from src.video_management.application.commands.complete_upload_command import CompleteUploadCommand
+from src.video_management.application.commands.complete_upload_command_handler import CompleteUploadCommandHandler
+from src.video_management.application.commands.create_upload_command import CreateUploadCommand
+from src.video_management.application.commands.create_upload_command_handler import CreateUploadCommandHandler
+from src.video_management.application.commands.upload_chunk_command import UploadChunkCommand
+from src.video_management.application.commands.upload_chunk_command_handler import UploadChunkCommandHandler
+from src.video_management.config.settings import VideoSettings
+from src.video_management.domain.video_upload import (
+    InvalidChunkError, UploadOffsetMismatchError, UploadStatus, VideoUpload,
+)
+from src.video_management.tasks.upload_gc import collect_expired_uploads
+
+USER_ID = str(uuid4())
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _upload(size: int = 10, chunk_size: int = 4, received_bytes: int = 0, **overrides) -> VideoUpload:
+    fields = dict(
+        id=uuid4(), user_id=uuid4(), filename="clip.mp4", file_path="videos/u/1/clip.mp4",
+        storage_provider="s3", size=size, status=UploadStatus.PENDING, multipart_upload_id="mp-1",
+        chunk_size=chunk_size, received_bytes=received_bytes, expires_at=datetime.utcnow() + timedelta(hours=1),
+    )
+    fields.update(overrides)
+    return VideoUpload(**fields)
+
+
+def _advance(upload, offset, received_bytes, expires_at):
+    upload.received_bytes = received_bytes
+    upload.expires_at = expires_at
+    return True
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock()
+    for method in ("start_chunked_upload", "upload_chunk", "complete_chunked_upload", "stat", "delete",
+                   "abort_chunked_upload", "abort_direct_upload"):
+        setattr(storage, method, AsyncMock())
+    return storage
+
+
+@pytest.fixture
+def upload_repository():
+    upload_repository = AsyncMock()
+    upload_repository.advance_offset.side_effect = _advance
+    return upload_repository
+
+
+def _chunk_handler(storage, upload_repository):
+    return UploadChunkCommandHandler(lambda provider: storage, upload_repository, VideoSettings())
+
+
+def _chunk(upload: VideoUpload, offset: int, *pieces: bytes) -> UploadChunkCommand:
+    return UploadChunkCommand(upload_id=str(upload.id), user_id=str(upload.user_id), offset=offset, chunk=_chunks(*pieces))
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_starts_a_chunked_upload(storage, upload_repository):
+    # Arrange
+    storage.start_chunked_upload.return_value = ChunkedUpload(chunk_size=4, multipart_upload_id="mp-1")
+    handler = CreateUploadCommandHandler(lambda provider: storage, upload_repository, VideoSettings())
+
+    # Act
+    ticket = await handler.handle(CreateUploadCommand(
+        user_id=USER_ID, filename="clip.mp4", size=10, storage_provider="s3", resumable=True
+    ))
+
+    # Assert
+    assert ticket.token is None and ticket.direct_upload is None
+    assert ticket.upload.chunked_upload == ChunkedUpload(chunk_size=4, multipart_upload_id="mp-1")
+    assert ticket.upload.received_bytes == 0
+    storage.start_chunked_upload.assert_awaited_once_with(ticket.upload.file_path, 10)
+
+
+@pytest.mark.asyncio
+async def test_chunk_is_stored_and_advances_the_offset(storage, upload_repository):
+    # Arrange
+    upload = _upload(received_bytes=4)
+    upload_repository.find_by_id.return_value = upload
+
+    # Act
+    result = await _chunk_handler(storage, upload_repository).handle(_chunk(upload, 4, b"ef", b"gh"))
+
+    # Assert
+    assert result.received_bytes == 8
+    storage.upload_chunk.assert_awaited_once_with(upload.file_path, upload.chunked_upload, 4, b"efgh")
+    upload_repository.advance_offset.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_chunk_at_another_offset_reports_where_to_resume(storage, upload_repository):
+    # Arrange
+    upload = _upload(received_bytes=8)
+    upload_repository.find_by_id.return_value = upload
+
+    # Act & Assert
+    with pytest.raises(UploadOffsetMismatchError) as error:
+        await _chunk_handler(storage, upload_repository).handle(_chunk(upload, 4, b"efgh"))
+    assert error.value.offset == 8
+    storage.upload_chunk.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_chunk_must_have_its_expected_length(storage, upload_repository):
+    # Arrange
+    upload = _upload(received_bytes=8)
+    upload_repository.find_by_id.return_value = upload
+    handler = _chunk_handler(storage, upload_repository)
+
+    # Act & Assert
+    with pytest.raises(InvalidChunkError):
+        await handler.handle(_chunk(upload, 8, b"i"))
+    with pytest.raises(UploadTooLargeError):
+        await handler.handle(_chunk(upload, 8, b"ijk"))
+    storage.upload_chunk.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_chunk_stored_concurrently_is_reported_as_a_mismatch(storage, upload_repository):
+    # Arrange
+    upload = _upload(received_bytes=0)
+    upload_repository.find_by_id.return_value = upload
+
+    def lost_race(upload, offset, received_bytes, expires_at):
+        upload.received_bytes = received_bytes
+        return False
+
+    upload_repository.advance_offset.side_effect = lost_race
+
+    # Act & Assert
+    with pytest.raises(UploadOffsetMismatchError) as error:
+        await _chunk_handler(storage, upload_repository).handle(_chunk(upload, 0, b"abcd"))
+    assert error.value.offset == 4
+
+
+def _complete_handler(storage, upload_repository, video_repository):
+    return CompleteUploadCommandHandler(
+        storage_service_factory=lambda provider: storage,
+        upload_repository=upload_repository,
+        video_repository=video_repository,
+        event_bus=AsyncMock(),
+        metrics_service=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_requires_every_chunk(storage, upload_repository):
+    # Arrange
+    upload = _upload(received_bytes=8)
+    upload_repository.find_by_id.return_value = upload
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(IncompleteUploadError):
+        await _complete_handler(storage, upload_repository, video_repository).handle(
+            CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+        )
+    storage.complete_chunked_upload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_assembles_the_chunks(storage, upload_repository, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(complete_upload_command_handler, "Video", lambda **fields: SimpleNamespace(**fields))
+    upload = _upload(received_bytes=10)
+    upload_repository.find_by_id.return_value = upload
+    storage.stat.side_effect = [None, FileMetadata(size=10, last_modified=datetime.now(timezone.utc))]
+    video_repository = AsyncMock()
+    video_repository.find_by_id.return_value = None
+    video_repository.save.side_effect = lambda video: video
+
+    # Act
+    video = await _complete_handler(storage, upload_repository, video_repository).handle(
+        CompleteUploadCommand(upload_id=str(upload.id), user_id=str(upload.user_id))
+    )
+
+    # Assert
+    assert video.file_size == 10
+    assert upload.status == UploadStatus.COMPLETED
+    storage.complete_chunked_upload.assert_awaited_once_with(upload.file_path, upload.chunked_upload, 10)
+    storage.complete_direct_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gc_aborts_expired_uploads(storage):
+    # Arrange
+    expired = _upload(expires_at=datetime.utcnow() - timedelta(hours=1))
+    finished = _upload(expires_at=datetime.utcnow() - timedelta(hours=1))
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.execute = AsyncMock(side_effect=[
+        MagicMock(all=MagicMock(return_value=[(expired, None), (finished, finished.id)])),
+        MagicMock(all=MagicMock(return_value=[])),
+    ])
+
+    # Act
+    stats = await collect_expired_uploads(session, lambda provider: storage)
+
+    # Assert
+    assert stats == {"aborted": 1, "completed": 1, "failed": 0}
+    assert expired.status == UploadStatus.ABORTED
+    assert finished.status == UploadStatus.COMPLETED
+    storage.abort_chunked_upload.assert_awaited_once_with(expired.file_path, expired.chunked_upload)
+    storage.delete.assert_awaited_once_with(expired.file_path)
+    session.commit.assert_awaited_once()
@@ -58,7 +58,7 @@ async def test_upload_video_handler_success(
     # Assert
     # 1. Ensure the correct storage provider was created and used
     mock_storage_factory.assert_called_once_with("local")
-    mock_storage_service.upload.assert_awaited_once()
+    mock_storage_service.upload_stream.assert_awaited_once()
 
     # 2. Ensure the video entity was saved correctly
     mock_video_repository.save.assert_awaited_once()
@@ -0,0 +1,118 @@
+# tests/unit/video_management/test_video_content.py
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.shared.utils.conditional_requests import RangeNotSatisfiable, http_date, if_range_matches, parse_byte_range
+from src.storage.domain.file_metadata import FileMetadata
+from src.storage.infrastructure.local_storage_service import LocalStorageService
+from src.storage.infrastructure.s3_storage_service import S3StorageService
+from src.video_management.application.video_service import VideoService
+
+LAST_MODIFIED = datetime(2026, 10, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _request(headers: dict):
+    request = MagicMock()
+    request.headers = {name.lower(): value for name, value in headers.items()}
+    return request
+
+
+def _video_service(storage) -> VideoService:
+    return VideoService(
+        upload_video_handler=MagicMock(),
+        video_repository=MagicMock(),
+        storage_service_factory=lambda provider: storage,
+        video_queries=MagicMock(),
+        event_bus=MagicMock(),
+    )
+
+
+def test_parse_byte_range():
+    # Act & Assert
+    assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_byte_range("bytes=900-", 1000) == (900, 999)
+    assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+    assert parse_byte_range("bytes=500-5000", 1000) == (500, 999)
+    # Absent, malformed and multi-range headers fall back to the whole file
+    assert parse_byte_range(None, 1000) is None
+    assert parse_byte_range("items=0-1", 1000) is None
+    assert parse_byte_range("bytes=9-2", 1000) is None
+    assert parse_byte_range("bytes=0-1,5-6", 1000) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range("bytes=1000-", 1000)
+
+
+def test_if_range_uses_strong_comparison():
+    # Act & Assert
+    assert if_range_matches(_request({}), '"abc"', LAST_MODIFIED)
+    assert if_range_matches(_request({"If-Range": '"abc"'}), '"abc"', LAST_MODIFIED)
+    assert not if_range_matches(_request({"If-Range": '"old"'}), '"abc"', LAST_MODIFIED)
+    assert not if_range_matches(_request({"If-Range": 'W/"abc"'}), 'W/"abc"', LAST_MODIFIED)
+    assert if_range_matches(_request({"If-Range": http_date(LAST_MODIFIED)}), '"abc"', LAST_MODIFIED)
+
+
+@pytest.mark.asyncio
+async def test_get_video_content_guesses_media_type():
+    # Arrange
+    storage = MagicMock()
+    storage.stat = AsyncMock(return_value=FileMetadata(size=10, last_modified=LAST_MODIFIED))
+    video = SimpleNamespace(id=uuid4(), storage_provider="local", file_path="videos/u/clip.mp4")
+
+    # Act
+    content = await _video_service(storage).get_video_content(video)
+
+    # Assert
+    assert content.media_type == "video/mp4"
+    assert content.metadata.size == 10
+    storage.stat.assert_awaited_once_with("videos/u/clip.mp4")
+
+
+@pytest.mark.asyncio
+async def test_get_video_content_missing_file():
+    # Arrange
+    storage = MagicMock()
+    storage.stat = AsyncMock(return_value=None)
+    video = SimpleNamespace(id=uuid4(), storage_provider="s3", file_path="videos/u/gone.mp4")
+
+    # Act & Assert
+    assert await _video_service(storage).get_video_content(video) is None
+
+
+@pytest.mark.asyncio
+async def test_local_range_reads_only_the_range(tmp_path):
+    # Arrange
+    storage = LocalStorageService.__new__(LocalStorageService)
+    storage.root = tmp_path
+    (tmp_path / "clip.mp4").write_bytes(bytes(range(100)))
+
+    # Act
+    chunks = [chunk async for chunk in storage.iter_range("clip.mp4", 10, 29, chunk_size=8)]
+    metadata = await storage.stat("clip.mp4")
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+    assert b"".join(chunks) == bytes(range(10, 30))
+    assert metadata.size == 100
+    assert storage.local_path("clip.mp4") == tmp_path / "clip.mp4"
+    assert await storage.stat("missing.mp4") is None
+
+
+@pytest.mark.asyncio
+async def test_s3_range_uses_ranged_get_object():
+    # Arrange
+    storage = S3StorageService.__new__(S3StorageService)
+    storage.settings = SimpleNamespace(bucket_name="videos")
+    storage.client = MagicMock()
+    storage.client.get_object.return_value = {"Body": io.BytesIO(b"x" * 20)}
+
+    # Act
+    chunks = [chunk async for chunk in storage.iter_range("clip.mp4", 100, 119, chunk_size=8)]
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+    storage.client.get_object.assert_called_once_with(Bucket="videos", Key="clip.mp4", Range="bytes=100-119")